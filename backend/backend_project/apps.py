@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class BackendProjectConfig(AppConfig):
+    name = 'backend_project'
+
+    def ready(self):
+        from django.core import checks
+        from .table_versions import check_shared_cache, connect_signals
+        connect_signals()
+        checks.register(check_shared_cache)
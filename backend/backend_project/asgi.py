@@ -3,6 +3,12 @@ ASGI config for backend_project project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The streaming chatbot endpoints (``chatbot/module-chat/stream/`` and
+``chatbot/generate-response/stream/``) are async views; serve the project with an
+ASGI server (``uvicorn backend_project.asgi:application``, as the Dockerfile does).
+Under WSGI (``runserver``, gunicorn) Django consumes an async stream completely
+before sending it, so no token reaches the client until the reply is finished.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
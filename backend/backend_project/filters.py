@@ -0,0 +1,119 @@
+from datetime import datetime, time
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.serializers import BaseSerializer, SerializerMethodField
+
+from .serializers import SparseFieldsetsMixin, wants_projection
+
+LOOKUPS = ('exact', 'in', 'gt', 'gte', 'lt', 'lte')
+
+
+class DeclarativeFilterBackend(BaseFilterBackend):
+    """
+    Query-string filtering and ordering declared on the viewset.
+
+    ``filter_fields`` maps model fields to the lookups clients may use, for example
+    ``{'context': ['exact'], 'date': ['gte', 'lte']}``, which accepts
+    ``?context=local&date__gte=2026-01-01``. ``in`` takes a comma-separated list.
+    ``ordering_fields`` lists the fields ``?ordering=`` may name (``-`` for descending);
+    otherwise lists keep the view's ``cursor_ordering``. A requested ordering is followed
+    by the primary key in the same direction, so rows with equal values keep a stable
+    order from page to page.
+
+    Only declare filters and orderings that a model index leads with (and ends with the
+    primary key), so that no list request falls back to a full table scan or a sort.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filters = {}
+        for field_name, lookups in getattr(view, 'filter_fields', {}).items():
+            field = self._model_field(queryset.model, field_name)
+            for lookup in lookups:
+                param = field_name if lookup == 'exact' else f'{field_name}__{lookup}'
+                raw = request.query_params.get(param)
+                if raw in (None, ''):
+                    continue
+                if lookup == 'in':
+                    value = [self._parse(field, param, part, lookup) for part in raw.split(',') if part]
+                else:
+                    value = self._parse(field, param, raw, lookup)
+                filters[f'{field_name}__{lookup}'] = value
+        if filters:
+            queryset = queryset.filter(**filters)
+        ordering = self.get_ordering(request, queryset, view)
+        return queryset.order_by(*ordering) if ordering else queryset
+
+    def get_ordering(self, request, queryset, view):
+        """Requested ``?ordering=`` when allowed, else the view's cursor ordering (also used by the paginator)."""
+        requested = request.query_params.get('ordering', '').strip()
+        if requested:
+            allowed = getattr(view, 'ordering_fields', ())
+            if requested.lstrip('-') not in allowed:
+                raise ValidationError({'ordering': [f"Must be one of: {', '.join(allowed) or 'none'} (prefix - for descending)"]})
+            return (requested, '-pk' if requested.startswith('-') else 'pk')
+        ordering = getattr(view, 'cursor_ordering', None) or '-pk'
+        return (ordering,) if isinstance(ordering, str) else tuple(ordering)
+
+    def _model_field(self, model, field_name):
+        try:
+            return model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            raise ValueError(f"{model.__name__}.{field_name} in filter_fields does not exist")
+
+    def _parse(self, field, param, raw, lookup):
+        try:
+            value = field.to_python(raw)
+        except DjangoValidationError as e:
+            raise ValidationError({param: e.messages})
+        if isinstance(field, models.DateTimeField) and isinstance(value, datetime):
+            if len(raw) == 10 and lookup == 'lte':
+                value = datetime.combine(value.date(), time.max)  # A bare date includes that whole day
+            if timezone.is_naive(value):
+                value = timezone.make_aware(value)
+        return value
+
+
+class FieldProjectionBackend(BaseFilterBackend):
+    """
+    Loads only the columns a ``?fields=`` / ``?exclude=`` response will serialize.
+
+    The projected serializer fields are mapped to model columns and the queryset is
+    narrowed with ``.only()`` (plus the primary key and the ordering columns the cursor
+    paginator reads). When a selected field cannot be mapped to a plain column of the
+    model (method fields, nested serializers, relation traversals, properties) the
+    queryset is left alone, since deferring would turn each row into extra queries.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not wants_projection(request) or not hasattr(view, 'get_serializer'):
+            return queryset
+        serializer = view.get_serializer()
+        if not isinstance(serializer, SparseFieldsetsMixin):
+            return queryset
+        columns = self._columns(queryset.model, serializer.fields.values())
+        if columns is None:
+            return queryset
+        for name in queryset.query.order_by:
+            if isinstance(name, str) and LOOKUP_SEP not in name:
+                columns.add(name.lstrip('-'))
+        columns.discard('pk')
+        return queryset.only(queryset.model._meta.pk.name, *columns)
+
+    def _columns(self, model, fields):
+        columns = set()
+        for field in fields:
+            if isinstance(field, (SerializerMethodField, BaseSerializer)) or len(field.source_attrs) != 1:
+                return None
+            try:
+                model_field = model._meta.get_field(field.source_attrs[0])
+            except FieldDoesNotExist:
+                return None
+            if not model_field.concrete or model_field.many_to_many:
+                return None
+            columns.add(model_field.name)
+        return columns
@@ -0,0 +1,59 @@
+import hashlib
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from .table_versions import table_versions, versions_shared, view_models
+
+
+class TableVersionETagMiddleware:
+    """
+    Conditional GET for the API from table version counters (see table_versions).
+
+    Before the view runs, the versions of the tables behind it are combined with the
+    request (path and query, Accept, credentials) into an ETag and a Last-Modified
+    date. A matching If-None-Match gets a 304 without touching the view, the database
+    or the serializer; other responses carry the validators. If-Modified-Since is not
+    honoured: Last-Modified has one-second resolution, so a second write within the
+    same second would be answered with a stale 304.
+
+    Off unless table versions live in a shared cache (see versions_shared): with a
+    per-process cache another worker's writes would not change the ETag.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'TABLE_VERSIONS', {}).get('ENABLED', True) and versions_shared()
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        validators = getattr(request, '_table_validators', None)
+        if validators and response.status_code in (200, 304) and not response.has_header('ETag'):
+            etag, last_modified = validators
+            response.headers['ETag'] = etag
+            response.headers['Last-Modified'] = http_date(last_modified)
+            # Revalidate on every poll instead of trusting a heuristic freshness lifetime
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not self.enabled or request.method not in ('GET', 'HEAD'):
+            return None
+        # DRF's as_view() exposes the view class; plain Django views are not handled
+        models = view_models(getattr(view_func, 'cls', None))
+        if not models:
+            return None
+        versions = table_versions(models)
+        user = getattr(request, 'user', None)
+        variant = '|'.join([
+            *map(str, versions),
+            request.get_full_path(),
+            request.META.get('HTTP_ACCEPT', ''),
+            request.META.get('HTTP_AUTHORIZATION', ''),
+            str(user.pk) if user is not None and user.is_authenticated else '',
+        ])
+        etag = quote_etag(hashlib.sha1(variant.encode('utf-8')).hexdigest())
+        last_modified = -(-max(versions) // 10**9)  # Round up to whole seconds
+        request._table_validators = (etag, last_modified)
+        return get_conditional_response(request, etag=etag)
@@ -0,0 +1,28 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class DefaultCursorPagination(CursorPagination):
+    """
+    Keyset pagination for every ModelViewSet (``?cursor=``, ``?page_size=``).
+
+    Pages are ordered by ``?ordering=`` (when the view allows it) or the view's
+    ``cursor_ordering`` (``-pk`` unless set), and each page is a range scan on the index
+    behind that ordering, so fetching page 1000 costs the same as page 1. Orderings end
+    with the primary key, e.g. ``('-date', '-pk')``, so ties have a fixed order and the
+    cursor's offset into them stays valid; viewsets that set either declare a matching
+    composite index on their model.
+    """
+    ordering = '-pk'
+    page_size_query_param = 'page_size'
+    max_page_size = getattr(settings, 'API_MAX_PAGE_SIZE', 500)
+
+    def get_ordering(self, request, queryset, view):
+        # A filter backend that understands ?ordering= (see backend_project.filters) decides
+        for backend in getattr(view, 'filter_backends', ()):
+            if hasattr(backend, 'get_ordering'):
+                ordering = backend().get_ordering(request, queryset, view)
+                if ordering:
+                    return tuple(ordering)
+        ordering = getattr(view, 'cursor_ordering', None) or self.ordering
+        return (ordering,) if isinstance(ordering, str) else tuple(ordering)
@@ -0,0 +1,153 @@
+import hashlib
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+
+from .table_versions import is_shared_cache, table_versions, versions_shared, view_models
+
+
+class ViewResponseCache:
+    """
+    Cache of serialized viewset responses, keyed on the view, URL and table versions.
+
+    The versions of the tables behind the view (see table_versions) are part of the
+    key, so a save or delete on any of them makes every cached page of that view
+    unreachable at once; stale entries just age out. On a miss only one caller per key
+    builds the response (a short lease taken with ``cache.add``); concurrent callers
+    wait up to ``wait_timeout`` for it instead of all hitting the database.
+
+    Entries and table versions must live in shared caches (such as Redis): a write
+    handled by one worker only bumps the versions other workers see if they share the
+    store, so with local-memory caches the response cache stays off (see ``active``).
+    Hit/miss counters are kept per process and per view.
+    """
+
+    key_prefix = 'view-response'
+
+    def __init__(self, alias='default', timeout=300, lock_timeout=10, wait_timeout=2.0, poll_interval=0.02,
+                 enabled=True):
+        self.alias = alias
+        self.timeout = timeout
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters = defaultdict(lambda: {'hits': 0, 'misses': 0, 'stores': 0, 'coalesced': 0, 'wait_timeouts': 0})
+
+    @classmethod
+    def from_settings(cls):
+        config = getattr(settings, 'RESPONSE_CACHE', {})
+        return cls(
+            alias=config.get('ALIAS', 'default'),
+            timeout=config.get('TIMEOUT', 300),
+            lock_timeout=config.get('LOCK_TIMEOUT', 10),
+            wait_timeout=config.get('WAIT_TIMEOUT', 2.0),
+            enabled=config.get('ENABLED', True),
+        )
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    @property
+    def active(self) -> bool:
+        """Enabled, and both the entries and the table versions are shared between processes."""
+        return self.enabled and is_shared_cache(self.alias) and versions_shared()
+
+    def make_key(self, view_name, versions, url) -> str:
+        payload = '|'.join([view_name, *map(str, versions), url])
+        return f"{self.key_prefix}:{view_name}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def get_or_compute(self, view_name, key, compute):
+        """
+        Cached value for ``key``, or ``compute()`` stored under it.
+
+        ``compute`` returns None for results that must not be cached (errors).
+        """
+        backend = self.backend
+        value = backend.get(key)
+        if value is not None:
+            self._count(view_name, 'hits')
+            return value
+        self._count(view_name, 'misses')
+        lease_key, token = f'{key}:lease', uuid.uuid4().hex
+        if backend.add(lease_key, token, self.lock_timeout):
+            try:
+                return self._store(view_name, key, compute())
+            finally:
+                if backend.get(lease_key) == token:
+                    backend.delete(lease_key)
+        # Another caller is building this response; reuse it rather than repeating the work
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            value = backend.get(key)
+            if value is not None:
+                self._count(view_name, 'coalesced')
+                return value
+        self._count(view_name, 'wait_timeouts')
+        return self._store(view_name, key, compute())
+
+    def stats(self):
+        with self._lock:
+            views = {name: self._summary(counters) for name, counters in sorted(self._counters.items())}
+        totals = {name: sum(view[name] for view in views.values())
+                  for name in ('hits', 'misses', 'stores', 'coalesced', 'wait_timeouts')}
+        return {'enabled': self.active, 'backend': self.alias, **self._summary(totals), 'views': views}
+
+    @staticmethod
+    def _summary(counters):
+        lookups = counters['hits'] + counters['misses']
+        return {**counters, 'hit_ratio': round(counters['hits'] / lookups, 4) if lookups else 0.0}
+
+    def _store(self, view_name, key, value):
+        if value is not None:
+            self.backend.set(key, value, self.timeout)
+            self._count(view_name, 'stores')
+        return value
+
+    def _count(self, view_name, counter):
+        with self._lock:
+            self._counters[view_name][counter] += 1
+
+
+response_cache = ViewResponseCache.from_settings()
+
+
+class CachedResponseMixin:
+    """
+    Serve ``list`` and ``retrieve`` from the response cache (see ViewResponseCache).
+
+    For read-mostly reference data that does not vary by user. Responses depend on the
+    tables of the viewset's ``etag_models`` (default: its queryset's model), so
+    serializers that read other tables must list them there.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        if not response_cache.active:
+            return handler(request, *args, **kwargs)
+        view_name = type(self).__name__
+        # Versions are read before the data so a concurrent write can only make the entry newer
+        versions = table_versions(view_models(type(self)))
+        key = response_cache.make_key(view_name, versions, request.build_absolute_uri())
+        built = []
+
+        def compute():
+            response = handler(request, *args, **kwargs)
+            built.append(response)
+            return response.data if response.status_code == 200 else None
+
+        data = response_cache.get_or_compute(view_name, key, compute)
+        return built[0] if built else Response(data)
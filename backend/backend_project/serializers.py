@@ -0,0 +1,58 @@
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+
+def _names(raw):
+    return [name.strip() for name in (raw or '').split(',') if name.strip()]
+
+
+def wants_projection(request):
+    """True for read requests that pass ``?fields=`` or ``?exclude=``."""
+    if request is None or request.method not in SAFE_METHODS:
+        return False
+    return bool(request.query_params.get('fields') or request.query_params.get('exclude'))
+
+
+def requested_fields(request, available):
+    """
+    Names from ``available`` kept by ``?fields=a,b`` / ``?exclude=c``, in declaration order.
+
+    Returns None when the request asks for no projection; unknown names are a 400.
+    """
+    if not wants_projection(request):
+        return None
+    include = _names(request.query_params.get('fields'))
+    exclude = _names(request.query_params.get('exclude'))
+    for param, names in (('fields', include), ('exclude', exclude)):
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise ValidationError({param: [f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(available)}"]})
+    return [name for name in available if (not include or name in include) and name not in exclude]
+
+
+class SparseFieldsetsMixin:
+    """
+    Lets read requests pick the fields they need with ``?fields=`` / ``?exclude=``.
+
+    Only the top-level serializer of a response is projected; nested serializers keep
+    their fields. Writes always use the full field set.
+    ``backend_project.filters.FieldProjectionBackend`` narrows the SQL to match.
+    """
+
+    def _is_response_root(self):
+        parent = self.parent
+        return parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self._is_response_root():
+            return fields
+        selected = requested_fields(self.context.get('request'), fields)
+        if selected is None:
+            return fields
+        return {name: fields[name] for name in selected}
+
+
+class SparseModelSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
+    """Base ModelSerializer for the API; supports sparse fieldsets (see SparseFieldsetsMixin)."""
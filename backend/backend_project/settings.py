@@ -54,6 +54,7 @@ INSTALLED_APPS = [
     'market_analysis',
     'policy',
     'inventory_supply_chain',
+    'backend_project',
 ]
 
 MIDDLEWARE = [
@@ -66,6 +67,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'backend_project.middleware.TableVersionETagMiddleware',
 ]
 
 ROOT_URLCONF = 'backend_project.urls'
@@ -99,6 +101,179 @@ DATABASES = {
 }
 
 
+# Every ModelViewSet list is keyset-paginated (see backend_project/pagination.py) and
+# filtered/ordered by the fields it declares (see backend_project/filters.py); reads accept
+# ?fields= / ?exclude= projections (see backend_project/serializers.py)
+REST_FRAMEWORK = {
+    'DEFAULT_PAGINATION_CLASS': 'backend_project.pagination.DefaultCursorPagination',
+    'DEFAULT_FILTER_BACKENDS': [
+        'backend_project.filters.DeclarativeFilterBackend',
+        'backend_project.filters.FieldProjectionBackend',
+    ],
+    'PAGE_SIZE': int(os.getenv('API_PAGE_SIZE', '50')),
+}
+API_MAX_PAGE_SIZE = int(os.getenv('API_MAX_PAGE_SIZE', '500'))
+
+
+# LLM backend for the chatbot, agent and news summarizer (see chatbot/llm.py).
+# 'stub' is an offline deterministic backend for benchmarks and CI.
+CHATBOT_LLM = {
+    'PROVIDER': os.getenv('CHATBOT_LLM_PROVIDER', 'gemini'),
+    'MODEL': os.getenv('CHATBOT_LLM_MODEL', 'gemini-pro'),
+    'STUB': {
+        'latency': float(os.getenv('LLM_STUB_LATENCY', '0.05')),
+        'tokens_per_second': float(os.getenv('LLM_STUB_TOKENS_PER_SECOND', '200')),
+        'failure_rate': float(os.getenv('LLM_STUB_FAILURE_RATE', '0')),
+    },
+}
+
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Set REDIS_URL to share cached entries between workers; otherwise each process
+# keeps its own LRU local-memory cache.
+
+REDIS_URL = os.getenv('REDIS_URL')
+
+
+def _cache_backend(location, timeout, max_entries):
+    if REDIS_URL:
+        return {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': location,
+            'TIMEOUT': timeout,
+        }
+    return {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': location,
+        'TIMEOUT': timeout,
+        'OPTIONS': {'MAX_ENTRIES': max_entries},
+    }
+
+
+CACHES = {
+    'default': _cache_backend('default', 300, 1000),
+    'llm': _cache_backend('chatbot-llm', int(os.getenv('CHATBOT_LLM_CACHE_TTL', '3600')),
+                          int(os.getenv('CHATBOT_LLM_CACHE_MAX_ENTRIES', '1000'))),
+    'responses': _cache_backend('api-responses', int(os.getenv('RESPONSE_CACHE_TTL', '300')),
+                                int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '2000'))),
+}
+
+# Conditional GET for the API (see backend_project/middleware.py). Table versions are
+# bumped on save/delete and compared on every GET. They must be seen by every process,
+# so conditional GETs (and the response cache below) only run with a shared cache
+# (REDIS_URL); with the local-memory cache they are off (system check W001).
+TABLE_VERSIONS = {
+    'ENABLED': os.getenv('TABLE_VERSIONS_ENABLED', 'True').lower() == 'true',
+    'ALIAS': 'default',
+    'TIMEOUT': None,
+}
+
+# Cached responses of reference-data viewsets (see backend_project/response_cache.py).
+# Entries are keyed on the table versions above, so writes invalidate them immediately;
+# like the versions, they need a shared cache and are off without one.
+RESPONSE_CACHE = {
+    'ENABLED': os.getenv('RESPONSE_CACHE_ENABLED', 'True').lower() == 'true',
+    'ALIAS': 'responses',
+    'TIMEOUT': int(os.getenv('RESPONSE_CACHE_TTL', '300')),
+    'LOCK_TIMEOUT': 10,
+    'WAIT_TIMEOUT': float(os.getenv('RESPONSE_CACHE_WAIT_TIMEOUT', '2')),
+}
+
+# Chatbot LLM response cache (see chatbot/cache.py)
+CHATBOT_LLM_CACHE = {
+    'ENABLED': os.getenv('CHATBOT_LLM_CACHE_ENABLED', 'True').lower() == 'true',
+    'ALIAS': 'llm',
+    'TIMEOUT': int(os.getenv('CHATBOT_LLM_CACHE_TTL', '3600')),
+    'HISTORY_WINDOW': int(os.getenv('CHATBOT_LLM_CACHE_HISTORY_WINDOW', '6')),
+    'MAX_VALUE_BYTES': 64 * 1024,
+}
+
+
+# Chatbot prompt context window (see chatbot/context.py); token counts are estimates
+CHATBOT_CONTEXT_WINDOW = {
+    'MAX_TURNS': int(os.getenv('CHATBOT_CONTEXT_MAX_TURNS', '12')),
+    'TOKEN_BUDGET': int(os.getenv('CHATBOT_CONTEXT_TOKEN_BUDGET', '3000')),
+    'SUMMARY_TOKEN_BUDGET': 500,
+    'FOLD_BATCH': 20,
+}
+
+# Autonomous agent task queue (see chatbot/task_queue.py)
+AGENT_TASK_QUEUE = {
+    'WORKERS': int(os.getenv('AGENT_WORKERS', '4')),
+    'POLL_INTERVAL_SECONDS': 5,  # Idle wait cap; in-process enqueues wake workers immediately
+    'LEASE_SECONDS': 300,
+    'MAX_ATTEMPTS': 3,
+    'RETRY_BACKOFF_SECONDS': 5,
+    'RETRY_BACKOFF_MAX_SECONDS': 600,
+    'RETENTION_HOURS': 72,  # Completed and failed tasks are deleted after this
+}
+
+
+# How the agent reads and writes module data (see chatbot/dispatch.py). Leave
+# AGENT_MODULE_API_BASE_URL unset to call the module viewsets in-process; set it
+# only when the agent runs apart from the API it updates.
+AGENT_MODULE_DISPATCH = {
+    'BASE_URL': os.getenv('AGENT_MODULE_API_BASE_URL'),
+    'CONNECT_TIMEOUT': 3.05,
+    'READ_TIMEOUT': 10,
+    'POOL_SIZE': 10,
+    'RETRIEVE_LIMIT': 50,
+}
+
+# Autonomous agent in-process memory budgets (see chatbot/memory.py)
+AGENT_MEMORY = {
+    'MAX_ENTRIES': int(os.getenv('AGENT_MEMORY_MAX_ENTRIES', '1000')),
+    'MAX_BYTES': int(os.getenv('AGENT_MEMORY_MAX_BYTES', str(16 * 1024 * 1024))),
+    'TTL_SECONDS': int(os.getenv('AGENT_MEMORY_TTL_SECONDS', '86400')),
+}
+
+
+# Economic news scraper (see economic_forecast/news/)
+NEWS_SCRAPER = {
+    'CONNECT_TIMEOUT': float(os.getenv('NEWS_CONNECT_TIMEOUT', '3.05')),
+    'READ_TIMEOUT': float(os.getenv('NEWS_READ_TIMEOUT', '10')),
+    'DEADLINE_SECONDS': float(os.getenv('NEWS_DEADLINE_SECONDS', '20')),
+    'MAX_WORKERS': 8,
+    # Tree builder for scraped pages; falls back to html.parser when lxml is not installed
+    'HTML_PARSER': os.getenv('NEWS_HTML_PARSER', 'lxml'),
+    # On-disk conditional-GET cache for fetched pages; set NEWS_HTTP_CACHE_DIR='' to disable
+    'HTTP_CACHE_DIR': os.getenv('NEWS_HTTP_CACHE_DIR', str(BASE_DIR / '.cache' / 'news_http')),
+}
+
+
+# Built-in scheduler for the news job (see economic_forecast/scheduler.py). The run lock
+# lives in the default cache, so set REDIS_URL when several schedulers may run.
+NEWS_SCHEDULER = {
+    'INTERVAL_SECONDS': float(os.getenv('NEWS_SCRAPE_INTERVAL_SECONDS', '10')),
+    'JITTER': 0.1,
+    'LOCK_TIMEOUT_SECONDS': 300,
+    'JOB_BACKOFF_MAX_SECONDS': 900,
+    'SOURCE_BACKOFF_SECONDS': 30,
+    'SOURCE_BACKOFF_MAX_SECONDS': 900,
+}
+
+
+# Monthly news partitions older than RETENTION_MONTHS (current month included) are rolled
+# up into EconomicNewsRollup and deleted by prune_news_archive
+NEWS_ARCHIVE = {
+    'RETENTION_MONTHS': int(os.getenv('NEWS_RETENTION_MONTHS', '6')),
+    'ROLLUP': True,
+    'DELETE_BATCH_SIZE': 5000,
+    'PRUNE_INTERVAL_SECONDS': 86400,
+}
+
+
+# Batched headline summarization for scraped news (see economic_forecast/news/summarize.py)
+NEWS_SUMMARIZER = {
+    'MODEL': 'gemini-1.5-flash',
+    'BATCH_SIZE': 25,
+    'MAX_CONCURRENCY': 2,
+    'CACHE_ALIAS': 'default',
+    'CACHE_TIMEOUT': 7 * 86400,
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
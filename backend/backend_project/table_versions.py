@@ -0,0 +1,126 @@
+import time
+from pathlib import Path
+from typing import Iterable, List
+
+from django.apps import apps
+from django.conf import settings
+from django.core import checks
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+def _config():
+    return getattr(settings, 'TABLE_VERSIONS', {})
+
+
+def _cache():
+    return caches[_config().get('ALIAS', 'default')]
+
+
+def is_shared_cache(alias: str) -> bool:
+    """True if cache ``alias`` is one store for every process (not per-process local memory)."""
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
+
+
+def versions_shared() -> bool:
+    """
+    Whether table versions are exact across worker processes.
+
+    A version bumped in one process's local-memory cache is invisible to the others,
+    which would keep answering 304 and serving cached responses for the old data, so
+    the ETag middleware and the response cache switch off unless this is True.
+    """
+    return is_shared_cache(_config().get('ALIAS', 'default'))
+
+
+def check_shared_cache(app_configs=None, **kwargs):
+    if _config().get('ENABLED', True) and not versions_shared():
+        return [checks.Warning(
+            'Table versions are kept in a per-process cache, so conditional GETs and the API response cache are off.',
+            hint='Set REDIS_URL (or point TABLE_VERSIONS["ALIAS"] at another shared cache) to enable them.',
+            id='backend_project.W001',
+        )]
+    return []
+
+
+def _key(model) -> str:
+    return f'table-version:{model._meta.label_lower}'
+
+
+def table_versions(models: Iterable) -> List[int]:
+    """
+    Current version of each model's table, one cache round trip in the common case.
+
+    A version is the time (ns) of the last recorded change, so it doubles as a
+    Last-Modified date. A table with no recorded change (or an evicted entry) is seeded
+    with the current time, which can only make clients refetch, never serve stale data.
+    """
+    cache = _cache()
+    keys = [_key(model) for model in models]
+    found = cache.get_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        now = time.time_ns()
+        for key in missing:
+            cache.add(key, now, _config().get('TIMEOUT'))
+        found.update(cache.get_many(missing))
+        return [found.get(key, now) for key in keys]
+    return [found[key] for key in keys]
+
+
+def view_models(view_class) -> tuple:
+    """
+    Models whose tables a DRF view's GET responses are built from.
+
+    A viewset's ``etag_models`` wins (set it when serializers read other tables, or to
+    ``()`` to opt out); otherwise the model of its ``queryset``. Views without either
+    are not versioned.
+    """
+    if view_class is None:
+        return ()
+    models = getattr(view_class, 'etag_models', None)
+    if models is not None:
+        return tuple(models)
+    queryset = getattr(view_class, 'queryset', None)
+    return (queryset.model,) if queryset is not None else ()
+
+
+def _bump(model) -> None:
+    cache = _cache()
+    key = _key(model)
+    cache.set(key, max(time.time_ns(), (cache.get(key) or 0) + 1), _config().get('TIMEOUT'))
+
+
+def bump_table_version(model) -> None:
+    """
+    Record that ``model``'s table changed, once the current transaction commits.
+
+    Saves and deletes do this through signals; call it after bulk_create, bulk_update
+    and QuerySet.update(), which send none.
+    """
+    transaction.on_commit(lambda: _bump(model))
+
+
+def _changed(sender, **kwargs):
+    bump_table_version(sender)
+
+
+def _m2m_changed(sender, instance, action, model, **kwargs):
+    if action.startswith('post_'):
+        for changed in {sender, type(instance), model}:
+            bump_table_version(changed)
+
+
+def connect_signals() -> None:
+    """Track saves and deletes of every model that belongs to this project's apps."""
+    base_dir = Path(settings.BASE_DIR).resolve()
+    for model in apps.get_models():
+        if not Path(model._meta.app_config.path).resolve().is_relative_to(base_dir):
+            continue
+        uid = f'table-version:{model._meta.label_lower}'
+        post_save.connect(_changed, sender=model, dispatch_uid=uid)
+        post_delete.connect(_changed, sender=model, dispatch_uid=uid)
+    m2m_changed.connect(_m2m_changed, dispatch_uid='table-version:m2m')
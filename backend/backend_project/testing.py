@@ -0,0 +1,70 @@
+import os
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+
+def explain(sql):
+    """Query plan lines for ``sql`` on the current database (SQLite or Postgres)."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # Tiny test tables make a sequential scan cheapest; ask whether an index *can* serve it
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f'EXPLAIN {sql}')
+            return [row[0] for row in cursor.fetchall()]
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def is_full_scan(plan_line, table):
+    if connection.vendor == 'postgresql':
+        return f'Seq Scan on {table}' in plan_line
+    # SQLite: "SEARCH t USING INDEX ..." is an index lookup; "SCAN t" (even USING INDEX) reads everything
+    return plan_line.startswith(f'SCAN {table}')
+
+
+class QueryPlanTestMixin:
+    """Assertions that list requests are answered from an index rather than a full table scan."""
+
+    def assertListUsesIndex(self, url, params, model):
+        table = model._meta.db_table
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        checked = [query['sql'] for query in queries.captured_queries if f'"{table}"' in query['sql']]
+        self.assertTrue(checked, f'No query against {table} for {params}')
+        for sql in checked:
+            plan = explain(sql)
+            scans = [line for line in plan if is_full_scan(line, table)]
+            self.assertFalse(scans, f'{params} full-scans {table}: {plan}\n{sql}')
+        return response
+
+
+class SharedCacheTestMixin:
+    """
+    Run the tests against file-based caches, which every process shares as Redis would.
+
+    Table-version ETags and the response cache switch off on local-memory caches.
+    Threads get their own cache connections onto the same files, so a thread stands
+    in for another worker process.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        location = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, location, ignore_errors=True)
+        shared = override_settings(CACHES={
+            alias: {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': os.path.join(location, alias),
+                'TIMEOUT': config.get('TIMEOUT', 300),
+            }
+            for alias, config in settings.CACHES.items()
+        })
+        shared.enable()
+        cls.addClassCleanup(shared.disable)
+        super().setUpClass()
@@ -22,8 +22,11 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 
+from .views import response_cache_stats
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('api/response-cache/stats/', response_cache_stats, name='response_cache_stats'),
     path('api/business/', include('business_forecast.urls')),
     path('api/economic/', include('economic_forecast.urls')),
     path('chatbot/', include('chatbot.urls')),
@@ -0,0 +1,10 @@
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from .response_cache import response_cache
+
+
+@api_view(['GET'])
+def response_cache_stats(request):
+    """Hit/miss counters of the viewset response cache for this worker, overall and per view."""
+    return Response(response_cache.stats())
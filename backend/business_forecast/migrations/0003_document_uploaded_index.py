@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('business_forecast', '0002_document'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['-uploaded_at', '-id'], name='document_uploaded_idx'),
+        ),
+    ]
@@ -14,6 +14,9 @@ class Document(models.Model):
 
     class Meta:
         ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['-uploaded_at', '-id'], name='document_uploaded_idx'),
+        ]
 
     def __str__(self):
         return f"Document: {self.name}"
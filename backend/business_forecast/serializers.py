@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from backend_project.serializers import SparseModelSerializer
 from .models import CustomerProfile, RevenueProjection, CostStructure, CashFlowForecast, KPI, ScenarioPlanning, Document
 
-class DocumentSerializer(serializers.ModelSerializer):
+class DocumentSerializer(SparseModelSerializer):
     file_url = serializers.SerializerMethodField()
 
     class Meta:
@@ -17,32 +18,32 @@ class DocumentSerializer(serializers.ModelSerializer):
             return obj.file.url
         return None
 
-class CustomerProfileSerializer(serializers.ModelSerializer):
+class CustomerProfileSerializer(SparseModelSerializer):
     class Meta:
         model = CustomerProfile
         fields = '__all__'
 
-class RevenueProjectionSerializer(serializers.ModelSerializer):
+class RevenueProjectionSerializer(SparseModelSerializer):
     class Meta:
         model = RevenueProjection
         fields = '__all__'
 
-class CostStructureSerializer(serializers.ModelSerializer):
+class CostStructureSerializer(SparseModelSerializer):
     class Meta:
         model = CostStructure
         fields = '__all__'
 
-class CashFlowForecastSerializer(serializers.ModelSerializer):
+class CashFlowForecastSerializer(SparseModelSerializer):
     class Meta:
         model = CashFlowForecast
         fields = '__all__'
 
-class KPISerializer(serializers.ModelSerializer):
+class KPISerializer(SparseModelSerializer):
     class Meta:
         model = KPI
         fields = '__all__'
 
-class ScenarioPlanningSerializer(serializers.ModelSerializer):
+class ScenarioPlanningSerializer(SparseModelSerializer):
     class Meta:
         model = ScenarioPlanning
         fields = '__all__'
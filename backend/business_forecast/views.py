@@ -15,6 +15,7 @@ from .serializers import (
 class DocumentViewSet(viewsets.ModelViewSet):
     queryset = Document.objects.all()
     serializer_class = DocumentSerializer
+    cursor_ordering = ('-uploaded_at', '-pk')
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
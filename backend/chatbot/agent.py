@@ -1,17 +1,23 @@
 import asyncio
+import heapq
+import itertools
 import json
 import logging
+import os
+import socket
 import threading
 import time
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-import requests
 from django.conf import settings
-import google.generativeai as genai
+from django.db import close_old_connections, connection
 
-# Configure Gemini API
-genai.configure(api_key=settings.GEMINI_API_KEY)
-model = genai.GenerativeModel('gemini-pro')
+from . import llm, task_queue
+from .context import context_window
+from .dispatch import ModuleDispatcher
+from .memory import AgentMemory
+from .models import ModuleConversation
 
 logger = logging.getLogger(__name__)
 
@@ -27,102 +33,193 @@ class AutonomousAgent:
         self.is_running = False
         self.thread = None
         self.last_update = {}
-        self.module_endpoints = {
-            'economic_forecast': 'http://localhost:8000/economic_forecast/',
-            'business_forecast': 'http://localhost:8000/business_forecast/',
-            'financial_advisory': 'http://localhost:8000/financial_advisory/',
-            'inventory_supply_chain': 'http://localhost:8000/inventory_supply_chain/',
-            'loan_funding': 'http://localhost:8000/loan_funding/',
-            'market_analysis': 'http://localhost:8000/market_analysis/',
-            'policy': 'http://localhost:8000/policy/',
-            'pricing_strategy': 'http://localhost:8000/pricing_strategy/',
-            'revenue_strategy': 'http://localhost:8000/revenue_strategy/',
-            'tax_compliance': 'http://localhost:8000/tax_compliance/',
-        }
-        self.agent_memory = {}
-        self.pending_tasks = []
-        self.completed_tasks = []
-
-    def start(self):
-        """Start the autonomous agent in a background thread."""
+        self.dispatcher = ModuleDispatcher.from_settings()
+        self.modules = self.dispatcher.modules
+        self.agent_memory = AgentMemory.from_settings()
+        queue_config = getattr(settings, 'AGENT_TASK_QUEUE', {})
+        self.worker_count = queue_config.get('WORKERS', 4)
+        self.poll_interval = queue_config.get('POLL_INTERVAL_SECONDS', 5)
+        self.module_update_interval = timedelta(hours=6)
+        self.task_retention_interval = timedelta(hours=1)
+        self.workers = []
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._completion_times = deque(maxlen=10000)
+
+        # Workers block on this condition; add_task bumps the generation and notifies
+        self._work_available = threading.Condition()
+        self._work_generation = 0
+        # The agent loop sleeps until the next timer is due or this event is set
+        self._loop_wakeup = threading.Event()
+        self._information_pending = threading.Event()
+        # Heap of (due monotonic time, sequence, timer key) for periodic work
+        self._timers = []
+        self._timer_sequence = itertools.count()
+        self._timers_lock = threading.Lock()
+
+    def start(self, run_loop: bool = True):
+        """Start the autonomous agent loop and its task worker pool in background threads."""
         if not self.is_running:
             self.is_running = True
-            self.thread = threading.Thread(target=self._run_agent_loop, daemon=True)
-            self.thread.start()
-            logger.info("Autonomous Agent started")
+            if run_loop:
+                self.thread = threading.Thread(target=self._run_agent_loop, daemon=True)
+                self.thread.start()
+            self.workers = [
+                threading.Thread(target=self._run_worker, args=(f"{self.worker_prefix}:{i}",), daemon=True)
+                for i in range(self.worker_count)
+            ]
+            for worker in self.workers:
+                worker.start()
+            logger.info(f"Autonomous Agent started with {self.worker_count} workers")
 
     def stop(self):
         """Stop the autonomous agent."""
         self.is_running = False
+        self._loop_wakeup.set()
+        with self._work_available:
+            self._work_available.notify_all()
         if self.thread:
             self.thread.join(timeout=5)
+        for worker in self.workers:
+            worker.join(timeout=5)
+        self.workers = []
         logger.info("Autonomous Agent stopped")
 
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of the agent."""
+        counts = task_queue.status_counts()
         return {
             'is_running': self.is_running,
             'last_updates': self.last_update,
-            'pending_tasks': len(self.pending_tasks),
-            'completed_tasks': len(self.completed_tasks),
-            'memory_size': len(self.agent_memory)
+            'workers': len(self.workers),
+            'pending_tasks': counts[task_queue.AgentTask.PENDING],
+            'running_tasks': counts[task_queue.AgentTask.RUNNING],
+            # Finished counts cover the last hour (see task_queue.status_counts)
+            'completed_tasks': counts[task_queue.AgentTask.COMPLETED],
+            'failed_tasks': counts[task_queue.AgentTask.FAILED],
+            'tasks_per_second': self.throughput(),
+            'memory_size': len(self.agent_memory),
+            'memory': self.agent_memory.usage(),
         }
 
-    def add_task(self, task: Dict[str, Any]):
-        """Add a task to the agent's queue."""
-        self.pending_tasks.append({
-            'id': f"task_{int(time.time())}_{len(self.pending_tasks)}",
-            'task': task,
-            'timestamp': datetime.now(),
-            'status': 'pending'
-        })
+    def throughput(self, window_seconds: int = 60) -> float:
+        """Tasks finished by this process per second over the last ``window_seconds``."""
+        cutoff = time.monotonic() - window_seconds
+        recent = sum(1 for finished in list(self._completion_times) if finished >= cutoff)
+        return round(recent / window_seconds, 3)
+
+    def add_task(self, task: Dict[str, Any], priority: Optional[int] = None):
+        """Add a task to the agent's persistent queue and wake an idle worker."""
+        task_row = task_queue.enqueue(task, priority=priority)
+        with self._work_available:
+            self._work_generation += 1
+            self._work_available.notify()
+        return task_row
+
+    def schedule_timer(self, key: str, delay_seconds: float):
+        """Schedule the periodic job ``key`` to fire after ``delay_seconds`` and wake the loop."""
+        with self._timers_lock:
+            heapq.heappush(self._timers, (time.monotonic() + delay_seconds, next(self._timer_sequence), key))
+        self._loop_wakeup.set()
+
+    def _pop_due_timers(self) -> List[str]:
+        due = []
+        now = time.monotonic()
+        with self._timers_lock:
+            while self._timers and self._timers[0][0] <= now:
+                due.append(heapq.heappop(self._timers)[2])
+        return due
+
+    def _seconds_until_next_timer(self) -> Optional[float]:
+        with self._timers_lock:
+            if not self._timers:
+                return None
+            return max(0.0, self._timers[0][0] - time.monotonic())
 
     def _run_agent_loop(self):
-        """Main agent loop that runs in background thread."""
+        """Main agent loop: fire due timers and process new information, then sleep until the next event."""
+        for module in self.modules:
+            self.schedule_timer(f"module_update:{module}", 0)
+        self.schedule_timer('task_retention', 0)
+
         while self.is_running:
             try:
-                # Process pending tasks
-                self._process_pending_tasks()
+                close_old_connections()
 
-                # Auto-update modules
-                self._auto_update_modules()
+                # Auto-update modules whose refresh is due
+                for key in self._pop_due_timers():
+                    self._run_timer(key)
 
                 # Handle information retrieval and processing
-                self._handle_information_processing()
+                if self._information_pending.is_set():
+                    self._information_pending.clear()
+                    self._handle_information_processing()
 
-                # Sleep for a short interval
-                time.sleep(30)  # Check every 30 seconds
+                self._loop_wakeup.wait(timeout=self._seconds_until_next_timer())
+                self._loop_wakeup.clear()
 
             except Exception as e:
                 logger.error(f"Agent loop error: {e}")
-                time.sleep(60)  # Wait longer on error
-
-    def _process_pending_tasks(self):
-        """Process tasks in the pending queue."""
-        if not self.pending_tasks:
-            return
-
-        # Process one task at a time to avoid overwhelming the system
-        task_data = self.pending_tasks.pop(0)
-        task = task_data['task']
+                self._loop_wakeup.wait(timeout=60)  # Wait longer on error
+
+    def _run_timer(self, key: str):
+        kind, _, name = key.partition(':')
+        if kind == 'module_update':
+            self._auto_update_module(name)
+            self.schedule_timer(key, self.module_update_interval.total_seconds())
+        elif kind == 'task_retention':
+            pruned = task_queue.prune_finished()
+            if pruned:
+                logger.info(f"Pruned {pruned} finished agent tasks")
+            self.schedule_timer(key, self.task_retention_interval.total_seconds())
+
+    def _run_worker(self, worker_id: str):
+        """Worker thread: claim tasks from the queue and execute them until stopped."""
+        while self.is_running:
+            try:
+                close_old_connections()
+                generation = self._work_generation
+                if not self._process_next_task(worker_id):
+                    self._wait_for_work(generation)
+            except Exception as e:
+                logger.error(f"Agent worker {worker_id} error: {e}")
+                time.sleep(self.poll_interval)
+        connection.close()
+
+    def _wait_for_work(self, seen_generation: int):
+        """
+        Block until add_task signals new work, a retry or expired lease comes due,
+        or ``poll_interval`` passes (to pick up tasks queued by other processes).
+        """
+        timeout = self.poll_interval
+        next_due = task_queue.seconds_until_next_due()
+        if next_due is not None:
+            timeout = min(timeout, next_due)
+        with self._work_available:
+            if self.is_running and self._work_generation == seen_generation:
+                self._work_available.wait(timeout)
+
+    def _process_next_task(self, worker_id: str) -> bool:
+        """Lease and run one task; returns False when nothing is due."""
+        task_row = task_queue.claim(worker_id)
+        if task_row is None:
+            return False
 
         try:
-            result = self._execute_task(task)
-            task_data['status'] = 'completed'
-            task_data['result'] = result
-            task_data['completed_at'] = datetime.now()
-            self.completed_tasks.append(task_data)
-
-            # Keep only last 100 completed tasks
-            if len(self.completed_tasks) > 100:
-                self.completed_tasks = self.completed_tasks[-100:]
-
+            result = self._execute_task(task_row.payload)
         except Exception as e:
             logger.error(f"Task execution failed: {e}")
-            task_data['status'] = 'failed'
-            task_data['error'] = str(e)
-            task_data['completed_at'] = datetime.now()
-            self.completed_tasks.append(task_data)
+            recorded = task_queue.fail(task_row, str(e))
+        else:
+            # Handlers report their own failures as {'error': ...}; retry those too
+            if isinstance(result, dict) and 'error' in result:
+                recorded = task_queue.fail(task_row, str(result['error']))
+            else:
+                recorded = task_queue.complete(task_row, result)
+                if recorded:
+                    self._completion_times.append(time.monotonic())
+        if not recorded:
+            logger.warning(f"Lease on task {task_row.id} expired before it finished; outcome discarded")
+        return True
 
     def _execute_task(self, task: Dict[str, Any]) -> Any:
         """Execute a specific task."""
@@ -138,6 +235,8 @@ class AutonomousAgent:
             return self._handle_user_request(task.get('request', ''), task.get('context', {}))
         elif task_type == 'data_analysis':
             return self._analyze_data(task.get('data', {}), task.get('analysis_type', ''))
+        elif task_type == 'conversation_summary':
+            return self._fold_conversation_summary(task.get('conversation'))
         else:
             return self._process_general_task(task)
 
@@ -158,8 +257,10 @@ class AutonomousAgent:
                 'timestamp': datetime.now().isoformat()
             }
 
-            # Store in agent memory
-            self.agent_memory[f'search_{query}'] = search_results
+            # Store in agent memory and let the loop pick it up for processing
+            self.agent_memory.set(f'search_{query}', search_results, unprocessed=True)
+            self._information_pending.set()
+            self._loop_wakeup.set()
             return search_results
 
         except Exception as e:
@@ -169,15 +270,11 @@ class AutonomousAgent:
     def _retrieve_information(self, source: str, query: str) -> Dict[str, Any]:
         """Retrieve information from specified source."""
         try:
-            if source in self.module_endpoints:
-                # Retrieve from internal API
-                response = requests.get(f"{self.module_endpoints[source]}?q={query}")
-                if response.status_code == 200:
-                    data = response.json()
-                    self.agent_memory[f'info_{source}_{query}'] = data
-                    return data
-                else:
-                    return {'error': f'API request failed: {response.status_code}'}
+            if source in self.modules:
+                # Retrieve from the module's own viewsets and serializers
+                data = self.dispatcher.retrieve(source, query)
+                self.agent_memory.set(f'info_{source}_{query}', data)
+                return data
             else:
                 # External information retrieval
                 return self._perform_web_search(f"{source} {query}")
@@ -189,22 +286,27 @@ class AutonomousAgent:
     def _update_module_data(self, module: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update data in a specific module."""
         try:
-            if module in self.module_endpoints:
-                # Post data to module API
-                response = requests.post(
-                    self.module_endpoints[module],
-                    json=data,
-                    headers={'Content-Type': 'application/json'}
-                )
+            if module in self.modules:
+                response = self.dispatcher.update(module, data)
+                if response.get('skipped'):
+                    return {
+                        'module': module,
+                        'success': False,
+                        'skipped': True,
+                        'reason': response['reason'],
+                        'timestamp': datetime.now().isoformat()
+                    }
 
                 result = {
                     'module': module,
-                    'success': response.status_code in [200, 201],
-                    'status_code': response.status_code,
+                    'success': response['status_code'] in [200, 201],
+                    'status_code': response['status_code'],
                     'timestamp': datetime.now().isoformat()
                 }
+                if 'errors' in response:
+                    result['errors'] = response['errors']
 
-                if response.status_code in [200, 201]:
+                if response['status_code'] in [200, 201]:
                     self.last_update[module] = datetime.now()
 
                 return result
@@ -215,6 +317,13 @@ class AutonomousAgent:
             logger.error(f"Module update failed: {e}")
             return {'error': str(e)}
 
+    def _fold_conversation_summary(self, conversation_id) -> Dict[str, Any]:
+        """Fold turns that left a conversation's context window into its rolling summary."""
+        conversation = ModuleConversation.objects.filter(id=conversation_id).first()
+        if conversation is None:
+            return {'conversation': conversation_id, 'folded': False, 'reason': 'Conversation not found'}
+        return {'conversation': conversation_id, 'folded': context_window.fold(conversation)}
+
     def _handle_user_request(self, request: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle user requests autonomously."""
         try:
@@ -235,8 +344,7 @@ class AutonomousAgent:
             Respond in JSON format with keys: actions, response
             """
 
-            response = model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+            result = json.loads(llm.generate_text(prompt))
 
             # Execute determined actions
             if 'actions' in result:
@@ -262,8 +370,7 @@ class AutonomousAgent:
             Provide insights, trends, and recommendations based on the data.
             """
 
-            response = model.generate_content(prompt)
-            analysis = response.text.strip()
+            analysis = llm.generate_text(prompt)
 
             result = {
                 'analysis_type': analysis_type,
@@ -272,7 +379,7 @@ class AutonomousAgent:
             }
 
             # Store analysis in memory
-            self.agent_memory[f'analysis_{analysis_type}_{datetime.now().isoformat()}'] = result
+            self.agent_memory.set(f'analysis_{analysis_type}_{datetime.now().isoformat()}', result)
             return result
 
         except Exception as e:
@@ -290,10 +397,9 @@ class AutonomousAgent:
             As an autonomous agent, determine what actions to take and provide a response.
             """
 
-            response = model.generate_content(prompt)
             return {
                 'task': task,
-                'result': response.text.strip(),
+                'result': llm.generate_text(prompt),
                 'timestamp': datetime.now().isoformat()
             }
 
@@ -301,40 +407,30 @@ class AutonomousAgent:
             logger.error(f"General task processing failed: {e}")
             return {'error': str(e)}
 
-    def _auto_update_modules(self):
-        """Automatically update modules with fresh data."""
-        # Check if modules need updating (every 6 hours)
-        update_interval = timedelta(hours=6)
-
-        for module, endpoint in self.module_endpoints.items():
-            last_update = self.last_update.get(module)
-            if not last_update or datetime.now() - last_update > update_interval:
-                try:
-                    # Generate update task
-                    update_task = {
-                        'type': 'module_update',
-                        'module': module,
-                        'data': {
-                            'auto_update': True,
-                            'timestamp': datetime.now().isoformat(),
-                            'source': 'autonomous_agent'
-                        }
-                    }
-                    self.add_task(update_task)
+    def _auto_update_module(self, module: str):
+        """Queue a fresh-data update for one module."""
+        try:
+            # Generate update task
+            update_task = {
+                'type': 'module_update',
+                'module': module,
+                'data': {
+                    'auto_update': True,
+                    'timestamp': datetime.now().isoformat(),
+                    'source': 'autonomous_agent'
+                }
+            }
+            self.add_task(update_task)
 
-                except Exception as e:
-                    logger.error(f"Auto-update failed for {module}: {e}")
+        except Exception as e:
+            logger.error(f"Auto-update failed for {module}: {e}")
 
     def _handle_information_processing(self):
         """Handle ongoing information processing tasks."""
         # Check for information that needs processing
         try:
-            # Look for unprocessed information in memory
-            unprocessed_keys = [k for k in self.agent_memory.keys() if k.startswith('search_') and not k.endswith('_processed')]
-
-            for key in unprocessed_keys:
-                search_data = self.agent_memory[key]
-
+            # Only search results stored since the last pass are returned
+            for key, search_data in self.agent_memory.take_unprocessed():
                 # Process search results
                 processing_task = {
                     'type': 'data_analysis',
@@ -343,9 +439,6 @@ class AutonomousAgent:
                 }
                 self.add_task(processing_task)
 
-                # Mark as processed
-                self.agent_memory[f"{key}_processed"] = True
-
         except Exception as e:
             logger.error(f"Information processing failed: {e}")
 
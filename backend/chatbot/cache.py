@@ -0,0 +1,116 @@
+import hashlib
+import json
+import re
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text) -> str:
+    """Collapse whitespace and case so trivially different prompts share a cache entry."""
+    return _WHITESPACE.sub(' ', str(text or '')).strip().casefold()
+
+
+class LLMResponseCache:
+    """
+    Cache of finished LLM replies keyed on the prompt that produced them.
+
+    Entries live in a Django cache alias: the local-memory backend gives per-process
+    LRU eviction (``MAX_ENTRIES``) with a TTL, while a shared backend such as Redis
+    lets every worker reuse the same answers. Hit/miss counters are kept per process.
+    """
+
+    key_prefix = 'llm-response'
+
+    def __init__(self, alias='llm', timeout=3600, history_window=6, max_value_bytes=64 * 1024, enabled=True):
+        self.alias = alias
+        self.timeout = timeout
+        self.history_window = history_window
+        self.max_value_bytes = max_value_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    @classmethod
+    def from_settings(cls):
+        config = getattr(settings, 'CHATBOT_LLM_CACHE', {})
+        return cls(
+            alias=config.get('ALIAS', 'llm'),
+            timeout=config.get('TIMEOUT', 3600),
+            history_window=config.get('HISTORY_WINDOW', 6),
+            max_value_bytes=config.get('MAX_VALUE_BYTES', 64 * 1024),
+            enabled=config.get('ENABLED', True),
+        )
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def make_key(self, system_prompt, history, message) -> str:
+        """
+        Hash the system prompt, the last ``history_window`` turns and the user message.
+
+        ``history`` is a sequence of ``(role, content)`` pairs, oldest first.
+        """
+        window = list(history)[-self.history_window:] if self.history_window else []
+        payload = json.dumps([
+            normalize_text(system_prompt),
+            [[normalize_text(role), normalize_text(content)] for role, content in window],
+            normalize_text(message),
+        ])
+        return f"{self.key_prefix}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        return self._record(self.backend.get(key))
+
+    async def aget(self, key):
+        if not self.enabled:
+            return None
+        return self._record(await self.backend.aget(key))
+
+    def set(self, key, text):
+        if self._cacheable(text):
+            self.backend.set(key, text, self.timeout)
+            self._count_store()
+
+    async def aset(self, key, text):
+        if self._cacheable(text):
+            await self.backend.aset(key, text, self.timeout)
+            self._count_store()
+
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'enabled': self.enabled,
+                'backend': self.alias,
+                'hits': self._hits,
+                'misses': self._misses,
+                'stores': self._stores,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _cacheable(self, text):
+        return self.enabled and bool(text) and len(text.encode('utf-8')) <= self.max_value_bytes
+
+    def _record(self, value):
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def _count_store(self):
+        with self._lock:
+            self._stores += 1
+
+
+response_cache = LLMResponseCache.from_settings()
@@ -0,0 +1,154 @@
+import logging
+from typing import List, Sequence, Tuple
+
+from django.conf import settings
+
+from backend_project.table_versions import bump_table_version
+
+from . import llm
+from .models import ModuleConversation
+
+logger = logging.getLogger(__name__)
+
+Turn = Tuple[str, str]  # (role, content)
+
+ROLE_LABELS = {'user': 'User', 'assistant': 'Assistant', 'model': 'Assistant'}
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token); good enough for budgeting."""
+    return max(1, len(text or '') // 4)
+
+
+def format_transcript(turns: Sequence[Turn]) -> str:
+    return "\n".join(f"{ROLE_LABELS.get(role, role)}: {content}" for role, content in turns)
+
+
+class ContextWindowManager:
+    """
+    Keeps the prompt for a conversation at a flat size.
+
+    The most recent turns are sent verbatim, up to ``max_turns`` and ``token_budget``;
+    anything older is folded into a rolling summary stored on ModuleConversation,
+    a batch of at most ``fold_batch`` messages per turn, so no request ever reads
+    or sends the whole history.
+    """
+
+    def __init__(self, max_turns: int = 12, token_budget: int = 3000, summary_token_budget: int = 500, fold_batch: int = 20):
+        self.max_turns = max_turns
+        self.token_budget = token_budget
+        self.summary_token_budget = summary_token_budget
+        self.fold_batch = fold_batch
+
+    @classmethod
+    def from_settings(cls):
+        config = getattr(settings, 'CHATBOT_CONTEXT_WINDOW', {})
+        return cls(
+            max_turns=config.get('MAX_TURNS', 12),
+            token_budget=config.get('TOKEN_BUDGET', 3000),
+            summary_token_budget=config.get('SUMMARY_TOKEN_BUDGET', 500),
+            fold_batch=config.get('FOLD_BATCH', 20),
+        )
+
+    def window(self, turns: Sequence[Turn]) -> Tuple[List[Turn], List[Turn]]:
+        """Split oldest-first ``turns`` into (older turns that do not fit, newest turns that do)."""
+        kept = []
+        used = 0
+        for role, content in reversed(turns):
+            cost = estimate_tokens(content)
+            if kept and (len(kept) >= self.max_turns or used + cost > self.token_budget):
+                break
+            kept.append((role, content))
+            used += cost
+        kept.reverse()
+        return list(turns[:len(turns) - len(kept)]), kept
+
+    def load(self, conversation: ModuleConversation, exclude_id=None) -> Tuple[str, List[Turn]]:
+        """Return the conversation's rolling summary and the recent turns that fit the window."""
+        recent = self._unsummarized(conversation)
+        if exclude_id is not None:
+            recent = recent.exclude(id=exclude_id)
+        turns = list(recent.order_by('-timestamp').values_list('type', 'content')[:self.max_turns])
+        turns.reverse()
+        _, kept = self.window(turns)
+        return conversation.summary, kept
+
+    def has_overflow(self, conversation: ModuleConversation) -> bool:
+        """True if some unsummarized message has left the window, i.e. fold() has work to do."""
+        turns = list(self._unsummarized(conversation).order_by('-timestamp').values_list('type', 'content')[:self.max_turns + 1])
+        if len(turns) > self.max_turns:
+            return True
+        turns.reverse()
+        dropped, _ = self.window(turns)
+        return bool(dropped)
+
+    def fold(self, conversation: ModuleConversation) -> bool:
+        """
+        Fold the oldest messages that have left the window into the rolling summary.
+
+        Returns True if the summary changed. Call after the assistant reply is saved.
+        """
+        newest = list(self._unsummarized(conversation).order_by('-timestamp').values_list('type', 'content', 'timestamp')[:self.max_turns])
+        if not newest:
+            return False
+        newest.reverse()
+        dropped, kept = self.window([(role, content) for role, content, _ in newest])
+        window_start = newest[len(dropped)][2]
+
+        overflow = list(
+            self._unsummarized(conversation)
+            .filter(timestamp__lt=window_start)
+            .order_by('timestamp')
+            .values_list('type', 'content', 'timestamp')[:self.fold_batch]
+        )
+        if not overflow:
+            return False
+
+        summary = self.summarize(conversation.summary, [(role, content) for role, content, _ in overflow])
+        conversation.summary = summary
+        conversation.summarized_until = overflow[-1][2]
+        # update() leaves updated_at alone: folding is bookkeeping, not conversation activity
+        ModuleConversation.objects.filter(id=conversation.id).update(
+            summary=conversation.summary,
+            summarized_until=conversation.summarized_until,
+        )
+        bump_table_version(ModuleConversation)
+        return True
+
+    def summarize(self, previous: str, turns: Sequence[Turn]) -> str:
+        """Merge ``turns`` into ``previous`` with the LLM, falling back to an extractive summary."""
+        limit_words = max(50, int(self.summary_token_budget * 0.75))
+        prompt = (
+            "Update the running summary of a business advisory conversation with the new turns below. "
+            f"Keep facts, figures, decisions and open questions; stay under {limit_words} words.\n\n"
+            f"Current summary:\n{previous or '(none)'}\n\n"
+            f"New turns:\n{format_transcript(turns)}\n\n"
+            "Updated summary:"
+        )
+        try:
+            summary = llm.generate_text(prompt)
+        except Exception as e:
+            logger.warning(f"Conversation summarization failed, using extractive summary: {e}")
+            summary = ''
+        if not summary:
+            summary = "\n".join(part for part in (previous, self.condense(turns)) if part)
+        return self._trim(summary)
+
+    def condense(self, turns: Sequence[Turn]) -> str:
+        """Extractive, LLM-free summary: the start of each turn, newest kept if over budget."""
+        lines = [f"{ROLE_LABELS.get(role, role)}: {' '.join(content.split())[:200]}" for role, content in turns]
+        return self._trim("\n".join(lines))
+
+    def _trim(self, text: str) -> str:
+        max_chars = self.summary_token_budget * 4
+        text = text.strip()
+        return text if len(text) <= max_chars else text[-max_chars:]
+
+    def _unsummarized(self, conversation: ModuleConversation):
+        messages = conversation.messages.all()
+        if conversation.summarized_until:
+            messages = messages.filter(timestamp__gt=conversation.summarized_until)
+        return messages
+
+
+context_window = ContextWindowManager.from_settings()
@@ -0,0 +1,141 @@
+from functools import reduce
+from importlib import import_module
+from operator import or_
+from typing import Any, Dict, Optional
+
+import requests
+from django.conf import settings
+from django.db import models
+from django.http import HttpRequest
+from django.urls import URLResolver, get_resolver
+from requests.adapters import HTTPAdapter
+
+
+AGENT_MODULES = [
+    'economic_forecast',
+    'business_forecast',
+    'financial_advisory',
+    'inventory_supply_chain',
+    'loan_funding',
+    'market_analysis',
+    'policy',
+    'pricing_strategy',
+    'revenue_strategy',
+    'tax_compliance',
+]
+
+
+class ModuleDispatcher:
+    """
+    Read and write module data for the autonomous agent.
+
+    By default calls go straight to each module's registered viewsets in this process
+    (their ``get_queryset()`` and serializers), with no HTTP round trip back into Django. When
+    ``base_url`` is configured (the agent runs apart from the API), requests go over a
+    pooled keep-alive session with connect/read timeouts instead.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, connect_timeout: float = 3.05, read_timeout: float = 10,
+                 pool_size: int = 10, retrieve_limit: int = 50):
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_size = pool_size
+        self.retrieve_limit = retrieve_limit
+        self.modules = list(AGENT_MODULES)
+        self._session = None
+
+    @classmethod
+    def from_settings(cls):
+        config = getattr(settings, 'AGENT_MODULE_DISPATCH', {})
+        return cls(
+            base_url=config.get('BASE_URL'),
+            connect_timeout=config.get('CONNECT_TIMEOUT', 3.05),
+            read_timeout=config.get('READ_TIMEOUT', 10),
+            pool_size=config.get('POOL_SIZE', 10),
+            retrieve_limit=config.get('RETRIEVE_LIMIT', 50),
+        )
+
+    def retrieve(self, module: str, query: str = '') -> Dict[str, Any]:
+        """Return ``{resource: [records]}`` for every resource the module exposes."""
+        if self.base_url:
+            return self._retrieve_remote(module, query)
+        data = {}
+        for resource, viewset in self._resources(module).items():
+            view = self._view(viewset, 'list')
+            queryset = self._search(view.get_queryset(), query)[:self.retrieve_limit]
+            data[resource] = view.get_serializer(queryset, many=True).data
+        return data
+
+    def update(self, module: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a record from ``data`` in the module resource named by ``data['resource']``.
+
+        Payloads without a resource (such as scheduled auto-update pings) have nothing
+        to write and are reported as skipped, not as a successful update.
+        """
+        resource = data.get('resource')
+        if not resource:
+            return {'status_code': None, 'skipped': True, 'reason': 'No resource to update'}
+        if self.base_url:
+            return self._update_remote(module, data)
+        viewset = self._resources(module).get(resource)
+        if viewset is None:
+            return {'status_code': 404, 'errors': f'Unknown resource: {resource}'}
+        serializer = self._view(viewset, 'create').get_serializer(data=data.get('record', {}))
+        if not serializer.is_valid():
+            return {'status_code': 400, 'errors': serializer.errors}
+        serializer.save()
+        return {'status_code': 201, 'data': serializer.data}
+
+    def _resources(self, module: str) -> Dict[str, Any]:
+        router = import_module(f'{module}.urls').router
+        return {prefix: viewset for prefix, viewset, _ in router.registry}
+
+    def _view(self, viewset, action: str):
+        """An instance of ``viewset`` set up for ``action`` on an internal GET request."""
+        request = HttpRequest()
+        request.method = 'GET'
+        view = viewset(action_map={'get': action}, args=(), kwargs={}, format_kwarg=None)
+        view.request = view.initialize_request(request)
+        return view
+
+    def _search(self, queryset, query: str):
+        if not query:
+            return queryset
+        text_fields = [
+            field.name for field in queryset.model._meta.get_fields()
+            if isinstance(field, (models.CharField, models.TextField))
+        ]
+        if not text_fields:
+            return queryset
+        return queryset.filter(reduce(or_, (models.Q(**{f'{name}__icontains': query}) for name in text_fields)))
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+
+    def _module_url(self, module: str, resource: str = '') -> str:
+        """Public URL of a module resource, following the prefixes in the root URLconf."""
+        for pattern in get_resolver().url_patterns:
+            if isinstance(pattern, URLResolver) and getattr(pattern.urlconf_module, '__name__', '') == f'{module}.urls':
+                return f"{self.base_url}/{pattern.pattern}{resource}/" if resource else f"{self.base_url}/{pattern.pattern}"
+        raise ValueError(f'Unknown module: {module}')
+
+    def _retrieve_remote(self, module: str, query: str) -> Dict[str, Any]:
+        data = {}
+        for resource in self._resources(module):
+            response = self.session.get(self._module_url(module, resource), params={'q': query}, timeout=self.timeout)
+            response.raise_for_status()
+            data[resource] = response.json()
+        return data
+
+    def _update_remote(self, module: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        resource = data['resource']
+        response = self.session.post(self._module_url(module, resource), json=data.get('record', {}), timeout=self.timeout)
+        return {'status_code': response.status_code}
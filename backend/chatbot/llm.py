@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+from django.conf import settings
+
+from .cache import response_cache
+from .singleflight import AsyncSingleFlight, SingleFlight
+
+# Identical prompts in flight at the same time share one upstream call
+inflight = SingleFlight()
+async_inflight = AsyncSingleFlight()
+
+
+class LLMError(Exception):
+    """Raised by a provider when a completion fails."""
+
+
+def prompt_text(contents) -> str:
+    """Flatten a prompt (a string or a list of ``{"role", "parts"}`` dicts) into plain text."""
+    if isinstance(contents, str):
+        return contents
+    lines = []
+    for item in contents:
+        if isinstance(item, dict):
+            lines.extend(str(part) for part in item.get('parts', []))
+        else:
+            lines.append(str(item))
+    return "\n".join(lines)
+
+
+class LLMProvider(ABC):
+    """Interface every LLM backend implements; ``generation_config`` is a plain dict."""
+
+    name = 'base'
+
+    @abstractmethod
+    def generate(self, contents, generation_config=None) -> str:
+        """Return the full completion text."""
+
+    @abstractmethod
+    def stream(self, contents, generation_config=None) -> AsyncIterator[str]:
+        """Yield completion text chunks as they arrive (implemented as an async generator)."""
+
+
+class GeminiProvider(LLMProvider):
+    """Google Gemini through google.generativeai."""
+
+    name = 'gemini'
+
+    def __init__(self, model_name: str = 'gemini-pro', api_key: Optional[str] = None):
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key or settings.GEMINI_API_KEY)
+        self.model = genai.GenerativeModel(model_name)
+
+    def generate(self, contents, generation_config=None) -> str:
+        response = self.model.generate_content(contents, generation_config=generation_config)
+        return response.text.strip() if response else ''
+
+    async def stream(self, contents, generation_config=None):
+        response = await self.model.generate_content_async(
+            contents,
+            generation_config=generation_config,
+            stream=True,
+        )
+        async for chunk in response:
+            text = chunk.text
+            if text:
+                yield text
+
+
+class StubProvider(LLMProvider):
+    """
+    Offline, deterministic stand-in for benchmarks and CI.
+
+    The reply is derived from a hash of the prompt, so the same prompt always gets the
+    same text. ``latency`` is the delay before the first token, ``tokens_per_second``
+    the rate the rest arrive at, and ``failure_rate`` the share of calls that raise
+    LLMError (drawn from a seeded generator, so runs are repeatable).
+
+    In JSON mode a prompt with numbered lines ("1. ...") gets a JSON object mapping each
+    number to a ``response_tokens`` reply, the batch format the news summarizer asks
+    for; any other JSON prompt gets ``{"text": ...}``.
+    """
+
+    name = 'stub'
+
+    VOCABULARY = (
+        'demand', 'growth', 'pricing', 'margin', 'inflation', 'revenue', 'forecast', 'supply', 'market',
+        'risk', 'capital', 'cost', 'customers', 'segment', 'policy', 'cash', 'trend', 'strategy', 'rates',
+        'inventory', 'outlook', 'competition', 'investment', 'stable', 'improving', 'moderate', 'strong',
+    )
+
+    def __init__(self, latency: float = 0.05, tokens_per_second: float = 200.0, response_tokens: int = 40,
+                 failure_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.response_tokens = response_tokens
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def generate(self, contents, generation_config=None) -> str:
+        self._maybe_fail()
+        tokens = self._tokens(contents, generation_config)
+        time.sleep(self.latency + len(tokens) / self.tokens_per_second)
+        return ''.join(tokens).strip()
+
+    async def stream(self, contents, generation_config=None):
+        self._maybe_fail()
+        tokens = self._tokens(contents, generation_config)
+        await asyncio.sleep(self.latency)
+        for token in tokens:
+            await asyncio.sleep(1 / self.tokens_per_second)
+            yield token
+
+    def _maybe_fail(self):
+        with self._lock:
+            failed = self._random.random() < self.failure_rate
+        if failed:
+            raise LLMError('Stub provider injected failure')
+
+    _NUMBERED = re.compile(r'^(\d+)\.\s+(.+)$', re.MULTILINE)
+
+    def _reply(self, prompt: str) -> str:
+        digest = hashlib.sha256(prompt.encode('utf-8')).digest()
+        words = [self.VOCABULARY[digest[i % len(digest)] % len(self.VOCABULARY)] for i in range(self.response_tokens)]
+        return '[stub] ' + ' '.join(words) + '.'
+
+    def _tokens(self, contents, generation_config=None):
+        prompt = prompt_text(contents)
+        if (generation_config or {}).get('response_mime_type') == 'application/json':
+            items = self._NUMBERED.findall(prompt)
+            if items:
+                text = json.dumps({number: self._reply(item) for number, item in items})
+            else:
+                text = json.dumps({'text': self._reply(prompt)})
+        else:
+            text = self._reply(prompt)
+        return [f"{word} " for word in text.split(' ')]
+
+
+_providers = {}
+_override = None
+_providers_lock = threading.Lock()
+
+
+def build_provider(name: str, model_name: Optional[str] = None) -> LLMProvider:
+    config = getattr(settings, 'CHATBOT_LLM', {})
+    if name == 'stub':
+        return StubProvider(**config.get('STUB', {}))
+    if name == 'gemini':
+        return GeminiProvider(model_name or config.get('MODEL', 'gemini-pro'))
+    raise ValueError(f'Unknown LLM provider: {name}')
+
+
+def get_provider(model_name: Optional[str] = None) -> LLMProvider:
+    """The configured provider (``CHATBOT_LLM['PROVIDER']``), one instance per model name."""
+    with _providers_lock:
+        if _override is not None:
+            return _override
+        provider = _providers.get(model_name)
+        if provider is None:
+            name = getattr(settings, 'CHATBOT_LLM', {}).get('PROVIDER', 'gemini')
+            provider = _providers[model_name] = build_provider(name, model_name)
+        return provider
+
+
+def set_provider(provider: Optional[LLMProvider]) -> None:
+    """Route every completion to ``provider`` (load tests, offline benchmarks); None restores settings."""
+    global _override
+    with _providers_lock:
+        _override = provider
+
+
+def generate_text(contents, generation_config=None, model_name: Optional[str] = None) -> str:
+    """Run a blocking completion on the configured provider and return the stripped text."""
+    return get_provider(model_name).generate(contents, generation_config=generation_config)
+
+
+async def stream_text(contents, generation_config=None, model_name: Optional[str] = None):
+    """Yield response text chunks as they arrive, without blocking the event loop."""
+    async for chunk in get_provider(model_name).stream(contents, generation_config=generation_config):
+        yield chunk
+
+
+def generate_cached(cache_key, contents, generation_config=None) -> str:
+    """Like generate_text, but serve and store the reply through the response cache."""
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    def produce():
+        text = generate_text(contents, generation_config=generation_config)
+        response_cache.set(cache_key, text)
+        return text
+
+    return inflight.do(cache_key, produce)
+
+
+async def stream_cached(cache_key, contents, generation_config=None):
+    """Like stream_text; a cache hit is yielded as one chunk and a completed stream is stored."""
+    cached = await response_cache.aget(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    async def produce():
+        parts = []
+        async for chunk in stream_text(contents, generation_config=generation_config):
+            parts.append(chunk)
+            yield chunk
+        await response_cache.aset(cache_key, ''.join(parts).strip())
+
+    async for chunk in async_inflight.stream(cache_key, produce):
+        yield chunk
@@ -0,0 +1,192 @@
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.test import Client
+from chatbot import llm
+from chatbot.agent import AutonomousAgent
+from chatbot.cache import response_cache
+from chatbot.models import AgentTask, ModuleConversation
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Command(BaseCommand):
+    help = ('Load-test module_chat, generate_response or the agent task queue at a target request rate '
+            'against the offline stub LLM, and report p50/p95/p99 latency and throughput')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', choices=['module_chat', 'generate_response', 'agent'], default='generate_response')
+        parser.add_argument('--rps', type=float, default=20.0, help='Target arrival rate (requests or tasks per second)')
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds to generate load for')
+        parser.add_argument('--concurrency', type=int, default=32, help='Client threads for HTTP targets')
+        parser.add_argument('--workers', type=int, default=4, help='Agent worker threads for the agent target')
+        parser.add_argument('--latency', type=float, default=0.05, help='Stub time to first token, seconds')
+        parser.add_argument('--tokens-per-second', type=float, default=200.0, help='Stub token rate')
+        parser.add_argument('--failure-rate', type=float, default=0.0, help='Share of stub calls that fail')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--use-configured-provider', action='store_true',
+                            help='Call the provider from settings instead of the stub (makes real, billed calls)')
+        parser.add_argument('--cache', action='store_true', help='Leave the LLM response cache enabled')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def handle(self, *args, **options):
+        if options['rps'] <= 0 or options['duration'] <= 0:
+            raise CommandError('--rps and --duration must be positive')
+
+        if not options['use_configured_provider']:
+            llm.set_provider(llm.StubProvider(
+                latency=options['latency'],
+                tokens_per_second=options['tokens_per_second'],
+                failure_rate=options['failure_rate'],
+                seed=options['seed'],
+            ))
+        cache_enabled = response_cache.enabled
+        response_cache.enabled = options['cache']
+
+        try:
+            if options['target'] == 'agent':
+                report = self.run_agent(options)
+            else:
+                report = self.run_http(options)
+        finally:
+            llm.set_provider(None)
+            response_cache.enabled = cache_enabled
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.print_report(report)
+
+    def run_http(self, options):
+        target = options['target']
+        conversation = ModuleConversation.objects.create(module='market_analysis', title='Load test')
+        local = threading.local()
+
+        def fire(i):
+            if not hasattr(local, 'client'):
+                local.client = Client(HTTP_HOST='localhost')
+            if target == 'module_chat':
+                response = local.client.post('/chatbot/module-chat/', {
+                    'conversation': str(conversation.id),
+                    'content': f'Load test question {i}',
+                    'module': 'market_analysis',
+                }, content_type='application/json')
+            else:
+                response = local.client.post('/chatbot/generate-response/', {
+                    'messages': [{'type': 'user', 'content': f'Load test question {i}'}],
+                    'context': 'market-analysis',
+                }, content_type='application/json')
+            return response.status_code == 200
+
+        try:
+            latencies, errors, elapsed = self.open_loop(fire, options['rps'], options['duration'], options['concurrency'])
+        finally:
+            conversation.delete()
+        return self.summarize(target, options, latencies, errors, elapsed)
+
+    def run_agent(self, options):
+        agent = AutonomousAgent()
+        agent.worker_count = options['workers']
+        agent.start(run_loop=False)
+        task_ids = []
+        started = time.perf_counter()
+        try:
+            total = int(options['rps'] * options['duration'])
+            for i in range(total):
+                delay = started + i / options['rps'] - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                task_ids.append(agent.add_task({
+                    'type': 'data_analysis',
+                    'data': {'load_test': i},
+                    'analysis_type': 'load_test',
+                }).id)
+
+            # Wait for the backlog to drain (bounded, so a failing run still reports)
+            deadline = time.perf_counter() + max(30.0, options['duration'])
+            pending = AgentTask.objects.filter(id__in=task_ids, status__in=[AgentTask.PENDING, AgentTask.RUNNING])
+            while pending.exists() and time.perf_counter() < deadline:
+                time.sleep(0.05)
+            elapsed = time.perf_counter() - started
+        finally:
+            agent.stop()
+
+        tasks = AgentTask.objects.filter(id__in=task_ids)
+        latencies = sorted(
+            (task.completed_at - task.created_at).total_seconds()
+            for task in tasks.filter(status=AgentTask.COMPLETED).only('created_at', 'completed_at')
+        )
+        errors = len(task_ids) - len(latencies)
+        tasks.delete()
+        return self.summarize('agent', options, latencies, errors, elapsed)
+
+    def open_loop(self, fire, rps, duration, concurrency):
+        """
+        Issue requests on a fixed schedule regardless of how fast earlier ones finish.
+
+        Latency is measured from each request's scheduled start, so time spent queued
+        behind a saturated server is counted rather than hidden.
+        """
+        total = int(rps * duration)
+        futures = []
+
+        def timed(i, scheduled):
+            try:
+                ok = fire(i)
+            except Exception:
+                ok = False
+            finally:
+                close_old_connections()
+            return ok, time.perf_counter() - scheduled
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for i in range(total):
+                scheduled = started + i / rps
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(pool.submit(timed, i, scheduled))
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for ok, latency in results if ok)
+        errors = sum(1 for ok, _ in results if not ok)
+        return latencies, errors, elapsed
+
+    def summarize(self, target, options, latencies, errors, elapsed):
+        return {
+            'target': target,
+            'provider': 'configured' if options['use_configured_provider'] else 'stub',
+            'target_rps': options['rps'],
+            'requests': len(latencies) + errors,
+            'succeeded': len(latencies),
+            'errors': errors,
+            'elapsed_seconds': round(elapsed, 3),
+            'throughput_per_second': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+            'latency_ms': {
+                'p50': round(percentile(latencies, 50) * 1000, 1),
+                'p95': round(percentile(latencies, 95) * 1000, 1),
+                'p99': round(percentile(latencies, 99) * 1000, 1),
+                'max': round((latencies[-1] if latencies else 0.0) * 1000, 1),
+            },
+        }
+
+    def print_report(self, report):
+        latency = report['latency_ms']
+        self.stdout.write(f"Target:      {report['target']} ({report['provider']} LLM) at {report['target_rps']} rps")
+        self.stdout.write(f"Requests:    {report['requests']} ({report['succeeded']} ok, {report['errors']} errors)")
+        self.stdout.write(f"Throughput:  {report['throughput_per_second']}/s over {report['elapsed_seconds']}s")
+        self.stdout.write(f"Latency ms:  p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  max {latency['max']}")
+        style = self.style.SUCCESS if not report['errors'] else self.style.WARNING
+        self.stdout.write(style('Load test complete'))
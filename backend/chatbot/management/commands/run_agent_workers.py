@@ -0,0 +1,24 @@
+import time
+from django.core.management.base import BaseCommand
+from chatbot.agent import agent
+
+class Command(BaseCommand):
+    help = 'Run a pool of autonomous agent workers that consume the shared task queue'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None, help='Number of worker threads in this process')
+        parser.add_argument('--no-loop', action='store_true', help='Only consume tasks; do not run the scheduling loop')
+
+    def handle(self, *args, **options):
+        if options['workers']:
+            agent.worker_count = options['workers']
+
+        agent.start(run_loop=not options['no_loop'])
+        self.stdout.write(self.style.SUCCESS(f'Agent started with {agent.worker_count} workers. Press Ctrl+C to stop.'))
+
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            agent.stop()
+            self.stdout.write(self.style.SUCCESS('Agent workers stopped by user.'))
@@ -0,0 +1,116 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+
+class AgentMemory:
+    """
+    Bounded key/value store for the autonomous agent's results.
+
+    Entries are evicted least-recently-used first once the entry or byte budget is
+    exceeded, and expire ``ttl_seconds`` after they were last written. Search results
+    are also tracked in an index of unprocessed keys, so processing them costs
+    O(new items) instead of a scan over every key in memory.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 16 * 1024 * 1024, ttl_seconds: Optional[int] = 86400):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, size), least recently used first
+        self._expiry = OrderedDict()  # key -> expires_at, oldest write first
+        self._unprocessed = OrderedDict()  # search keys awaiting processing
+        self._bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_settings(cls):
+        config = getattr(settings, 'AGENT_MEMORY', {})
+        return cls(
+            max_entries=config.get('MAX_ENTRIES', 1000),
+            max_bytes=config.get('MAX_BYTES', 16 * 1024 * 1024),
+            ttl_seconds=config.get('TTL_SECONDS', 86400),
+        )
+
+    def set(self, key: str, value: Any, unprocessed: bool = False) -> None:
+        size = len(json.dumps(value, default=str).encode('utf-8'))
+        with self._lock:
+            self._purge_expired()
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size)
+            self._bytes += size
+            if self.ttl_seconds:
+                self._expiry[key] = time.monotonic() + self.ttl_seconds
+            if unprocessed:
+                self._unprocessed[key] = None
+            self._evict_over_budget()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            self._purge_expired()
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def take_unprocessed(self, limit: Optional[int] = None) -> List[Tuple[str, Any]]:
+        """Pop up to ``limit`` unprocessed search entries, oldest first."""
+        items = []
+        with self._lock:
+            self._purge_expired()
+            while self._unprocessed and (limit is None or len(items) < limit):
+                key, _ = self._unprocessed.popitem(last=False)
+                if key in self._entries:
+                    items.append((key, self._entries[key][0]))
+        return items
+
+    def usage(self) -> Dict[str, Any]:
+        with self._lock:
+            self._purge_expired()
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'unprocessed': len(self._unprocessed),
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            self._purge_expired()
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge_expired()
+            return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, size = self._entries.pop(key)
+        self._bytes -= size
+        self._expiry.pop(key, None)
+        self._unprocessed.pop(key, None)
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        while self._expiry:
+            key, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                break
+            self._remove(key)
+            self.expirations += 1
+
+    def _evict_over_budget(self) -> None:
+        # Always keep the entry just written, even if it alone exceeds the byte budget
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
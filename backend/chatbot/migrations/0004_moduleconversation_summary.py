@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0003_agenttask'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='moduleconversation',
+            name='summarized_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='moduleconversation',
+            name='summary',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
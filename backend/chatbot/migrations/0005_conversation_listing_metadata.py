@@ -0,0 +1,46 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:24
+
+from django.db import migrations, models
+
+
+def backfill_conversation_metadata(apps, schema_editor):
+    ModuleConversation = apps.get_model('chatbot', 'ModuleConversation')
+    ModuleConversationMessage = apps.get_model('chatbot', 'ModuleConversationMessage')
+    for conversation in ModuleConversation.objects.all().iterator():
+        messages = ModuleConversationMessage.objects.filter(conversation_id=conversation.id)
+        latest = messages.order_by('-timestamp').values('content', 'timestamp').first()
+        ModuleConversation.objects.filter(id=conversation.id).update(
+            message_count=messages.count(),
+            last_message_preview=latest['content'][:255] if latest else '',
+            last_message_at=latest['timestamp'] if latest else None,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0004_moduleconversation_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='moduleconversation',
+            name='last_message_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='moduleconversation',
+            name='last_message_preview',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='moduleconversation',
+            name='message_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='moduleconversationmessage',
+            index=models.Index(fields=['conversation', 'timestamp', 'id'], name='conv_message_keyset_idx'),
+        ),
+        migrations.RunPython(backfill_conversation_metadata, migrations.RunPython.noop),
+    ]
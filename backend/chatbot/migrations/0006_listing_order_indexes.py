@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0005_conversation_listing_metadata'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(fields=['timestamp', 'id'], name='chat_message_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moduleconversation',
+            index=models.Index(fields=['-updated_at', '-id'], name='conv_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moduleconversation',
+            index=models.Index(fields=['module', '-updated_at', '-id'], name='conv_module_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moduleconversationmessage',
+            index=models.Index(fields=['timestamp', 'id'], name='conv_message_ts_idx'),
+        ),
+    ]
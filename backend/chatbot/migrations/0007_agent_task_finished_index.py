@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-17 15:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0006_listing_order_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='agenttask',
+            index=models.Index(fields=['status', 'completed_at'], name='agent_task_finished_idx'),
+        ),
+    ]
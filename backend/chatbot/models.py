@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
 import uuid
 
 class ModuleConversation(models.Model):
@@ -15,9 +17,21 @@ class ModuleConversation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
+    summary = models.TextField(blank=True, default='')  # Rolling summary of turns older than the context window
+    summarized_until = models.DateTimeField(null=True, blank=True)  # Timestamp of the last message folded into summary
+    # Denormalized from messages (kept current by chatbot.signals) so listing never touches them
+    message_count = models.PositiveIntegerField(default=0)
+    last_message_preview = models.CharField(max_length=255, blank=True, default='')
+    last_message_at = models.DateTimeField(null=True, blank=True)
+
+    PREVIEW_LENGTH = 255
 
     class Meta:
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['-updated_at', '-id'], name='conv_updated_idx'),
+            models.Index(fields=['module', '-updated_at', '-id'], name='conv_module_updated_idx'),
+        ]
 
     def __str__(self):
         return f"{self.module} Conversation: {self.title or str(self.id)}"
@@ -36,6 +50,10 @@ class ModuleConversationMessage(models.Model):
 
     class Meta:
         ordering = ['timestamp']
+        indexes = [
+            models.Index(fields=['conversation', 'timestamp', 'id'], name='conv_message_keyset_idx'),
+            models.Index(fields=['timestamp', 'id'], name='conv_message_ts_idx'),
+        ]
 
     def __str__(self):
         return f"{self.type}: {self.content[:50]}..."
@@ -57,6 +75,9 @@ class ChatMessage(models.Model):
 
     class Meta:
         ordering = ['timestamp']
+        indexes = [
+            models.Index(fields=['timestamp', 'id'], name='chat_message_ts_idx'),
+        ]
 
     def __str__(self):
         return f"{self.type}: {self.content[:50]}..."
@@ -96,3 +117,41 @@ class EconomicTool(models.Model):
 
     def __str__(self):
         return self.name
+
+class AgentTask(models.Model):
+    """A unit of work for the autonomous agent, persisted so it survives restarts."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (COMPLETED, "Completed"),
+        (FAILED, "Failed"),
+    ]
+
+    task_type = models.CharField(max_length=50)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    priority = models.IntegerField(default=100)  # Lower values run first
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    available_at = models.DateTimeField(default=timezone.now)  # Not claimable before this (retry backoff)
+    leased_by = models.CharField(max_length=100, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['priority', 'available_at']
+        indexes = [
+            models.Index(fields=['status', 'priority', 'available_at'], name='agent_task_claim_idx'),
+            models.Index(fields=['status', 'completed_at'], name='agent_task_finished_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task_type} ({self.status})"
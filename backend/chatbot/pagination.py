@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ConversationMessageCursorPagination(CursorPagination):
+    """Keyset pagination over a conversation's messages, newest first."""
+    ordering = ('-timestamp', '-pk')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+    def get_ordering(self, request, queryset, view):
+        # Messages are a nested listing; the conversation view's filter ordering does not apply
+        return self.ordering
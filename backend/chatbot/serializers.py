@@ -1,31 +1,37 @@
-from rest_framework import serializers
+from backend_project.serializers import SparseModelSerializer
 from .models import ChatMessage, ModuleContext, EconomicTool, ModuleConversation, ModuleConversationMessage
 
-class ModuleConversationMessageSerializer(serializers.ModelSerializer):
+class ModuleConversationMessageSerializer(SparseModelSerializer):
     class Meta:
         model = ModuleConversationMessage
         fields = ['id', 'type', 'content', 'timestamp']
         read_only_fields = ['id', 'timestamp']
 
-class ModuleConversationSerializer(serializers.ModelSerializer):
-    messages = ModuleConversationMessageSerializer(many=True, read_only=True)
+class ModuleConversationSerializer(SparseModelSerializer):
+    """Conversation metadata; messages are read page by page from the ``messages`` action."""
+    class Meta:
+        model = ModuleConversation
+        fields = ['id', 'module', 'title', 'created_at', 'updated_at', 'message_count', 'last_message_preview', 'last_message_at']
+        read_only_fields = ['id', 'created_at', 'updated_at', 'message_count', 'last_message_preview', 'last_message_at']
 
+class ModuleConversationListSerializer(SparseModelSerializer):
+    """Conversation metadata only; messages come from the paginated messages endpoint."""
     class Meta:
         model = ModuleConversation
-        fields = ['id', 'module', 'title', 'created_at', 'updated_at', 'messages']
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        fields = ['id', 'module', 'title', 'created_at', 'updated_at', 'message_count', 'last_message_preview', 'last_message_at']
+        read_only_fields = fields
 
-class ChatMessageSerializer(serializers.ModelSerializer):
+class ChatMessageSerializer(SparseModelSerializer):
     class Meta:
         model = ChatMessage
         fields = '__all__'
 
-class ModuleContextSerializer(serializers.ModelSerializer):
+class ModuleContextSerializer(SparseModelSerializer):
     class Meta:
         model = ModuleContext
         fields = '__all__'
 
-class EconomicToolSerializer(serializers.ModelSerializer):
+class EconomicToolSerializer(SparseModelSerializer):
     class Meta:
         model = EconomicTool
         fields = '__all__'
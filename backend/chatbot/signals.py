@@ -0,0 +1,32 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import ModuleConversation, ModuleConversationMessage
+
+
+@receiver(post_save, sender=ModuleConversationMessage)
+def track_message_created(sender, instance, created, **kwargs):
+    """Keep the conversation's message count and last-message preview current."""
+    if not created:
+        return
+    ModuleConversation.objects.filter(id=instance.conversation_id).update(
+        message_count=F('message_count') + 1,
+        last_message_preview=instance.content[:ModuleConversation.PREVIEW_LENGTH],
+        last_message_at=instance.timestamp,
+    )
+
+
+@receiver(post_delete, sender=ModuleConversationMessage)
+def track_message_deleted(sender, instance, **kwargs):
+    latest = (
+        ModuleConversationMessage.objects.filter(conversation_id=instance.conversation_id)
+        .order_by('-timestamp')
+        .values('content', 'timestamp')
+        .first()
+    )
+    ModuleConversation.objects.filter(id=instance.conversation_id, message_count__gt=0).update(
+        message_count=F('message_count') - 1,
+        last_message_preview=latest['content'][:ModuleConversation.PREVIEW_LENGTH] if latest else '',
+        last_message_at=latest['timestamp'] if latest else None,
+    )
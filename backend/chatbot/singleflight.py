@@ -0,0 +1,127 @@
+import asyncio
+import threading
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent blocking calls that share a key into one upstream call.
+
+    The first caller for a key runs the function; callers arriving while it is in
+    flight block until it finishes and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self):
+        with self._lock:
+            return {'in_flight': len(self._calls), 'leaders': self.leaders, 'coalesced': self.coalesced}
+
+
+class _Broadcast:
+    def __init__(self):
+        self.chunks = []
+        self.done = False
+        self.error = None
+        self.condition = asyncio.Condition()
+        self.task = None
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight for async streams.
+
+    The shared upstream stream runs in its own task, so a waiter that disconnects or is
+    cancelled does not cancel it for everyone else. Chunks are fanned out as they
+    arrive: late joiners first replay what has already arrived.
+    """
+
+    def __init__(self):
+        self._streams = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def stream(self, key, agen_fn):
+        slot = (id(asyncio.get_running_loop()), key)
+        broadcast = self._streams.get(slot)
+        if broadcast is None:
+            broadcast = self._streams[slot] = _Broadcast()
+            broadcast.task = asyncio.ensure_future(self._pump(slot, broadcast, agen_fn))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+
+        position = 0
+        while True:
+            async with broadcast.condition:
+                await broadcast.condition.wait_for(lambda: len(broadcast.chunks) > position or broadcast.done)
+                pending = broadcast.chunks[position:]
+                finished = broadcast.done
+            for chunk in pending:
+                yield chunk
+            position += len(pending)
+            if finished and position >= len(broadcast.chunks):
+                if broadcast.error is not None:
+                    raise broadcast.error
+                return
+
+    async def _pump(self, slot, broadcast, agen_fn):
+        try:
+            async for chunk in agen_fn():
+                async with broadcast.condition:
+                    broadcast.chunks.append(chunk)
+                    broadcast.condition.notify_all()
+        except Exception as e:
+            broadcast.error = e
+        finally:
+            self._streams.pop(slot, None)
+            async with broadcast.condition:
+                broadcast.done = True
+                broadcast.condition.notify_all()
+
+    def stats(self):
+        return {
+            'in_flight': len(self._streams),
+            'leaders': self.leaders,
+            'coalesced': self.coalesced,
+        }
@@ -0,0 +1,194 @@
+import random
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import AgentTask
+
+# Lower runs first; user-facing work jumps ahead of background refreshes
+DEFAULT_PRIORITIES = {
+    'user_request': 10,
+    'conversation_summary': 20,
+    'information_retrieval': 40,
+    'web_search': 50,
+    'data_analysis': 60,
+    'module_update': 100,
+}
+
+
+def _config(name, default):
+    return getattr(settings, 'AGENT_TASK_QUEUE', {}).get(name, default)
+
+
+def enqueue(task: Dict[str, Any], priority: Optional[int] = None, max_attempts: Optional[int] = None) -> AgentTask:
+    """Persist a task dict (as accepted by AutonomousAgent.add_task) on the queue."""
+    task_type = task.get('type', '') or 'general'
+    return AgentTask.objects.create(
+        task_type=task_type,
+        payload=task,
+        priority=DEFAULT_PRIORITIES.get(task_type, 80) if priority is None else priority,
+        max_attempts=max_attempts or _config('MAX_ATTEMPTS', 3),
+    )
+
+
+def is_queued(task_type: str, **payload) -> bool:
+    """True if a pending or running ``task_type`` task has these payload values."""
+    return AgentTask.objects.filter(
+        task_type=task_type,
+        status__in=[AgentTask.PENDING, AgentTask.RUNNING],
+        **{f'payload__{key}': value for key, value in payload.items()},
+    ).exists()
+
+
+def _claimable(now):
+    """Pending tasks that are due, plus running tasks whose worker lost its lease and have attempts left."""
+    return (
+        Q(status=AgentTask.PENDING, available_at__lte=now)
+        | Q(status=AgentTask.RUNNING, lease_expires_at__lt=now, attempts__lt=F('max_attempts'))
+    )
+
+
+def fail_abandoned(now=None) -> int:
+    """
+    Mark FAILED the running tasks whose lease expired on their last allowed attempt.
+
+    A task that kills its worker every time would otherwise be leased again forever.
+    """
+    now = now or timezone.now()
+    return AgentTask.objects.filter(
+        status=AgentTask.RUNNING, lease_expires_at__lt=now, attempts__gte=F('max_attempts'),
+    ).update(
+        status=AgentTask.FAILED,
+        error='Lease expired on the last attempt; the worker did not finish the task',
+        lease_expires_at=None,
+        completed_at=now,
+    )
+
+
+def claim(worker_id: str, lease_seconds: Optional[int] = None) -> Optional[AgentTask]:
+    """
+    Lease the highest-priority due task for ``worker_id``, or return None.
+
+    The claim is a conditional UPDATE on the candidate row, so concurrent workers
+    (threads or separate processes) never run the same task twice.
+    """
+    lease = timedelta(seconds=lease_seconds or _config('LEASE_SECONDS', 300))
+    fail_abandoned()
+    for _ in range(5):
+        now = timezone.now()
+        candidates = list(
+            AgentTask.objects.filter(_claimable(now))
+            .order_by('priority', 'available_at')
+            .values_list('id', flat=True)[:10]
+        )
+        if not candidates:
+            return None
+        for task_id in candidates:
+            claimed = AgentTask.objects.filter(_claimable(now), id=task_id).update(
+                status=AgentTask.RUNNING,
+                leased_by=worker_id,
+                lease_expires_at=now + lease,
+                attempts=F('attempts') + 1,
+                started_at=now,
+            )
+            if claimed:
+                return AgentTask.objects.get(id=task_id)
+    return None
+
+
+def _finish(task: AgentTask, **fields) -> bool:
+    """
+    Write the outcome of ``task`` only if this worker still holds its lease.
+
+    A worker that overran its lease may find the task re-claimed by another worker
+    (status, owner or attempt number changed); its write is then dropped so it cannot
+    overwrite the newer attempt. Returns whether the write applied.
+    """
+    owned = AgentTask.objects.filter(
+        id=task.id, status=AgentTask.RUNNING, leased_by=task.leased_by, attempts=task.attempts,
+    ).update(**fields)
+    if owned:
+        for name, value in fields.items():
+            setattr(task, name, value)
+    return bool(owned)
+
+
+def complete(task: AgentTask, result: Any) -> bool:
+    return _finish(
+        task, status=AgentTask.COMPLETED, result=result, error='',
+        lease_expires_at=None, completed_at=timezone.now(),
+    )
+
+
+def fail(task: AgentTask, error: str) -> bool:
+    """Schedule a retry with exponential backoff and jitter, or mark the task failed for good."""
+    if task.attempts < task.max_attempts:
+        base = _config('RETRY_BACKOFF_SECONDS', 5)
+        delay = min(base * (2 ** (task.attempts - 1)), _config('RETRY_BACKOFF_MAX_SECONDS', 600))
+        available_at = timezone.now() + timedelta(seconds=delay * random.uniform(0.8, 1.2))
+        return _finish(task, status=AgentTask.PENDING, error=error, lease_expires_at=None, available_at=available_at)
+    return _finish(task, status=AgentTask.FAILED, error=error, lease_expires_at=None, completed_at=timezone.now())
+
+
+def status_counts(finished_since: Optional[timedelta] = timedelta(hours=1)) -> Dict[str, int]:
+    """
+    Number of pending and running tasks, and of tasks finished in the last ``finished_since``.
+
+    Finished rows pile up until prune_finished() removes them, so they are only counted
+    over a recent window (a range on agent_task_finished_idx), never the whole table.
+    """
+    counts = {status: 0 for status, _ in AgentTask.STATUS_CHOICES}
+    live = AgentTask.objects.filter(status__in=[AgentTask.PENDING, AgentTask.RUNNING])
+    finished = AgentTask.objects.filter(
+        status__in=[AgentTask.COMPLETED, AgentTask.FAILED],
+        completed_at__gte=timezone.now() - finished_since,
+    )
+    for queryset in (live, finished):
+        for row in queryset.values('status').annotate(total=Count('id')).order_by():
+            counts[row['status']] = row['total']
+    return counts
+
+
+def prune_finished(retention: Optional[timedelta] = None, batch_size: int = 1000) -> int:
+    """
+    Delete completed and failed tasks that finished more than ``retention`` ago.
+
+    Defaults to AGENT_TASK_QUEUE['RETENTION_HOURS']; deletes in batches so no single
+    statement holds the table for long. Returns the number of rows deleted.
+    """
+    if retention is None:
+        retention = timedelta(hours=_config('RETENTION_HOURS', 72))
+    expired = AgentTask.objects.filter(
+        status__in=[AgentTask.COMPLETED, AgentTask.FAILED],
+        completed_at__lt=timezone.now() - retention,
+    )
+    deleted = 0
+    while True:
+        ids = list(expired.values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += AgentTask.objects.filter(id__in=ids).delete()[0]
+
+
+def seconds_until_next_due() -> Optional[float]:
+    """Seconds until the next pending task becomes claimable or a lease expires; None if idle."""
+    now = timezone.now()
+    next_pending = (
+        AgentTask.objects.filter(status=AgentTask.PENDING)
+        .order_by('available_at')
+        .values_list('available_at', flat=True)
+        .first()
+    )
+    next_expiry = (
+        AgentTask.objects.filter(status=AgentTask.RUNNING, lease_expires_at__isnull=False)
+        .order_by('lease_expires_at')
+        .values_list('lease_expires_at', flat=True)
+        .first()
+    )
+    candidates = [moment for moment in (next_pending, next_expiry) if moment is not None]
+    if not candidates:
+        return None
+    return max(0.0, (min(candidates) - now).total_seconds())
@@ -1,3 +1,237 @@
-from django.test import TestCase
+import asyncio
+import json
+from datetime import timedelta
+from unittest.mock import patch
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from backend_project.asgi import application
+
+from market_analysis.models import MarketSegment
+from market_analysis.views import MarketSegmentViewSet
+from . import llm, task_queue
+from .agent import agent
+from .context import context_window
+from .dispatch import ModuleDispatcher
+from .models import AgentTask, ModuleConversation, ModuleConversationMessage
+
+
+class TaskQueueLeaseTests(TestCase):
+    def setUp(self):
+        task_queue.enqueue({'type': 'web_search', 'query': 'rates'}, max_attempts=3)
+
+    def test_owner_records_outcome(self):
+        task = task_queue.claim('worker-a')
+        self.assertTrue(task_queue.complete(task, {'ok': True}))
+        task.refresh_from_db()
+        self.assertEqual(task.status, AgentTask.COMPLETED)
+        self.assertEqual(task.result, {'ok': True})
+
+    def test_stale_worker_cannot_overwrite_reclaimed_task(self):
+        stale = task_queue.claim('worker-a', lease_seconds=1)
+        AgentTask.objects.filter(id=stale.id).update(lease_expires_at=stale.started_at)  # Lease lapses
+        fresh = task_queue.claim('worker-b')
+        self.assertEqual(fresh.id, stale.id)
+
+        self.assertFalse(task_queue.complete(stale, {'late': True}))
+        self.assertFalse(task_queue.fail(stale, 'late failure'))
+        fresh.refresh_from_db()
+        self.assertEqual(fresh.status, AgentTask.RUNNING)
+        self.assertEqual(fresh.leased_by, 'worker-b')
+        self.assertIsNone(fresh.result)
+
+        self.assertTrue(task_queue.fail(fresh, 'boom'))
+        fresh.refresh_from_db()
+        self.assertEqual(fresh.status, AgentTask.PENDING)
+        self.assertEqual(fresh.error, 'boom')
+
+
+    def test_expired_lease_on_last_attempt_fails_the_task(self):
+        AgentTask.objects.update(max_attempts=1)
+        crashed = task_queue.claim('worker-a')
+        AgentTask.objects.filter(id=crashed.id).update(lease_expires_at=crashed.started_at)  # Worker died
+        self.assertIsNone(task_queue.claim('worker-b'))
+        crashed.refresh_from_db()
+        self.assertEqual(crashed.status, AgentTask.FAILED)
+        self.assertEqual(crashed.attempts, 1)
+
+    def test_finished_tasks_are_pruned_and_counted_over_a_window(self):
+        task = task_queue.claim('worker-a')
+        task_queue.complete(task, {'ok': True})
+        self.assertEqual(task_queue.status_counts()[AgentTask.COMPLETED], 1)
+        AgentTask.objects.filter(id=task.id).update(completed_at=timezone.now() - timedelta(days=10))
+        self.assertEqual(task_queue.status_counts()[AgentTask.COMPLETED], 0)
+        live = task_queue.enqueue({'type': 'web_search', 'query': 'jobs'})
+        self.assertEqual(task_queue.prune_finished(timedelta(days=3)), 1)
+        self.assertEqual(list(AgentTask.objects.values_list('id', flat=True)), [live.id])
+
+
+class ModuleDispatcherTests(TestCase):
+    def setUp(self):
+        self.dispatcher = ModuleDispatcher(retrieve_limit=10)
+
+    def test_update_without_resource_is_skipped(self):
+        response = self.dispatcher.update('market_analysis', {'auto_update': True})
+        self.assertTrue(response['skipped'])
+        self.assertIsNone(response['status_code'])
+
+    def test_update_creates_record(self):
+        response = self.dispatcher.update('market_analysis', {
+            'resource': 'market-segments',
+            'record': {'name': 'SMB', 'market_size': 1e6, 'growth_rate': 3.0},
+        })
+        self.assertEqual(response['status_code'], 201)
+        self.assertTrue(MarketSegment.objects.filter(name='SMB').exists())
+
+    def test_retrieve_goes_through_get_queryset(self):
+        MarketSegment.objects.create(name='SMB', market_size=1e6, growth_rate=3.0)
+        MarketSegment.objects.create(name='Enterprise', market_size=5e6, growth_rate=1.0)
+
+        class GrowingSegments(MarketSegmentViewSet):
+            def get_queryset(self):
+                return super().get_queryset().filter(growth_rate__gt=2)
+
+        with patch.object(ModuleDispatcher, '_resources', return_value={'market-segments': GrowingSegments}):
+            data = self.dispatcher.retrieve('market_analysis')
+        self.assertEqual([row['name'] for row in data['market-segments']], ['SMB'])
+
+
+class ConversationDetailTests(TestCase):
+    def test_detail_leaves_messages_to_the_paginated_action(self):
+        conversation = ModuleConversation.objects.create(module='market_analysis', title='Segments')
+        for i in range(30):
+            ModuleConversationMessage.objects.create(conversation=conversation, type='user', content=f'Turn {i}')
+        client = APIClient()
+        detail = client.get(reverse('moduleconversation-detail', args=[conversation.id]))
+        self.assertEqual(detail.status_code, 200)
+        self.assertNotIn('messages', detail.data)
+        self.assertEqual(detail.data['message_count'], 30)
+        page = client.get(reverse('moduleconversation-messages', args=[conversation.id]), {'page_size': 10})
+        self.assertEqual([m['content'] for m in page.data['results']][:2], ['Turn 29', 'Turn 28'])
+        self.assertEqual(len(page.data['results']), 10)
+        self.assertIsNotNone(page.data['next'])
+
+
+class StubProviderTests(TestCase):
+    def setUp(self):
+        self.provider = llm.StubProvider(latency=0, tokens_per_second=1e6, response_tokens=5)
+
+    def test_providers_must_implement_the_interface(self):
+        class Incomplete(llm.LLMProvider):
+            def generate(self, contents, generation_config=None):
+                return ''
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_json_mode_answers_numbered_batches(self):
+        prompt = "Summarize each headline.\n\n1. Rates hold\n2. Exports jump"
+        reply = json.loads(self.provider.generate(prompt, {'response_mime_type': 'application/json'}))
+        self.assertEqual(set(reply), {'1', '2'})
+        self.assertTrue(all(summary.startswith('[stub]') for summary in reply.values()))
+        self.assertEqual(reply, json.loads(self.provider.generate(prompt, {'response_mime_type': 'application/json'})))
+
+    def test_json_mode_without_numbered_lines(self):
+        reply = json.loads(self.provider.generate('Describe the outlook', {'response_mime_type': 'application/json'}))
+        self.assertEqual(list(reply), ['text'])
+
+
+class ConversationSummaryTaskTests(TestCase):
+    def setUp(self):
+        self.conversation = ModuleConversation.objects.create(module='pricing_strategy', title='Pricing')
+        for i in range(context_window.max_turns + 4):
+            ModuleConversationMessage.objects.create(
+                conversation=self.conversation, type='user' if i % 2 == 0 else 'assistant', content=f'Turn {i}',
+            )
+
+    def chat(self, conversation, content='Next question'):
+        with patch.object(llm, 'generate_cached', return_value='Reply'), \
+                patch.object(context_window, 'fold') as fold:
+            response = APIClient().post(reverse('module_chat'), {
+                'conversation': conversation.id, 'content': content, 'module': 'pricing_strategy',
+            }, format='json')
+        self.assertEqual(response.status_code, 200)
+        fold.assert_not_called()
+
+    def test_chat_queues_summary_instead_of_folding_inline(self):
+        self.chat(self.conversation)
+        task = AgentTask.objects.get(task_type='conversation_summary')
+        self.assertEqual(task.payload['conversation'], str(self.conversation.id))
+
+    def test_one_summary_task_per_conversation_while_queued(self):
+        self.chat(self.conversation)
+        self.chat(self.conversation, 'Another question')
+        self.assertEqual(AgentTask.objects.filter(task_type='conversation_summary').count(), 1)
+
+    def test_nothing_queued_while_history_fits_the_window(self):
+        short = ModuleConversation.objects.create(module='pricing_strategy', title='Short')
+        self.chat(short)
+        self.assertFalse(AgentTask.objects.filter(task_type='conversation_summary').exists())
+
+    def test_worker_folds_overflow_into_summary(self):
+        with patch.object(llm, 'generate_text', return_value='Discussed pricing tiers.'):
+            result = agent._execute_task({'type': 'conversation_summary', 'conversation': self.conversation.id})
+        self.assertEqual(result, {'conversation': self.conversation.id, 'folded': True})
+        self.conversation.refresh_from_db()
+        self.assertEqual(self.conversation.summary, 'Discussed pricing tiers.')
+        self.assertIsNotNone(self.conversation.summarized_until)
+
+
+class GatedProvider(llm.LLMProvider):
+    """Streams one token, then holds the rest of the reply until ``release`` is set."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    def generate(self, contents, generation_config=None):
+        raise llm.LLMError('Streaming only')
+
+    async def stream(self, contents, generation_config=None):
+        yield 'First'
+        await self.release.wait()
+        yield ' and the rest'
+
+
+class StreamingASGITests(SimpleTestCase):
+    async def test_tokens_are_sent_before_the_reply_finishes(self):
+        provider = GatedProvider()
+        body = json.dumps({'messages': [{'type': 'user', 'content': 'Streaming check'}], 'context': 'pricing'}).encode()
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'POST', 'scheme': 'http',
+            'path': reverse('generate_response_stream'), 'raw_path': b'', 'query_string': b'', 'root_path': '',
+            'headers': [(b'host', b'testserver'), (b'content-type', b'application/json')],
+            'client': ('127.0.0.1', 1234), 'server': ('testserver', 80),
+        }
+        disconnected = asyncio.Event()
+        received = []
+
+        async def receive():
+            if not received:
+                received.append(True)
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+
+        events = []
+
+        async def send(message):
+            if message['type'] == 'http.response.body' and message.get('body'):
+                events.append(message['body'].decode())
+                # The rest of the reply only exists once the first token has reached the client
+                if 'event: token' in events[-1]:
+                    provider.release.set()
+
+        llm.set_provider(provider)
+        try:
+            # Were the stream buffered until the end, the gate would never open
+            await asyncio.wait_for(application(scope, receive, send), timeout=5)
+        finally:
+            llm.set_provider(None)
+            disconnected.set()
+        stream = ''.join(events)
+        self.assertTrue(events[0].startswith('event: token'))
+        self.assertLess(stream.index('event: token'), stream.index('event: done'))
+        self.assertIn('First and the rest', stream)
@@ -10,7 +10,10 @@ from .views import (
     agent_start,
     agent_stop,
     agent_status,
+    llm_cache_stats,
     module_chat,
+    module_chat_stream,
+    generate_response_stream,
 )
 
 router = DefaultRouter()
@@ -22,8 +25,11 @@ router.register(r'conversation-messages', ModuleConversationMessageViewSet)
 
 urlpatterns = router.urls + [
     path('generate-response/', generate_response, name='generate_response'),
+    path('generate-response/stream/', generate_response_stream, name='generate_response_stream'),
     path('agent/start/', agent_start, name='agent_start'),
     path('agent/stop/', agent_stop, name='agent_stop'),
     path('agent/status/', agent_status, name='agent_status'),
+    path('llm-cache/stats/', llm_cache_stats, name='llm_cache_stats'),
     path('module-chat/', module_chat, name='module_chat'),
+    path('module-chat/stream/', module_chat_stream, name='module_chat_stream'),
 ]
@@ -1,33 +1,66 @@
-import google.generativeai as genai
+import json
+import logging
 from rest_framework import viewsets, status
-from rest_framework.decorators import api_view
+from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
-from django.conf import settings
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from backend_project.response_cache import CachedResponseMixin
 from .models import ChatMessage, ModuleContext, EconomicTool, ModuleConversation, ModuleConversationMessage
 from .serializers import (
     ChatMessageSerializer,
     ModuleContextSerializer,
     EconomicToolSerializer,
     ModuleConversationSerializer,
+    ModuleConversationListSerializer,
     ModuleConversationMessageSerializer,
 )
+from .pagination import ConversationMessageCursorPagination
 from .agent import agent
+from .cache import response_cache
+from .context import context_window, format_transcript
+from . import llm, task_queue
 
-# Configure Gemini API
-genai.configure(api_key=settings.GEMINI_API_KEY)
-model = genai.GenerativeModel('gemini-pro')
+logger = logging.getLogger(__name__)
+
+MODULE_CHAT_GENERATION_CONFIG = {'temperature': 0.7}
 
 class ModuleConversationViewSet(viewsets.ModelViewSet):
     queryset = ModuleConversation.objects.all()
     serializer_class = ModuleConversationSerializer
+    cursor_ordering = ('-updated_at', '-pk')
+    etag_models = (ModuleConversation, ModuleConversationMessage)
 
     def get_queryset(self):
         module = self.request.query_params.get('module')
         queryset = ModuleConversation.objects.all()
         if module:
             queryset = queryset.filter(module=module)
+        if self.action == 'list':
+            queryset = queryset.only(*ModuleConversationListSerializer.Meta.fields)
         return queryset
 
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ModuleConversationListSerializer
+        return ModuleConversationSerializer
+
+    @action(detail=True, methods=['get'])
+    def messages(self, request, pk=None):
+        """Keyset-paginated messages of one conversation, newest first (``?cursor=``, ``?page_size=``)."""
+        conversation = self.get_object()
+        paginator = ConversationMessageCursorPagination()
+        page = paginator.paginate_queryset(
+            ModuleConversationMessage.objects.filter(conversation_id=conversation.id),
+            request,
+            view=self,
+        )
+        return paginator.get_paginated_response(ModuleConversationMessageSerializer(page, many=True).data)
+
     def create(self, request, *args, **kwargs):
         module = request.data.get('module')
         title = request.data.get('title')
@@ -44,6 +77,7 @@ class ModuleConversationViewSet(viewsets.ModelViewSet):
 class ModuleConversationMessageViewSet(viewsets.ModelViewSet):
     queryset = ModuleConversationMessage.objects.all()
     serializer_class = ModuleConversationMessageSerializer
+    cursor_ordering = ('timestamp', 'pk')
 
     def get_queryset(self):
         conversation_id = self.request.query_params.get('conversation')
@@ -96,23 +130,24 @@ def module_chat(request):
     )
 
     try:
-        history = list(conversation.messages.all().exclude(id=user_message.id).values_list('type', 'content'))
+        summary, history = context_window.load(conversation, exclude_id=user_message.id)
         system_prompt = get_module_system_prompt(module)
 
         try:
-            response = model.generate_content(
-                f"{system_prompt}\n\nUser message: {content}",
-                generation_config=genai.types.GenerationConfig(temperature=0.7)
-            )
-            assistant_content = response.text if response else "Unable to generate response"
+            assistant_content = llm.generate_cached(
+                response_cache.make_key(f"{system_prompt}\n{summary}", history, content),
+                build_module_chat_prompt(system_prompt, content, summary, history),
+                generation_config=MODULE_CHAT_GENERATION_CONFIG
+            ) or "Unable to generate response"
         except Exception:
-            assistant_content = f"I'm a {module.replace('_', ' ')} assistant. How can I help you today?"
+            assistant_content = module_greeting(module)
 
         assistant_message = ModuleConversationMessage.objects.create(
             conversation=conversation,
             type='assistant',
             content=assistant_content
         )
+        queue_conversation_summary(conversation)
 
         return Response({
             'user_message': ModuleConversationMessageSerializer(user_message).data,
@@ -122,13 +157,122 @@ def module_chat(request):
         assistant_message = ModuleConversationMessage.objects.create(
             conversation=conversation,
             type='assistant',
-            content=f"I'm a {module.replace('_', ' ')} assistant. I'm here to help with your questions about {module.replace('_', ' ').lower()}."
+            content=module_fallback_reply(module)
         )
         return Response({
             'user_message': ModuleConversationMessageSerializer(user_message).data,
             'assistant_message': ModuleConversationMessageSerializer(assistant_message).data,
         })
 
+@csrf_exempt
+@require_POST
+async def module_chat_stream(request):
+    """Stream the assistant reply for a module conversation as Server-Sent Events.
+
+    Tokens are forwarded as ``token`` events while Gemini generates them; only the
+    finished reply is persisted, and it is sent back in a final ``done`` event.
+    """
+    data = parse_json_body(request)
+    if data is None:
+        return JsonResponse({'error': 'Invalid JSON body'}, status=status.HTTP_400_BAD_REQUEST)
+
+    conversation_id = data.get('conversation')
+    content = data.get('content')
+    module = data.get('module')
+
+    if not all([conversation_id, content, module]):
+        return JsonResponse({'error': 'Missing required fields'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        conversation = await ModuleConversation.objects.aget(id=conversation_id)
+    except ModuleConversation.DoesNotExist:
+        return JsonResponse({'error': 'Conversation not found'}, status=status.HTTP_404_NOT_FOUND)
+
+    user_message = await ModuleConversationMessage.objects.acreate(
+        conversation=conversation,
+        type='user',
+        content=content
+    )
+    summary, history = await sync_to_async(context_window.load)(conversation, exclude_id=user_message.id)
+    system_prompt = get_module_system_prompt(module)
+    cache_key = response_cache.make_key(f"{system_prompt}\n{summary}", history, content)
+    prompt = build_module_chat_prompt(system_prompt, content, summary, history)
+
+    async def event_stream():
+        parts = []
+        try:
+            async for chunk in llm.stream_cached(cache_key, prompt, generation_config=MODULE_CHAT_GENERATION_CONFIG):
+                parts.append(chunk)
+                yield sse_event('token', {'delta': chunk})
+        except Exception:
+            # Keep whatever was already streamed; fall back only if nothing arrived
+            if not parts:
+                parts = [module_greeting(module)]
+
+        assistant_message = await ModuleConversationMessage.objects.acreate(
+            conversation=conversation,
+            type='assistant',
+            content=''.join(parts).strip() or "Unable to generate response"
+        )
+        yield sse_event('done', {
+            'user_message': ModuleConversationMessageSerializer(user_message).data,
+            'assistant_message': ModuleConversationMessageSerializer(assistant_message).data,
+        })
+        await sync_to_async(queue_conversation_summary)(conversation)
+
+    return sse_response(event_stream())
+
+def build_module_chat_prompt(system_prompt, content, summary='', history=()):
+    parts = [system_prompt]
+    if summary:
+        parts.append(f"Conversation summary so far:\n{summary}")
+    if history:
+        parts.append(f"Recent conversation:\n{format_transcript(history)}")
+    parts.append(f"User message: {content}")
+    return "\n\n".join(parts)
+
+def queue_conversation_summary(conversation):
+    """
+    Queue folding of turns that left the context window into the rolling summary.
+
+    Folding may call the LLM, so an agent worker does it off the request path. Nothing
+    is queued while the window still holds every unsummarized turn, or while a fold
+    for the conversation is already queued; never fails the request.
+    """
+    try:
+        conversation_id = str(conversation.id)
+        if not context_window.has_overflow(conversation):
+            return
+        if task_queue.is_queued('conversation_summary', conversation=conversation_id):
+            return
+        agent.add_task({'type': 'conversation_summary', 'conversation': conversation_id})
+    except Exception as e:
+        logger.error(f"Queueing conversation summary failed: {e}")
+
+def module_greeting(module):
+    return f"I'm a {module.replace('_', ' ')} assistant. How can I help you today?"
+
+def module_fallback_reply(module):
+    return f"I'm a {module.replace('_', ' ')} assistant. I'm here to help with your questions about {module.replace('_', ' ').lower()}."
+
+def parse_json_body(request):
+    """Decode a JSON request body for plain (non-DRF) views; returns None if it is malformed."""
+    try:
+        data = json.loads(request.body or b'{}')
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def sse_event(event, payload):
+    return f"event: {event}\ndata: {json.dumps(payload, cls=DjangoJSONEncoder)}\n\n"
+
+def sse_response(events):
+    response = StreamingHttpResponse(events, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop reverse proxies (nginx) from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
 def get_module_system_prompt(module):
     prompts = {
         'market_analysis': 'You are a market analysis expert. Provide insights about market trends, competitive landscape, and market opportunities.',
@@ -140,12 +284,13 @@ def get_module_system_prompt(module):
 class ChatMessageViewSet(viewsets.ModelViewSet):
     queryset = ChatMessage.objects.all()
     serializer_class = ChatMessageSerializer
+    cursor_ordering = ('timestamp', 'pk')
 
-class ModuleContextViewSet(viewsets.ModelViewSet):
+class ModuleContextViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = ModuleContext.objects.all()
     serializer_class = ModuleContextSerializer
 
-class EconomicToolViewSet(viewsets.ModelViewSet):
+class EconomicToolViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = EconomicTool.objects.all()
     serializer_class = EconomicToolSerializer
 
@@ -156,6 +301,58 @@ def generate_response(request):
     context = request.data.get('context', '')
     current_data = request.data.get('currentData', {})
 
+    contents, context_description = build_generate_contents(messages, context, current_data)
+
+    try:
+        # Generate response using Gemini with conversation history
+        response_content = llm.generate_cached(generate_contents_cache_key(contents), contents)
+
+        # Fallback if response is empty
+        if not response_content:
+            response_content = f"As Joseph AI, I'm here to help with {context_description}."
+
+    except Exception as e:
+        # Fallback to simple response if API fails
+        response_content = f"As Joseph AI, I'm here to help with {context_description}."
+
+    return Response({
+        'response': response_content,
+        'timestamp': timezone.now().isoformat()
+    })
+
+@csrf_exempt
+@require_POST
+async def generate_response_stream(request):
+    """Stream a Joseph AI response as Server-Sent Events (``token`` events, then ``done``)"""
+    data = parse_json_body(request)
+    if data is None:
+        return JsonResponse({'error': 'Invalid JSON body'}, status=status.HTTP_400_BAD_REQUEST)
+
+    contents, context_description = build_generate_contents(
+        data.get('messages', []),
+        data.get('context', ''),
+        data.get('currentData', {}),
+    )
+
+    async def event_stream():
+        parts = []
+        try:
+            async for chunk in llm.stream_cached(generate_contents_cache_key(contents), contents):
+                parts.append(chunk)
+                yield sse_event('token', {'delta': chunk})
+        except Exception:
+            pass
+
+        response_content = ''.join(parts).strip() or f"As Joseph AI, I'm here to help with {context_description}."
+        yield sse_event('done', {
+            'response': response_content,
+            'timestamp': timezone.now().isoformat()
+        })
+
+    return sse_response(event_stream())
+
+def build_generate_contents(messages, context, current_data):
+    """Build the Gemini contents list for generate_response; returns (contents, context_description)"""
     # Context descriptions for the AI
     context_descriptions = {
         "economic-forecasting": "Economic indicators, forecasts, and market analysis",
@@ -184,29 +381,23 @@ Please provide helpful, accurate, and contextual responses as Joseph AI. Be prof
     # Prepare contents for Gemini
     contents = [{"role": "user", "parts": [system_prompt]}]  # System message as first user message
 
-    for msg in messages:
-        role = "user" if msg.get('type') == 'user' else "model"
-        content = msg.get('content', '')
-        contents.append({"role": role, "parts": [content]})
+    turns = [("user" if msg.get('type') == 'user' else "model", msg.get('content', '')) for msg in messages]
+    older, recent = context_window.window(turns)
+    if older:
+        # Older client-supplied turns are condensed so the prompt stays within budget
+        contents[0]["parts"][0] += f"\n\nEarlier conversation (condensed):\n{context_window.condense(older)}"
 
-    try:
-        # Generate response using Gemini with conversation history
-        response = model.generate_content(contents)
-        response_content = response.text.strip()
+    for role, content in recent:
+        contents.append({"role": role, "parts": [content]})
 
-        # Fallback if response is empty
-        if not response_content:
-            response_content = f"As Joseph AI, I'm here to help with {context_description}."
+    return contents, context_description
 
-    except Exception as e:
-        # Fallback to simple response if API fails
-        response_content = f"As Joseph AI, I'm here to help with {context_description}."
-
-    from django.utils import timezone
-    return Response({
-        'response': response_content,
-        'timestamp': timezone.now().isoformat()
-    })
+def generate_contents_cache_key(contents):
+    """Response cache key for a generate_response contents list (system prompt, history, last message)"""
+    system_prompt = contents[0]['parts'][0]
+    turns = [(item['role'], item['parts'][0]) for item in contents[1:]]
+    message = turns.pop()[1] if turns else ''
+    return response_cache.make_key(system_prompt, turns, message)
 
 @api_view(['POST'])
 def agent_start(request):
@@ -231,3 +422,14 @@ def agent_status(request):
     """Get the current status of the autonomous agent."""
     status = agent.get_status()
     return Response(status)
+
+@api_view(['GET'])
+def llm_cache_stats(request):
+    """Hit/miss counters of the chatbot LLM response cache and request coalescing for this worker."""
+    return Response({
+        **response_cache.stats(),
+        'coalescing': {
+            'threaded': llm.inflight.stats(),
+            'async': llm.async_inflight.stats(),
+        },
+    })
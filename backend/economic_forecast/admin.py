@@ -1,7 +1,8 @@
 from django.contrib import admin
-from .models import EconomicMetric, EconomicNews, EconomicForecast, EconomicEvent
+from .models import EconomicMetric, EconomicNews, EconomicNewsRollup, EconomicForecast, EconomicEvent
 
 admin.site.register(EconomicMetric)
 admin.site.register(EconomicNews)
+admin.site.register(EconomicNewsRollup)
 admin.site.register(EconomicForecast)
 admin.site.register(EconomicEvent)
@@ -0,0 +1,107 @@
+import json
+import statistics
+import time
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from bs4 import BeautifulSoup
+from django.core.management.base import BaseCommand, CommandError
+from economic_forecast.news.parsing import _available_parser, extract_headlines, parse_headlines
+from economic_forecast.news.sources import SOURCES, SOURCES_BY_KEY
+
+FIXTURE_DIR = Path(__file__).resolve().parents[2] / 'news' / 'html_fixtures'
+
+
+def parse_full_tree(source, html, parser):
+    """Build a tree of the whole page, then look for the headlines in it."""
+    return extract_headlines(source, BeautifulSoup(html, parser))
+
+
+def parse_strained(source, html, parser):
+    """Build only the story elements (see parsing.item_strainer)."""
+    return parse_headlines(source, html, parser=parser)
+
+
+class Command(BaseCommand):
+    help = ('Benchmark headline parsing over the synthetic HTML fixtures (see generate_news_fixtures): '
+            'full versus strained tree on each parser backend, time and peak memory per source')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sources', nargs='+', choices=list(SOURCES_BY_KEY), help='Only benchmark these sources')
+        parser.add_argument('--repeat', type=int, default=20, help='Parses per source and strategy')
+        parser.add_argument('--fixtures', default=str(FIXTURE_DIR), help='Directory holding <source key>.html pages')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def handle(self, *args, **options):
+        sources = [SOURCES_BY_KEY[key] for key in options['sources']] if options.get('sources') else SOURCES
+        # Every tree/parser combination, so the parser backend and the strainer are compared separately
+        parsers = ['html.parser'] + (['lxml'] if _available_parser('lxml') == 'lxml' else [])
+        strategies = {
+            f'{tree}/{parser}': partial(fn, parser=parser)
+            for tree, fn in (('full', parse_full_tree), ('strained', parse_strained))
+            for parser in parsers
+        }
+
+        report = []
+        for source in sources:
+            path = Path(options['fixtures']) / f'{source.key}.html'
+            if not path.exists():
+                raise CommandError(f'No fixture for {source.key} at {path}')
+            html = path.read_bytes()
+            results = {name: self.measure(fn, source, html, options['repeat']) for name, fn in strategies.items()}
+            headlines = [result.pop('headlines') for result in results.values()]
+            if any(h != headlines[0] for h in headlines):
+                raise CommandError(f'Strategies disagree on the headlines for {source.key}')
+            report.append({'source': source.key, 'bytes': len(html), 'headlines': len(headlines[0]),
+                           'strategies': results, 'speedups': self.speedups(results, parsers)})
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        for row in report:
+            self.stdout.write(f"{row['source']} ({row['bytes'] // 1024} KiB, {row['headlines']} headlines)")
+            for name, result in row['strategies'].items():
+                self.stdout.write(f"  {name:<22} median {result['median_ms']:8.2f} ms   peak {result['peak_kib']:9.1f} KiB")
+            for name, speedup in row['speedups'].items():
+                self.stdout.write(self.style.SUCCESS(
+                    f"  {name:<38} {speedup['time']:5.1f}x faster, {speedup['peak_memory']:5.1f}x less peak memory"
+                ))
+        if len(parsers) == 1:
+            self.stdout.write(self.style.WARNING('lxml is not installed; only html.parser was measured'))
+
+    @staticmethod
+    def speedups(results, parsers):
+        """Time and peak-memory ratios that isolate one change each (baseline / candidate)."""
+        pairs = {f'strainer on {parser}': (f'full/{parser}', f'strained/{parser}') for parser in parsers}
+        if 'lxml' in parsers:
+            pairs.update({
+                f'lxml over html.parser ({tree} tree)': (f'{tree}/html.parser', f'{tree}/lxml')
+                for tree in ('full', 'strained')
+            })
+        return {
+            name: {
+                'time': round(results[base]['median_ms'] / results[new]['median_ms'], 2),
+                'peak_memory': round(results[base]['peak_kib'] / max(results[new]['peak_kib'], 0.1), 2),
+            }
+            for name, (base, new) in pairs.items()
+        }
+
+    def measure(self, fn, source, html, repeat):
+        timings = []
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            headlines = fn(source, html)
+            timings.append(time.perf_counter() - started)
+        # Memory is measured on a separate run, since tracing slows parsing down
+        tracemalloc.start()
+        try:
+            fn(source, html)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return {
+            'median_ms': round(statistics.median(timings) * 1000, 3),
+            'min_ms': round(min(timings) * 1000, 3),
+            'peak_kib': round(peak / 1024, 1),
+            'headlines': headlines,
+        }
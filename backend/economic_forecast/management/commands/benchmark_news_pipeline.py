@@ -0,0 +1,94 @@
+import json
+import statistics
+import time
+import uuid
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from chatbot import llm
+from economic_forecast.news.cassette import Cassette
+from economic_forecast.news.pipeline import STAGES, NewsPipeline
+from economic_forecast.news.sources import SOURCES, SOURCES_BY_KEY
+from economic_forecast.news.summarize import HeadlineSummarizer
+
+DEFAULT_CASSETTE = settings.BASE_DIR / 'economic_forecast' / 'news' / 'html_fixtures'
+
+
+class Command(BaseCommand):
+    help = ('Replay recorded responses through fetch, parse, diff, summarize, score and persist, fully offline with '
+            'the stub LLM provider, and report per-stage timings. Database writes are rolled back after each run.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cassette', default=str(DEFAULT_CASSETTE), help='Directory recorded with scrape_news --record')
+        parser.add_argument('--sources', nargs='+', choices=list(SOURCES_BY_KEY), help='Only replay these sources')
+        parser.add_argument('--repeat', type=int, default=5, help='Pipeline runs to time')
+        parser.add_argument('--latency', type=float, default=0.05, help='Stub LLM delay per batch call, seconds')
+        parser.add_argument('--tokens-per-second', type=float, default=200.0, help='Stub LLM token rate')
+        parser.add_argument('--warm-cache', action='store_true',
+                            help='Share the summary cache between runs (default: every run starts cold)')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError('--repeat must be at least 1')
+        sources = [SOURCES_BY_KEY[key] for key in options['sources']] if options.get('sources') else SOURCES
+        cassette = Cassette(options['cassette'])
+        missing = [source.key for source in sources if cassette.load(source) is None]
+        if missing:
+            raise CommandError(f"No recorded response for {', '.join(missing)} in {options['cassette']}")
+
+        cache_prefix = f'news-summary-bench-{uuid.uuid4().hex}'
+        runs = []
+        # Summaries go through the real summarizer (batching, JSON parsing, caching) to the stub provider
+        llm.set_provider(llm.StubProvider(latency=options['latency'], tokens_per_second=options['tokens_per_second']))
+        try:
+            for i in range(options['repeat']):
+                runs.append(self._run(cassette, sources, cache_prefix if options['warm_cache'] else f'{cache_prefix}-{i}'))
+        finally:
+            llm.set_provider(None)
+
+        result = {
+            'runs': len(runs),
+            'sources': [source.key for source in sources],
+            'items_per_run': runs[-1]['items'],
+            'llm_calls_per_run': [run['llm_calls'] for run in runs],
+            'fallbacks_per_run': [run['fallbacks'] for run in runs],
+            'errors': runs[-1]['errors'],
+            'median_ms': {
+                stage: round(statistics.median(run['stages'][stage] for run in runs) * 1000, 2)
+                for stage in STAGES
+            },
+            'total_median_ms': round(statistics.median(run['total'] for run in runs) * 1000, 2),
+        }
+        if options['json']:
+            self.stdout.write(json.dumps(result, indent=2))
+            return
+
+        self.stdout.write(f"Replayed {', '.join(result['sources'])}: {result['items_per_run']} items per run, "
+                          f"{result['runs']} runs, LLM calls per run {result['llm_calls_per_run']}, "
+                          f"fallback summaries per run {result['fallbacks_per_run']}")
+        for stage, ms in result['median_ms'].items():
+            share = ms / result['total_median_ms'] * 100 if result['total_median_ms'] else 0
+            self.stdout.write(f"  {stage:<10} {ms:9.2f} ms  {share:5.1f}%")
+        self.stdout.write(f"  {'total':<10} {result['total_median_ms']:9.2f} ms")
+        for error in result['errors']:
+            self.stdout.write(self.style.WARNING(error))
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _run(self, cassette, sources, cache_prefix):
+        summarizer = HeadlineSummarizer.from_settings()
+        summarizer.key_prefix = cache_prefix
+        pipeline = NewsPipeline(fetch=cassette.player(), summarizer=summarizer)
+        started = time.perf_counter()
+        with transaction.atomic():
+            report = pipeline.run(sources)
+            transaction.set_rollback(True)
+        return {
+            'total': time.perf_counter() - started,
+            'stages': report.timings,
+            'items': report.scraped,
+            'written': report.counts['created'] + report.counts['updated'],
+            'llm_calls': summarizer.llm_calls,
+            'fallbacks': summarizer.fallbacks,
+            'errors': report.errors,
+        }
@@ -0,0 +1,107 @@
+import random
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+FIXTURE_DIR = Path(__file__).resolve().parents[2] / 'news' / 'html_fixtures'
+
+WORDS = ("inflation rates central bank growth markets bond yields trade tariffs jobs labour wages "
+         "oil prices housing credit recession stocks currency deficit budget exports factory output").split()
+
+
+class PageBuilder:
+    """
+    Synthetic news front pages shaped like the scraped sites.
+
+    Each page carries what makes real front pages expensive to parse: inline styles and
+    scripts, a large navigation menu, ad slots between stories and a link-heavy footer,
+    around the 30 story teasers in the markup the source's NewsSource config expects.
+    The text is random words, so the pages are stable test input, not real content.
+    """
+
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+
+    def word(self):
+        return self.random.choice(WORDS)
+
+    def headline(self):
+        return ' '.join(self.word() for _ in range(self.random.randint(6, 11))).capitalize()
+
+    def head(self, title):
+        scripts = ''.join(
+            f'<script>window.__cfg{i} = {{"flags": [{",".join(str(self.random.randint(0, 9999)) for _ in range(80))}]}};</script>\n'
+            for i in range(25)
+        )
+        styles = ''.join(
+            f'.c{i}{{margin:{i}px;padding:{i % 7}px;color:#{self.random.randint(0, 0xffffff):06x}}}' for i in range(900)
+        )
+        return f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>{title}</title><style>{styles}</style>{scripts}</head>'
+
+    def nav(self):
+        return '<header><nav><ul>' + ''.join(
+            f'<li class="nav-item"><a href="/section/{i}">{self.word().title()}</a><ul class="sub">'
+            + ''.join(f'<li><a href="/s/{i}/{j}">{self.word()}</a></li>' for j in range(12))
+            + '</ul></li>'
+            for i in range(20)
+        ) + '</ul></nav></header>'
+
+    def footer(self):
+        return '<footer>' + ''.join(
+            f'<div class="footer-col"><h4>{self.word()}</h4><ul>'
+            + ''.join(f'<li><a href="/f/{i}/{j}">{self.word()}</a></li>' for j in range(15))
+            + '</ul></div>'
+            for i in range(8)
+        ) + '</footer></body></html>'
+
+    def noise(self):
+        return ''.join(
+            f'<div class="ad-slot c{self.random.randint(0, 899)}"><span>{self.headline()}</span>'
+            f'<img src="/img/{self.random.randint(0, 9999)}.jpg" alt=""></div>'
+            for _ in range(40)
+        )
+
+    def article(self, headline, i):
+        return (f'<article class="teaser"><figure><img src="/img/{i}.jpg" alt=""></figure><div class="teaser__text">'
+                f'<p class="flytitle">{self.word().title()}</p><h3><a href="/news/{i}">{headline}</a></h3>'
+                f'<p class="rubric">{self.headline()}. {self.headline()}.</p><time>2026-10-0{i % 9 + 1}</time></div></article>')
+
+    def ft_item(self, headline, i):
+        return (f'<div class="o-teaser o-teaser--small"><div class="o-teaser__content"><div class="o-teaser__meta">'
+                f'<a class="o-teaser__tag" href="/t/{i}">{self.word().title()}</a></div><div class="o-teaser__heading">'
+                f'<a class="js-teaser-heading-link" href="/content/{i}">{headline}</a></div>'
+                f'<p class="o-teaser__standfirst">{self.headline()}</p></div></div>')
+
+    def cnbc_item(self, headline, i):
+        return (f'<div class="Card-standardBreakerCard"><div class="Card-textContent"><div class="Card-titleContainer">'
+                f'<a class="Card-title" href="https://www.cnbc.com/2026/10/{i:02d}/story.html"><div>{headline}</div></a></div>'
+                f'<span class="Card-time">{i} hours ago</span></div></div>')
+
+    def page(self, key, stories=30):
+        make = {'ft': self.ft_item, 'cnbc': self.cnbc_item}.get(key, self.article)
+        body = [self.head(key), '<body>', self.nav(), self.noise(), '<main>']
+        for i in range(stories):
+            body.append(make(self.headline(), i))
+            if i % 5 == 4:
+                body.append(self.noise())
+        body += ['</main>', self.footer()]
+        return ''.join(body)
+
+
+class Command(BaseCommand):
+    help = ('Regenerate the synthetic front pages in news/html_fixtures that benchmark_news_parsing and '
+            'benchmark_news_pipeline read')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=7, help='Random seed; the committed fixtures use the default')
+        parser.add_argument('--output', default=str(FIXTURE_DIR), help='Directory to write <source key>.html into')
+
+    def handle(self, *args, **options):
+        output = Path(options['output'])
+        output.mkdir(parents=True, exist_ok=True)
+        builder = PageBuilder(options['seed'])
+        # One shared random stream in this order, so the default seed reproduces the committed files
+        for key in ('economist', 'reuters', 'bloomberg', 'ft', 'cnbc'):
+            path = output / f'{key}.html'
+            path.write_text(builder.page(key))
+            self.stdout.write(f'Wrote {path} ({path.stat().st_size // 1024} KiB)')
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from economic_forecast.news.retention import cutoff_month, prune_partitions
+
+
+class Command(BaseCommand):
+    help = 'Roll up and delete monthly news partitions older than the retention window (NEWS_ARCHIVE)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retention-months', type=int, default=None, help='Months to keep, including the current one')
+        parser.add_argument('--no-rollup', action='store_true', help='Delete old partitions without keeping their counts')
+        parser.add_argument('--dry-run', action='store_true', help='Only report what would be pruned')
+
+    def handle(self, *args, **options):
+        retention = options['retention_months'] or getattr(settings, 'NEWS_ARCHIVE', {}).get('RETENTION_MONTHS', 6)
+        pruned = prune_partitions(
+            retention_months=retention,
+            rollup=False if options['no_rollup'] else None,
+            dry_run=options['dry_run'],
+        )
+        verb = 'Would prune' if options['dry_run'] else 'Pruned'
+        for entry in pruned:
+            self.stdout.write(f"  {entry['month']:%Y-%m}: {entry['rows']} stories, {entry['groups']} rollup groups")
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {len(pruned)} partitions older than {cutoff_month(retention):%Y-%m} "
+            f"({sum(entry['rows'] for entry in pruned)} stories)"
+        ))
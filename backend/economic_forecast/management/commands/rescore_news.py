@@ -0,0 +1,47 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from backend_project.table_versions import bump_table_version
+from economic_forecast.models import EconomicNews
+from economic_forecast.news.scoring import engine
+
+
+class Command(BaseCommand):
+    help = 'Re-score stored news with the current scoring lexicon (rows scored by an older lexicon version)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help='Also score rows never scored by the engine (such as hand-entered sample data)')
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--dry-run', action='store_true', help='Only count the rows that would be re-scored')
+
+    def handle(self, *args, **options):
+        stale = EconomicNews.objects.exclude(lexicon_version=engine.version)
+        if not options['all']:
+            stale = stale.filter(lexicon_version__isnull=False)
+        if options['dry_run']:
+            self.stdout.write(f"{stale.count()} stories would be re-scored with lexicon {engine.version}")
+            return
+
+        # Walk by primary key so each batch is an index range scan, however large the archive
+        rescored, changed, last_id = 0, 0, 0
+        started = time.perf_counter()
+        while True:
+            batch = list(stale.filter(id__gt=last_id).order_by('id').only('id', 'title', 'summary', 'impact')[:options['batch_size']])
+            if not batch:
+                break
+            scores = engine.score_batch((news.title, news.summary) for news in batch)
+            for news, score in zip(batch, scores):
+                changed += news.impact != score.impact
+                news.impact, news.sentiment, news.lexicon_version = score.impact, score.sentiment, engine.version
+            with transaction.atomic():
+                EconomicNews.objects.bulk_update(batch, ['impact', 'sentiment', 'lexicon_version'])
+                bump_table_version(EconomicNews)
+            rescored += len(batch)
+            last_id = batch[-1].id
+        elapsed = time.perf_counter() - started
+
+        rate = f", {rescored / elapsed:.0f} stories/s" if elapsed and rescored else ''
+        self.stdout.write(self.style.SUCCESS(
+            f"Re-scored {rescored} stories with lexicon {engine.version} ({changed} changed impact{rate})"
+        ))
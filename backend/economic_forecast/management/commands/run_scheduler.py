@@ -1,35 +1,30 @@
-import os
-import django
 from django.core.management.base import BaseCommand
-from django.core.management import call_command
-import schedule
-import time
+from economic_forecast.tasks import schedule_news_retention, schedule_news_scraping
+from economic_forecast.scheduler import JobScheduler
 
 class Command(BaseCommand):
-    help = 'Run the news scraping scheduler every 10 seconds'
+    help = 'Run the news scraping and archive retention jobs (one run at a time, jittered interval, backoff on failures)'
 
     def handle(self, *args, **options):
-        # Set up Django environment
-        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend_project.settings')
-        django.setup()
+        def report(job, duration, error):
+            if error:
+                self.stdout.write(self.style.ERROR(f'Error during {job.name}: {error}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'{job.name} completed successfully'))
+            stats = job.stats()
+            self.stdout.write(
+                f"{job.name}: {duration:.2f}s (avg {stats['avg_duration']:.2f}s, max {stats['max_duration']:.2f}s, "
+                f"{stats['runs']} runs, {stats['failures']} failed, {stats['skipped_overlaps']} skipped); "
+                f"next run in {stats['next_run_in']:.1f}s"
+            )
 
-        def scrape_news_job():
-            self.stdout.write('Running scheduled news scraping...')
-            try:
-                call_command('scrape_news')
-                self.stdout.write(self.style.SUCCESS('News scraping completed successfully'))
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Error during news scraping: {e}'))
-
-        # Schedule the job to run every 10 seconds
-        schedule.every(10).seconds.do(scrape_news_job)
+        scheduler = schedule_news_retention(schedule_news_scraping(JobScheduler(on_run=report)))
 
         self.stdout.write(self.style.SUCCESS('News scraping scheduler started. Press Ctrl+C to stop.'))
 
-        # Run the scheduler
+        # Sleeps until the next job is due instead of polling
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(1)
+            scheduler.run_forever()
         except KeyboardInterrupt:
+            scheduler.stop()
             self.stdout.write(self.style.SUCCESS('Scheduler stopped by user.'))
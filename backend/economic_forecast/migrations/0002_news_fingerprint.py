@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:27
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_fingerprints(apps, schema_editor):
+    EconomicNews = apps.get_model('economic_forecast', 'EconomicNews')
+    seen = set()
+    for news in EconomicNews.objects.order_by('id').iterator():
+        key = news.url or ' '.join(news.title.split()).casefold()
+        fingerprint = hashlib.sha256(f"{news.source}|{key}".encode('utf-8')).hexdigest()
+        if fingerprint in seen:
+            continue  # Duplicate story from the old delete-and-recreate ingest; leave it unkeyed
+        seen.add(fingerprint)
+        EconomicNews.objects.filter(id=news.id).update(fingerprint=fingerprint)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('economic_forecast', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='economicnews',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='economicnews',
+            name='fingerprint',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='economicnews',
+            name='url',
+            field=models.CharField(blank=True, default='', max_length=500),
+        ),
+        migrations.RunPython(backfill_fingerprints, migrations.RunPython.noop),
+    ]
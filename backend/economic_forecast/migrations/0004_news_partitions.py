@@ -0,0 +1,55 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:36
+
+from django.db import migrations, models
+
+
+def backfill_partitions(apps, schema_editor):
+    EconomicNews = apps.get_model('economic_forecast', 'EconomicNews')
+    batch = []
+    for news in EconomicNews.objects.only('id', 'timestamp').iterator(chunk_size=2000):
+        news.partition_month = news.timestamp.date().replace(day=1)
+        batch.append(news)
+        if len(batch) >= 2000:
+            EconomicNews.objects.bulk_update(batch, ['partition_month'])
+            batch = []
+    EconomicNews.objects.bulk_update(batch, ['partition_month'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('economic_forecast', '0003_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EconomicNewsRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('partition_month', models.DateField()),
+                ('source', models.CharField(max_length=100)),
+                ('category', models.CharField(max_length=50)),
+                ('impact', models.CharField(choices=[('high', 'High'), ('medium', 'Medium'), ('low', 'Low')], max_length=10)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('first_timestamp', models.DateTimeField(blank=True, null=True)),
+                ('last_timestamp', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-partition_month', 'source'],
+            },
+        ),
+        migrations.AddField(
+            model_name='economicnews',
+            name='partition_month',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='economicnews',
+            index=models.Index(fields=['partition_month', '-timestamp'], name='news_partition_ts_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='economicnewsrollup',
+            constraint=models.UniqueConstraint(fields=('partition_month', 'source', 'category', 'impact'), name='news_rollup_unique'),
+        ),
+        migrations.RunPython(backfill_partitions, migrations.RunPython.noop),
+    ]
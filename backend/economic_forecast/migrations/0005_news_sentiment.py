@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('economic_forecast', '0004_news_partitions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='economicnews',
+            name='lexicon_version',
+            field=models.CharField(blank=True, max_length=16, null=True),
+        ),
+        migrations.AddField(
+            model_name='economicnews',
+            name='sentiment',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
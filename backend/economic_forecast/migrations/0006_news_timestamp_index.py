@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('economic_forecast', '0005_news_sentiment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='economicnews',
+            index=models.Index(fields=['-timestamp', '-id'], name='news_timestamp_idx'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('economic_forecast', '0006_news_timestamp_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='economicevent',
+            index=models.Index(fields=['-date', '-id'], name='event_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicevent',
+            index=models.Index(fields=['context', '-date', '-id'], name='event_context_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicevent',
+            index=models.Index(fields=['category', '-date', '-id'], name='event_category_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicevent',
+            index=models.Index(fields=['impact', '-date', '-id'], name='event_impact_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicforecast',
+            index=models.Index(fields=['context', 'indicator'], name='forecast_context_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicforecast',
+            index=models.Index(fields=['indicator'], name='forecast_indicator_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicmetric',
+            index=models.Index(fields=['context', 'category'], name='metric_context_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicmetric',
+            index=models.Index(fields=['category'], name='metric_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicnews',
+            index=models.Index(fields=['context', '-timestamp', '-id'], name='news_context_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicnews',
+            index=models.Index(fields=['category', '-timestamp', '-id'], name='news_category_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicnews',
+            index=models.Index(fields=['impact', '-timestamp', '-id'], name='news_impact_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='economicnews',
+            index=models.Index(fields=['source', '-timestamp', '-id'], name='news_source_ts_idx'),
+        ),
+    ]
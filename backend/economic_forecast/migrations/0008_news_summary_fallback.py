@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-17 15:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('economic_forecast', '0007_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='economicnews',
+            name='summary_is_fallback',
+            field=models.BooleanField(blank=True, null=True),
+        ),
+    ]
@@ -1,4 +1,34 @@
+import hashlib
+from datetime import timezone as dt_timezone
+
 from django.db import models
+from django.db.models import Max
+
+
+def news_fingerprint(source, url, title):
+    """Stable identity of a news story: its URL when known, otherwise its normalized title."""
+    key = url or ' '.join(title.split()).casefold()
+    return hashlib.sha256(f"{source}|{key}".encode('utf-8')).hexdigest()
+
+
+def news_partition(timestamp):
+    """Monthly partition of a story: the first day of its UTC month (naive timestamps are taken as UTC)."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(dt_timezone.utc)
+    return timestamp.date().replace(day=1)
+
+
+class EconomicNewsQuerySet(models.QuerySet):
+    def newest_partition(self):
+        return self.aggregate(month=Max('partition_month'))['month']
+
+    def in_partition(self, month):
+        return self.filter(partition_month=month)
+
+    def latest_partition(self):
+        """Stories of the newest month only; both lookups are served by news_partition_ts_idx."""
+        month = self.newest_partition()
+        return self.in_partition(month).order_by('-timestamp') if month else self.none()
 
 class EconomicMetric(models.Model):
     LOCAL = "local"
@@ -29,6 +59,12 @@ class EconomicMetric(models.Model):
     trend = models.CharField(max_length=10, choices=TREND_CHOICES)
     category = models.CharField(max_length=50)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['context', 'category'], name='metric_context_idx'),
+            models.Index(fields=['category'], name='metric_category_idx'),
+        ]
+
     def __str__(self):
         return f"{self.context} - {self.name}"
 
@@ -60,10 +96,66 @@ class EconomicNews(models.Model):
     timestamp = models.DateTimeField()
     impact = models.CharField(max_length=10, choices=IMPACT_CHOICES)
     category = models.CharField(max_length=50)
+    url = models.CharField(max_length=500, blank=True, default='')
+    # Identity of the story (source + URL, or source + title) used to upsert scraped items
+    fingerprint = models.CharField(max_length=64, unique=True, null=True, blank=True)
+    # Hash of the scraped fields; unchanged stories are skipped on re-ingest
+    content_hash = models.CharField(max_length=64, blank=True, default='')
+    # Logical monthly partition (first day of the month of timestamp); see prune_news_archive
+    partition_month = models.DateField(null=True, blank=True, editable=False)
+    # Lexicon sentiment (-1..1) behind impact, and the scoring engine version that produced it.
+    # New columns on this table stay nullable: on SQLite a NOT NULL column forces a table
+    # rebuild, which would drop the full-text index triggers from 0003_search_index.
+    sentiment = models.FloatField(null=True, blank=True)
+    lexicon_version = models.CharField(max_length=16, null=True, blank=True)
+    # True while summary is only the truncated headline (the LLM call failed); such rows
+    # are sent back to the summarizer on later runs even if the story is unchanged
+    summary_is_fallback = models.BooleanField(null=True, blank=True)
+
+    objects = EconomicNewsQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['partition_month', '-timestamp'], name='news_partition_ts_idx'),
+            models.Index(fields=['-timestamp', '-id'], name='news_timestamp_idx'),
+            models.Index(fields=['context', '-timestamp', '-id'], name='news_context_ts_idx'),
+            models.Index(fields=['category', '-timestamp', '-id'], name='news_category_ts_idx'),
+            models.Index(fields=['impact', '-timestamp', '-id'], name='news_impact_ts_idx'),
+            models.Index(fields=['source', '-timestamp', '-id'], name='news_source_ts_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Always derived from the identity fields, so editing a story cannot leave it stale
+        self.fingerprint = news_fingerprint(self.source, self.url, self.title)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'source', 'url', 'title'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'fingerprint'}
+        if self.timestamp:
+            self.partition_month = news_partition(self.timestamp)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.title
 
+class EconomicNewsRollup(models.Model):
+    """Story counts of a pruned news partition, kept after its rows are deleted."""
+    partition_month = models.DateField()
+    source = models.CharField(max_length=100)
+    category = models.CharField(max_length=50)
+    impact = models.CharField(max_length=10, choices=EconomicNews.IMPACT_CHOICES)
+    count = models.PositiveIntegerField(default=0)
+    first_timestamp = models.DateTimeField(null=True, blank=True)
+    last_timestamp = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-partition_month', 'source']
+        constraints = [
+            models.UniqueConstraint(fields=['partition_month', 'source', 'category', 'impact'], name='news_rollup_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.partition_month:%Y-%m} {self.source} ({self.count})"
+
 class EconomicForecast(models.Model):
     LOCAL = "local"
     NATIONAL = "national"
@@ -84,6 +176,12 @@ class EconomicForecast(models.Model):
     range_low = models.FloatField()
     range_high = models.FloatField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['context', 'indicator'], name='forecast_context_idx'),
+            models.Index(fields=['indicator'], name='forecast_indicator_idx'),
+        ]
+
     def __str__(self):
         return f"{self.context} - {self.indicator} Forecast"
 
@@ -115,5 +213,13 @@ class EconomicEvent(models.Model):
     impact = models.CharField(max_length=10, choices=IMPACT_CHOICES)
     category = models.CharField(max_length=50)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-date', '-id'], name='event_date_idx'),
+            models.Index(fields=['context', '-date', '-id'], name='event_context_date_idx'),
+            models.Index(fields=['category', '-date', '-id'], name='event_category_date_idx'),
+            models.Index(fields=['impact', '-date', '-id'], name='event_impact_date_idx'),
+        ]
+
     def __str__(self):
         return self.title
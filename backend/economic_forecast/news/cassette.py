@@ -0,0 +1,51 @@
+import json
+from pathlib import Path
+from typing import Optional
+
+from .fetch import FetchResult, fetch_source
+from .sources import NewsSource
+
+
+class Cassette:
+    """
+    Raw responses for each source, saved for offline replay.
+
+    A source is stored as ``<key>.html`` (the body as received) plus ``<key>.json``
+    (url and status). The synthetic pages in news/html_fixtures form a cassette too; the
+    metadata file is optional on replay.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def _paths(self, source: NewsSource):
+        return self.directory / f'{source.key}.html', self.directory / f'{source.key}.json'
+
+    def save(self, result: FetchResult) -> None:
+        body_path, meta_path = self._paths(result.source)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(result.content)
+        meta_path.write_text(json.dumps({'url': result.source.url, 'status_code': result.status_code}, indent=2))
+
+    def load(self, source: NewsSource) -> Optional[FetchResult]:
+        body_path, meta_path = self._paths(source)
+        if not body_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text()) if meta_path.exists() else {}
+        return FetchResult(source, body_path.read_bytes(), meta.get('status_code', 200))
+
+    def recorder(self, fetch=None):
+        """A fetch function for fetch_sources() that saves every successful response."""
+        def record(source, timeout, cache=None):
+            result = (fetch or fetch_source)(source, timeout)
+            if result.ok and result.content is not None:
+                self.save(result)
+            return result
+        return record
+
+    def player(self):
+        """A fetch function for fetch_sources() that answers from the cassette, never the network."""
+        def replay(source, timeout, cache=None):
+            result = self.load(source)
+            return result or FetchResult(source, error=f'No recorded response for {source.key} in {self.directory}')
+        return replay
@@ -0,0 +1,157 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+from typing import Dict, Iterable, List, Optional
+
+import requests
+from django.conf import settings
+
+from .http_cache import CacheEntry, HTTPCache, entry_from_headers
+from .sources import NewsSource
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one source in a scrape run."""
+    source: NewsSource
+    content: Optional[bytes] = None
+    status_code: Optional[int] = None
+    elapsed: float = 0.0
+    error: str = ''
+    # Page is unchanged since the last stored run (fresh cache hit or 304), so there is nothing to parse
+    not_modified: bool = False
+    # Validators to save once the page has been processed; see store_fetched()
+    cache_entry: Optional[CacheEntry] = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and (self.content is not None or self.not_modified)
+
+
+class SourceStats:
+    """Cumulative per-source fetch latency and failure counts for this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, result: FetchResult) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(result.source.key, {
+                'fetches': 0,
+                'failures': 0,
+                'consecutive_failures': 0,
+                'total_seconds': 0.0,
+                'max_seconds': 0.0,
+                'last_error': '',
+            })
+            stats['fetches'] += 1
+            stats['total_seconds'] += result.elapsed
+            stats['max_seconds'] = max(stats['max_seconds'], result.elapsed)
+            if result.not_modified:
+                stats['not_modified'] = stats.get('not_modified', 0) + 1
+            if result.ok:
+                stats['consecutive_failures'] = 0
+            else:
+                stats['failures'] += 1
+                stats['consecutive_failures'] += 1
+                stats['last_error'] = result.error
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                key: {**stats, 'avg_seconds': round(stats['total_seconds'] / stats['fetches'], 3)}
+                for key, stats in self._stats.items()
+            }
+
+
+source_stats = SourceStats()
+
+
+def _config(name, default):
+    return getattr(settings, 'NEWS_SCRAPER', {}).get(name, default)
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    directory = _config('HTTP_CACHE_DIR', None)
+    return HTTPCache(directory) if directory else None
+
+
+def fetch_source(source: NewsSource, timeout, cache: Optional[HTTPCache] = None) -> FetchResult:
+    """
+    Fetch one source, revalidating against ``cache`` when given.
+
+    A page still fresh per Cache-Control is not requested at all; otherwise the stored
+    ETag/Last-Modified are sent and a 304 comes back as ``not_modified``.
+    """
+    started = time.perf_counter()
+    entry = cache.get(source.url) if cache else None
+    if entry and entry.fresh:
+        return FetchResult(source, status_code=200, elapsed=time.perf_counter() - started, not_modified=True)
+    headers = {**source.headers, **(entry.conditional_headers() if entry else {})}
+    try:
+        response = requests.get(source.url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entry:
+            return FetchResult(source, status_code=304, elapsed=time.perf_counter() - started, not_modified=True,
+                               cache_entry=entry_from_headers(source.url, response.headers, entry))
+        response.raise_for_status()
+        return FetchResult(source, response.content, response.status_code, time.perf_counter() - started,
+                           cache_entry=entry_from_headers(source.url, response.headers))
+    except requests.RequestException as e:
+        status_code = e.response.status_code if e.response is not None else None
+        return FetchResult(source, status_code=status_code, elapsed=time.perf_counter() - started, error=str(e))
+
+
+def fetch_sources(sources: Iterable[NewsSource], fetch=None, deadline: Optional[float] = None,
+                  cache: Optional[HTTPCache] = None) -> List[FetchResult]:
+    """
+    Fetch every source concurrently on a bounded thread pool.
+
+    Each request gets its own connect/read timeouts, and the whole fan-out is cut off
+    at ``deadline`` seconds: sources still outstanding then are reported as timed out,
+    so one hung site cannot hold up the run.
+    """
+    sources = list(sources)
+    fetch = fetch or partial(fetch_source, cache=cache)
+    timeout = (_config('CONNECT_TIMEOUT', 3.05), _config('READ_TIMEOUT', 10))
+    deadline = deadline if deadline is not None else _config('DEADLINE_SECONDS', 20)
+    started = time.perf_counter()
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(_config('MAX_WORKERS', 8), len(sources) or 1)))
+    try:
+        futures = {pool.submit(fetch, source, timeout): source for source in sources}
+        wait(futures, timeout=deadline)
+    finally:
+        # Do not block on stragglers; their own read timeouts will end them
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for future, source in futures.items():
+        if future.done() and not future.cancelled():
+            error = future.exception()
+            result = future.result() if error is None else FetchResult(source, elapsed=time.perf_counter() - started, error=str(error))
+        else:
+            result = FetchResult(source, elapsed=time.perf_counter() - started, error=f'Global deadline of {deadline}s exceeded')
+        source_stats.record(result)
+        results.append(result)
+    return results
+
+
+def store_fetched(results: Iterable[FetchResult], cache: Optional[HTTPCache]) -> None:
+    """
+    Save validators and bodies of fetched pages to ``cache``.
+
+    Call only after the pages were parsed and stored: a page cached before its stories
+    were saved would come back as 304 next run and its stories would be lost.
+    """
+    if cache is None:
+        return
+    for result in results:
+        if not result.ok:
+            continue
+        if result.cache_entry is not None:
+            cache.store(result.cache_entry, None if result.not_modified else result.content)
+        elif not result.not_modified:
+            cache.delete(result.source.url)  # Response forbade storing; drop any older copy
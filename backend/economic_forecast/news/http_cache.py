@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+_MAX_AGE = re.compile(r'(?:^|,)\s*max-age\s*=\s*"?(\d+)"?', re.IGNORECASE)
+
+
+@dataclass
+class CacheEntry:
+    """Validators and freshness of one cached page; the body is stored next to it."""
+    url: str
+    etag: str = ''
+    last_modified: str = ''
+    stored_at: float = 0.0
+    max_age: int = 0
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.stored_at + self.max_age
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+def parse_cache_control(value: str):
+    """Return ``(storable, max_age)`` for a Cache-Control header value."""
+    directives = value.lower()
+    if 'no-store' in directives:
+        return False, 0
+    if 'no-cache' in directives:
+        return True, 0
+    match = _MAX_AGE.search(value)
+    return True, int(match.group(1)) if match else 0
+
+
+def entry_from_headers(url: str, headers, previous: Optional[CacheEntry] = None) -> Optional[CacheEntry]:
+    """
+    Build a cache entry from response headers, or None if the page must not be stored.
+
+    A 304 may omit validators it did not change, so missing ones are kept from ``previous``.
+    """
+    storable, max_age = parse_cache_control(headers.get('Cache-Control', ''))
+    if not storable:
+        return None
+    entry = CacheEntry(
+        url=url,
+        etag=headers.get('ETag', '') or (previous.etag if previous else ''),
+        last_modified=headers.get('Last-Modified', '') or (previous.last_modified if previous else ''),
+        stored_at=time.time(),
+        max_age=max_age,
+    )
+    if not (entry.etag or entry.last_modified or entry.max_age):
+        return None  # Nothing to revalidate with and never fresh, so not worth keeping
+    return entry
+
+
+class HTTPCache:
+    """
+    On-disk private HTTP cache for scraper fetches, keyed by URL.
+
+    Each page is kept as ``<sha256(url)>.json`` (validators and freshness) plus
+    ``<sha256(url)>.body``. Files are replaced atomically, so a crashed run never
+    leaves a half-written entry.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / f'{key}.json', self.directory / f'{key}.body'
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        meta_path, body_path = self._paths(url)
+        try:
+            entry = CacheEntry(**json.loads(meta_path.read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+        return entry if entry.url == url and body_path.exists() else None
+
+    def body(self, url: str) -> Optional[bytes]:
+        try:
+            return self._paths(url)[1].read_bytes()
+        except OSError:
+            return None
+
+    def store(self, entry: CacheEntry, body: Optional[bytes] = None) -> None:
+        """Save an entry; ``body`` may be omitted to only refresh the validators after a 304."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        meta_path, body_path = self._paths(entry.url)
+        if body is not None:
+            self._write(body_path, body)
+        self._write(meta_path, json.dumps(asdict(entry)).encode('utf-8'))
+
+    def delete(self, url: str) -> None:
+        for path in self._paths(url):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _write(self, path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
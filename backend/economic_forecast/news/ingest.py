@@ -0,0 +1,86 @@
+import hashlib
+import json
+from typing import Dict, Iterable, List
+
+from django.db import transaction
+
+from backend_project.table_versions import bump_table_version
+
+from economic_forecast.models import EconomicNews, news_fingerprint, news_partition
+
+# Scraped fields that define whether a story changed; the LLM summary is derived, not scraped
+CONTENT_FIELDS = ('title', 'url', 'source', 'category', 'context')
+# Columns refreshed when a known story changes; timestamp keeps the first-seen time
+UPDATE_FIELDS = ['title', 'url', 'summary', 'impact', 'sentiment', 'lexicon_version', 'category', 'context', 'content_hash',
+                 'summary_is_fallback']
+
+
+def prepare_item(item: Dict) -> Dict:
+    """Fill in the fingerprint and content hash of a scraped item dict (in place)."""
+    item['title'] = item['title'][:EconomicNews._meta.get_field('title').max_length]
+    item.setdefault('url', '')
+    item['fingerprint'] = news_fingerprint(item['source'], item['url'], item['title'])
+    if item.get('timestamp'):
+        item['partition_month'] = news_partition(item['timestamp'])
+    payload = json.dumps([item.get(name, '') for name in CONTENT_FIELDS])
+    item['content_hash'] = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    return item
+
+
+def changed_items(items: List[Dict]) -> List[Dict]:
+    """
+    Keep only items that are new, whose scraped content differs from the stored row, or
+    whose stored summary is a fallback truncation still waiting for the LLM.
+
+    Call before summarization so unchanged stories cost neither an LLM call nor a write.
+    """
+    unique = {}
+    for item in items:
+        prepare_item(item)
+        unique.setdefault(item['fingerprint'], item)
+    rows = EconomicNews.objects.filter(fingerprint__in=list(unique)).values_list(
+        'fingerprint', 'content_hash', 'summary_is_fallback'
+    )
+    # A stored row is current when its content matches and its summary is a real one
+    current = {fingerprint: content_hash for fingerprint, content_hash, is_fallback in rows if not is_fallback}
+    return [item for fingerprint, item in unique.items() if current.get(fingerprint) != item['content_hash']]
+
+
+def fallback_items(source_names: Iterable[str], exclude: Iterable[str] = (), limit: int = 200) -> List[Dict]:
+    """
+    Stored stories of ``source_names`` whose summary is still a fallback, as item dicts.
+
+    Lets the pipeline retry them when their page was not re-parsed (HTTP 304); the most
+    recent ``limit`` are returned so a long LLM outage does not grow every later run.
+    """
+    rows = (
+        EconomicNews.objects.filter(source__in=list(source_names), summary_is_fallback=True)
+        .exclude(fingerprint__in=list(exclude))
+        .order_by('-timestamp')
+        .values('title', 'url', 'source', 'category', 'timestamp', 'context')[:limit]
+    )
+    return [prepare_item(dict(row)) for row in rows]
+
+
+def upsert_news(items: List[Dict]) -> Dict[str, int]:
+    """
+    Insert new stories and update changed ones in a single transaction.
+
+    Nothing is deleted, so readers never see the table empty mid-run. Returns counts
+    of created and updated rows.
+    """
+    items = [prepare_item(item) for item in items]
+    if not items:
+        return {'created': 0, 'updated': 0}
+    fingerprints = [item['fingerprint'] for item in items]
+    with transaction.atomic():
+        existing = set(EconomicNews.objects.filter(fingerprint__in=fingerprints).values_list('fingerprint', flat=True))
+        EconomicNews.objects.bulk_create(
+            [EconomicNews(**item) for item in items],
+            update_conflicts=True,
+            unique_fields=['fingerprint'],
+            update_fields=UPDATE_FIELDS,
+        )
+        bump_table_version(EconomicNews)  # bulk_create sends no save signals
+    updated = len(existing)
+    return {'created': len(items) - updated, 'updated': updated}
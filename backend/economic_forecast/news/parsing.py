@@ -0,0 +1,56 @@
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from django.conf import settings
+
+from .sources import NewsSource
+
+
+@lru_cache(maxsize=None)
+def _available_parser(preferred: str) -> str:
+    if preferred == 'lxml':
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            return 'html.parser'
+    return preferred
+
+
+def html_parser() -> str:
+    """Tree builder for scraped pages: lxml (C, much faster) when installed, else html.parser."""
+    return _available_parser(getattr(settings, 'NEWS_SCRAPER', {}).get('HTML_PARSER', 'lxml'))
+
+
+def item_strainer(source: NewsSource) -> SoupStrainer:
+    """Only the elements wrapping a story (and their children) are built into the tree."""
+    if source.item_class:
+        return SoupStrainer(source.item_tag, class_=source.item_class)
+    return SoupStrainer(source.item_tag)
+
+
+def parse_headlines(source: NewsSource, html: bytes, parser: Optional[str] = None) -> List[Dict[str, str]]:
+    """Extract up to ``source.limit`` headlines as ``{'title', 'link'}`` dicts from a page."""
+    soup = BeautifulSoup(html, parser or html_parser(), parse_only=item_strainer(source))
+    return extract_headlines(source, soup)
+
+
+def extract_headlines(source: NewsSource, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    items = soup.find_all(source.item_tag, class_=source.item_class, limit=source.limit) if source.item_class \
+        else soup.find_all(source.item_tag, limit=source.limit)
+
+    headlines = []
+    for item in items:
+        title_elem = None
+        for tag in source.title_tags:
+            title_elem = item.find(tag, class_=source.title_class) if source.title_class else item.find(tag)
+            if title_elem:
+                break
+        if not title_elem:
+            continue
+        link_elem = title_elem if title_elem.name == 'a' else item.find('a')
+        headlines.append({
+            'title': title_elem.get_text().strip(),
+            'link': link_elem.get('href', '') if link_elem else '',
+        })
+    return headlines
@@ -0,0 +1,118 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+from django.utils import timezone
+
+from .fetch import FetchResult, fetch_sources, store_fetched
+from .http_cache import HTTPCache
+from .ingest import changed_items, fallback_items, upsert_news
+from .parsing import parse_headlines
+from .scoring import ScoringEngine, engine
+from .sources import NewsSource
+from .summarize import HeadlineSummarizer
+
+STAGES = ('fetch', 'parse', 'diff', 'summarize', 'score', 'persist')
+
+
+def items_from_result(result: FetchResult) -> List[Dict]:
+    """Turn one fetched page into EconomicNews field dicts (summary and impact are added later)."""
+    source = result.source
+    return [
+        {
+            'title': headline['title'],
+            'url': urljoin(source.url, headline['link']) if headline['link'] else '',
+            'source': source.name,
+            'category': source.category,
+            'timestamp': timezone.now(),
+            'context': source.context,
+        }
+        for headline in parse_headlines(source, result.content)
+    ]
+
+
+@dataclass
+class PipelineReport:
+    results: List[FetchResult] = field(default_factory=list)
+    scraped: int = 0
+    pending: int = 0
+    counts: Dict[str, int] = field(default_factory=lambda: {'created': 0, 'updated': 0})
+    errors: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def not_modified(self) -> int:
+        return sum(result.not_modified for result in self.results)
+
+
+class NewsPipeline:
+    """
+    One scrape run: fetch -> parse -> diff against stored rows -> summarize -> score -> persist.
+
+    ``fetch`` replaces the network fetch (see news.cassette for record/replay), and
+    each stage's wall time is reported in ``PipelineReport.timings``.
+    """
+
+    def __init__(self, fetch=None, http_cache: Optional[HTTPCache] = None,
+                 summarizer: Optional[HeadlineSummarizer] = None, scorer: Optional[ScoringEngine] = None,
+                 deadline: Optional[float] = None):
+        self.fetch = fetch
+        self.http_cache = http_cache
+        self.summarizer = summarizer or HeadlineSummarizer.from_settings()
+        self.scorer = scorer or engine
+        self.deadline = deadline
+
+    def run(self, sources: Iterable[NewsSource]) -> PipelineReport:
+        report = PipelineReport()
+        with self._stage(report, 'fetch'):
+            report.results = fetch_sources(sources, fetch=self.fetch, deadline=self.deadline, cache=self.http_cache)
+
+        items = []
+        with self._stage(report, 'parse'):
+            for result in report.results:
+                if result.not_modified:
+                    continue  # Page unchanged since it was last stored; nothing to parse or summarize
+                if not result.ok:
+                    report.errors.append(f"Error scraping {result.source.name}: {result.error}")
+                    continue
+                try:
+                    items.extend(items_from_result(result))
+                except Exception as e:
+                    report.errors.append(f"Error scraping {result.source.name}: {e}")
+        report.scraped = len(items)
+
+        # Only new or changed stories, and stories still on a fallback summary, are summarized and written
+        with self._stage(report, 'diff'):
+            pending = changed_items(items)
+            unparsed = [result.source.name for result in report.results if result.not_modified]
+            if unparsed:
+                pending.extend(fallback_items(unparsed, exclude=[item['fingerprint'] for item in pending]))
+        report.pending = len(pending)
+
+        with self._stage(report, 'summarize'):
+            summaries = self.summarizer.summarize(item['title'] for item in pending)  # Use title as base for summary
+            for item in pending:
+                item['summary'] = summaries[item['title']]
+                item['summary_is_fallback'] = item['title'] in summaries.fallbacks
+
+        with self._stage(report, 'score'):
+            scores = self.scorer.score_batch((item['title'], item['summary']) for item in pending)
+            for item, score in zip(pending, scores):
+                item['impact'] = score.impact
+                item['sentiment'] = score.sentiment
+                item['lexicon_version'] = self.scorer.version
+
+        with self._stage(report, 'persist'):
+            report.counts = upsert_news(pending)
+            store_fetched(report.results, self.http_cache)
+        return report
+
+    @contextmanager
+    def _stage(self, report: PipelineReport, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            report.timings[name] = time.perf_counter() - started
@@ -0,0 +1,89 @@
+from datetime import date
+from typing import Dict, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Max, Min
+from django.utils import timezone
+
+from economic_forecast.models import EconomicNews, EconomicNewsRollup
+
+
+def _config(name, default):
+    return getattr(settings, 'NEWS_ARCHIVE', {}).get(name, default)
+
+
+def cutoff_month(retention_months: int, today: Optional[date] = None) -> date:
+    """First month still retained: the current month counts as one of ``retention_months``."""
+    today = today or timezone.now().date()
+    months = today.year * 12 + today.month - 1 - (max(retention_months, 1) - 1)
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def rollup_rows(month: date, ids: List[int]) -> Set[Tuple[str, str, str]]:
+    """
+    Add the stories ``ids`` of partition ``month`` to EconomicNewsRollup.
+
+    Returns the (source, category, impact) groups touched. Call in the same transaction
+    that deletes those rows, so every deleted story is counted exactly once.
+    """
+    groups = (
+        EconomicNews.objects.filter(id__in=ids)
+        .values('source', 'category', 'impact')
+        .annotate(count=Count('id'), first=Min('timestamp'), last=Max('timestamp'))
+        .order_by()
+    )
+    touched = set()
+    for group in groups:
+        rollup, created = EconomicNewsRollup.objects.get_or_create(
+            partition_month=month, source=group['source'], category=group['category'], impact=group['impact'],
+            defaults={'count': group['count'], 'first_timestamp': group['first'], 'last_timestamp': group['last']},
+        )
+        if not created:
+            # Earlier batches or late stories for an already pruned month: add to the counts
+            EconomicNewsRollup.objects.filter(pk=rollup.pk).update(
+                count=F('count') + group['count'],
+                first_timestamp=min(filter(None, [rollup.first_timestamp, group['first']])),
+                last_timestamp=max(filter(None, [rollup.last_timestamp, group['last']])),
+            )
+        touched.add((group['source'], group['category'], group['impact']))
+    return touched
+
+
+def prune_partitions(retention_months: Optional[int] = None, rollup: Optional[bool] = None,
+                     batch_size: Optional[int] = None, dry_run: bool = False) -> List[Dict]:
+    """
+    Drop news partitions older than the retention window, rolling each up first.
+
+    Rows go in batches of ``batch_size`` so a large month never holds a long write
+    lock; each batch is added to the rollup and deleted by the same ids in one
+    transaction, so a run that stops midway neither loses nor double-counts stories.
+    Returns one ``{'month', 'rows', 'groups'}`` entry per partition.
+    """
+    retention_months = retention_months or _config('RETENTION_MONTHS', 6)
+    rollup = _config('ROLLUP', True) if rollup is None else rollup
+    batch_size = batch_size or _config('DELETE_BATCH_SIZE', 5000)
+    cutoff = cutoff_month(retention_months)
+
+    months = (
+        EconomicNews.objects.filter(partition_month__lt=cutoff)
+        .values_list('partition_month', flat=True).distinct().order_by('partition_month')
+    )
+    pruned = []
+    for month in months:
+        partition = EconomicNews.objects.in_partition(month)
+        if dry_run:
+            pruned.append({'month': month, 'rows': partition.count(), 'groups': 0})
+            continue
+        rows, groups = 0, set()
+        while True:
+            with transaction.atomic():
+                ids = list(partition.select_for_update().values_list('id', flat=True)[:batch_size])
+                if not ids:
+                    break
+                if rollup:
+                    groups |= rollup_rows(month, ids)
+                EconomicNews.objects.filter(id__in=ids).delete()
+                rows += len(ids)
+        pruned.append({'month': month, 'rows': rows, 'groups': len(groups)})
+    return pruned
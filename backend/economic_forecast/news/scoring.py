@@ -0,0 +1,145 @@
+import hashlib
+import json
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Base terms and weights (positive = good news for the economy). Inflected forms such as
+# "rises", "rising" and "rose" are added by _variants or listed explicitly.
+POSITIVE_TERMS = {
+    'rise': 1.0, 'rose': 1.0, 'increase': 0.8, 'growth': 1.0, 'grow': 1.0, 'grew': 1.0, 'surge': 1.5,
+    'boost': 1.0, 'gain': 1.0, 'rally': 1.5, 'rebound': 1.2, 'recover': 1.2, 'recovery': 1.2,
+    'strong': 1.0, 'stronger': 1.0, 'strengthen': 1.0, 'beat': 0.8, 'upgrade': 1.2, 'expand': 0.8,
+    'expansion': 0.8, 'jump': 1.2, 'soar': 1.5, 'climb': 1.0, 'optimism': 1.0, 'optimistic': 1.0,
+    'hire': 0.8, 'improve': 0.8, 'profit': 0.8, 'up': 0.6, 'positive': 0.8, 'outperform': 1.0,
+    'stimulus': 0.8, 'record high': 1.5, 'rate cut': 1.0, 'job gains': 1.2, 'trade deal': 1.0,
+    'easing': 0.6, 'robust': 1.0, 'upbeat': 1.0, 'resilient': 0.8, 'inflation cool': 1.0, 'inflation ease': 1.0,
+}
+NEGATIVE_TERMS = {
+    'fall': -1.0, 'fell': -1.0, 'decline': -1.0, 'drop': -1.0, 'crash': -2.0, 'slump': -1.5, 'loss': -1.0,
+    'down': -0.6, 'negative': -0.8, 'weak': -1.0, 'weaker': -1.0, 'weaken': -1.0, 'recession': -2.0,
+    'layoff': -1.5, 'default': -1.5, 'bankruptcy': -2.0, 'plunge': -1.8, 'tumble': -1.5, 'sink': -1.2,
+    'sank': -1.2, 'slide': -1.0, 'contraction': -1.2, 'downgrade': -1.2, 'deficit': -0.6, 'shortage': -1.0,
+    'crisis': -1.8, 'fear': -1.0, 'slowdown': -1.2, 'slow': -0.6, 'miss': -0.8, 'warn': -0.8,
+    'warning': -0.8, 'selloff': -1.5, 'sell off': -1.5, 'rate hike': -0.8, 'stagnation': -1.2,
+    'unemployment': -0.6, 'job cuts': -1.5, 'cut jobs': -1.5, 'sanctions': -0.8, 'tariff': -0.5,
+    'inflation': -0.4, 'turmoil': -1.5, 'volatility': -0.6, 'shutdown': -1.2, 'growth slow': -1.2,
+    'slower growth': -1.2,
+}
+NEGATORS = frozenset({'not', 'no', 'never', 'without', "isn't", "aren't", "didn't", "doesn't", "won't", 'fails', 'failed'})
+NEGATION_WINDOW = 2
+
+
+def _variants(term: str) -> List[str]:
+    """Regular inflections of the last word of a term: rise -> rises, rised, rising."""
+    *head, word = term.split()
+    forms = {word, word + 's', word + 'es', word + 'ed', word + 'ing'}
+    if word.endswith('e'):
+        forms |= {word + 'd', word[:-1] + 'ing'}
+    if re.search(r'[^aeiou][aeiou][bdgmnpt]$', word):
+        forms |= {word + word[-1] + 'ed', word + word[-1] + 'ing'}  # drop -> dropped, dropping
+    if word.endswith('y'):
+        forms |= {word[:-1] + 'ies', word[:-1] + 'ied'}
+    return [' '.join([*head, form]) for form in forms]
+
+
+def build_lexicon(terms: Dict[str, float]) -> Dict[str, float]:
+    lexicon = {}
+    for term, weight in terms.items():
+        for form in _variants(term):
+            lexicon.setdefault(form, weight)
+        lexicon[term] = weight  # Explicit entries win over generated forms
+    return lexicon
+
+
+LEXICON = build_lexicon({**POSITIVE_TERMS, **NEGATIVE_TERMS})
+
+
+@dataclass(frozen=True)
+class Score:
+    sentiment: float  # -1 (bad news) .. 1 (good news)
+    impact: str  # EconomicNews.IMPACT_CHOICES value
+    matches: int
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.casefold().replace('’', "'"))
+
+
+class ScoringEngine:
+    """
+    Offline impact/sentiment scorer for headlines and summaries.
+
+    The weighted lexicon is compiled once into a token trie, so a text is tokenized a
+    single time and every lexicon term (including multi-word phrases) is matched in one
+    left-to-right pass, longest phrase first. A negator shortly before a term flips its
+    weight. ``version`` identifies the lexicon and thresholds so stored scores can be
+    re-computed in bulk when either changes.
+
+    Impact keeps the meaning the scraper has always given it: 'high' for clearly
+    positive news, 'low' for clearly negative news, 'medium' otherwise.
+    """
+
+    def __init__(self, lexicon: Optional[Dict[str, float]] = None, title_weight: float = 2.0,
+                 summary_weight: float = 1.0, threshold: float = 0.15, scale: float = 4.0):
+        self.lexicon = dict(LEXICON if lexicon is None else lexicon)
+        self.title_weight = title_weight
+        self.summary_weight = summary_weight
+        self.threshold = threshold
+        self.scale = scale
+        self._trie = self._compile(self.lexicon)
+        payload = json.dumps([sorted(self.lexicon.items()), title_weight, summary_weight, threshold, scale])
+        self.version = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _compile(lexicon: Dict[str, float]) -> dict:
+        trie = {}
+        for term, weight in lexicon.items():
+            node = trie
+            for token in term.split():
+                node = node.setdefault(token, {})
+            node[None] = weight  # None marks the end of a term
+        return trie
+
+    def _raw(self, tokens: Sequence[str]) -> Tuple[float, int]:
+        trie = self._trie
+        total, matches, i, n = 0.0, 0, 0, len(tokens)
+        while i < n:
+            node, j, weight, end = trie, i, None, i
+            while j < n and tokens[j] in node:
+                node = node[tokens[j]]
+                j += 1
+                if None in node:
+                    weight, end = node[None], j
+            if weight is None:
+                i += 1
+                continue
+            if any(token in NEGATORS for token in tokens[max(0, i - NEGATION_WINDOW):i]):
+                weight = -weight
+            total += weight
+            matches += 1
+            i = end
+        return total, matches
+
+    def score(self, title: str, summary: str = '') -> Score:
+        title_total, title_matches = self._raw(tokenize(title))
+        summary_total, summary_matches = self._raw(tokenize(summary)) if summary else (0.0, 0)
+        sentiment = math.tanh((title_total * self.title_weight + summary_total * self.summary_weight) / self.scale)
+        if sentiment >= self.threshold:
+            impact = 'high'
+        elif sentiment <= -self.threshold:
+            impact = 'low'
+        else:
+            impact = 'medium'
+        return Score(round(sentiment, 4), impact, title_matches + summary_matches)
+
+    def score_batch(self, items: Iterable[Tuple[str, str]]) -> List[Score]:
+        """Score ``(title, summary)`` pairs in one call."""
+        score = self.score
+        return [score(title, summary) for title, summary in items]
+
+
+engine = ScoringEngine()
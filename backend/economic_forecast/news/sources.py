@@ -0,0 +1,64 @@
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class NewsSource:
+    """A site the news scraper reads, and where its headlines live in the page."""
+    key: str
+    name: str
+    url: str
+    category: str
+    item_tag: str  # Element wrapping one story
+    item_class: Optional[str] = None
+    title_tags: Tuple[str, ...] = ('h3', 'h2')  # First match inside the item is the headline
+    title_class: Optional[str] = None
+    context: str = 'international'
+    limit: int = 5
+    headers: dict = field(default_factory=lambda: {'User-Agent': 'Mozilla/5.0'}, compare=False, hash=False)
+
+
+SOURCES = [
+    NewsSource(
+        key='economist',
+        name='The Economist',
+        url='https://www.economist.com/finance-and-economics/',
+        category='Finance and Economics',
+        item_tag='article',
+    ),
+    NewsSource(
+        key='reuters',
+        name='Reuters',
+        url='https://www.reuters.com/business/',
+        category='Business',
+        item_tag='article',
+    ),
+    NewsSource(
+        key='bloomberg',
+        name='Bloomberg Businessweek',
+        url='https://www.bloomberg.com/businessweek',
+        category='Business',
+        item_tag='article',
+    ),
+    NewsSource(
+        key='ft',
+        name='Financial Times',
+        url='https://www.ft.com/world',
+        category='World News',
+        item_tag='div',
+        item_class='o-teaser__content',
+        title_tags=('a',),
+        title_class='js-teaser-heading-link',
+    ),
+    NewsSource(
+        key='cnbc',
+        name='CNBC',
+        url='https://www.cnbc.com/economy/',
+        category='Economy',
+        item_tag='div',
+        item_class='Card-titleContainer',
+        title_tags=('a',),
+    ),
+]
+
+SOURCES_BY_KEY = {source.key: source for source in SOURCES}
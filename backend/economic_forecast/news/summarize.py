@@ -0,0 +1,136 @@
+import hashlib
+import json
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+from django.core.cache import caches
+
+from chatbot import llm
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fallback_summary(headline: str) -> str:
+    return headline[:200] + "..."  # Fallback to truncation
+
+
+class Summaries(dict):
+    """Summaries keyed by headline; ``fallbacks`` holds the headlines that only got a truncation."""
+
+    def __init__(self, *args, fallbacks=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fallbacks = set(fallbacks)
+
+
+class HeadlineSummarizer:
+    """
+    Summarizes scraped headlines with as few LLM calls as possible.
+
+    Summaries are cached by a hash of the normalized headline. All uncached headlines
+    of a run go out in one structured (JSON) prompt, split into batches of
+    ``batch_size`` with at most ``max_concurrency`` batches in flight. A batch that
+    fails or returns unusable output falls back to truncated headlines, which are neither
+    cached nor final: they are listed in ``Summaries.fallbacks`` so the pipeline can
+    flag the stored rows and summarize them again on a later run.
+    """
+
+    key_prefix = 'news-summary'
+
+    def __init__(self, cache_alias: str = 'default', cache_timeout: int = 7 * 86400, batch_size: int = 25,
+                 max_concurrency: int = 2, model_name: str = 'gemini-1.5-flash'):
+        self.cache_alias = cache_alias
+        self.cache_timeout = cache_timeout
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self.llm_calls = 0
+        self.cache_hits = 0
+        self.fallbacks = 0
+
+    @classmethod
+    def from_settings(cls):
+        config = getattr(settings, 'NEWS_SUMMARIZER', {})
+        return cls(
+            cache_alias=config.get('CACHE_ALIAS', 'default'),
+            cache_timeout=config.get('CACHE_TIMEOUT', 7 * 86400),
+            batch_size=config.get('BATCH_SIZE', 25),
+            max_concurrency=config.get('MAX_CONCURRENCY', 2),
+            model_name=config.get('MODEL', 'gemini-1.5-flash'),
+        )
+
+    def cache_key(self, headline: str) -> str:
+        normalized = _WHITESPACE.sub(' ', headline).strip().casefold()
+        return f"{self.key_prefix}:{hashlib.sha256(normalized.encode('utf-8')).hexdigest()}"
+
+    def summarize(self, headlines: Iterable[str]) -> Summaries:
+        """Return a summary for every headline, keyed by the headline text."""
+        headlines = list(dict.fromkeys(headlines))
+        if not headlines:
+            return Summaries()
+        cache = caches[self.cache_alias]
+        keys = {headline: self.cache_key(headline) for headline in headlines}
+        cached = cache.get_many(list(keys.values()))
+
+        summaries = Summaries()
+        missing = []
+        for headline in headlines:
+            if keys[headline] in cached:
+                summaries[headline] = cached[keys[headline]]
+                self.cache_hits += 1
+            else:
+                missing.append(headline)
+
+        batches = [missing[i:i + self.batch_size] for i in range(0, len(missing), self.batch_size)]
+        if batches:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(batches)))) as pool:
+                fresh = {}
+                for result in pool.map(self._summarize_batch, batches):
+                    fresh.update(result)
+            cache.set_many({keys[headline]: summary for headline, summary in fresh.items()}, self.cache_timeout)
+            summaries.update(fresh)
+
+        for headline in headlines:
+            if headline not in summaries:
+                summaries[headline] = fallback_summary(headline)
+                summaries.fallbacks.add(headline)
+                self.fallbacks += 1
+        return summaries
+
+    def _summarize_batch(self, headlines: List[str]) -> Dict[str, str]:
+        numbered = "\n".join(f"{i}. {headline}" for i, headline in enumerate(headlines, start=1))
+        prompt = (
+            "Summarize each news headline below in 2-3 sentences. Respond with only a JSON object "
+            "that maps each headline's number (as a string) to its summary.\n\n"
+            f"{numbered}"
+        )
+        with self._lock:
+            self.llm_calls += 1
+        try:
+            text = llm.generate_text(
+                prompt,
+                generation_config={'response_mime_type': 'application/json'},
+                model_name=self.model_name,
+            )
+            data = json.loads(text)
+        except Exception as e:
+            logger.warning(f"Batch summarization of {len(headlines)} headlines failed: {e}")
+            return {}
+
+        if isinstance(data, list):
+            data = {str(i): summary for i, summary in enumerate(data, start=1)}
+        if not isinstance(data, dict):
+            return {}
+        results = {}
+        for i, headline in enumerate(headlines, start=1):
+            summary = data.get(str(i))
+            if isinstance(summary, str) and summary.strip():
+                results[headline] = summary.strip()
+        return results
+
@@ -0,0 +1,167 @@
+import logging
+import random
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+def jittered(seconds: float, jitter: float) -> float:
+    """Spread ``seconds`` by +/- ``jitter`` (a fraction) so runs do not line up."""
+    return seconds * random.uniform(1 - jitter, 1 + jitter) if jitter else seconds
+
+
+def backoff_delay(failures: int, base: float, maximum: float, jitter: float = 0.0) -> float:
+    """Exponential backoff after ``failures`` consecutive failures, capped at ``maximum``."""
+    if failures <= 0:
+        return 0.0
+    return min(maximum, jittered(base * 2 ** (failures - 1), jitter))
+
+
+class RunLock:
+    """
+    Lease on a cache key so a job runs in at most one place at a time.
+
+    The lease expires after ``timeout`` seconds, so a crashed run cannot hold it
+    forever. Across processes this needs a shared cache (REDIS_URL); with the
+    local-memory backend it only guards the current process.
+    """
+
+    def __init__(self, name: str, timeout: float, alias: str = 'default'):
+        self.key = f'scheduler-lock:{name}'
+        self.timeout = timeout
+        self.alias = alias
+        self.token = uuid.uuid4().hex
+
+    def acquire(self) -> bool:
+        return caches[self.alias].add(self.key, self.token, self.timeout)
+
+    def release(self) -> None:
+        cache = caches[self.alias]
+        if cache.get(self.key) == self.token:
+            cache.delete(self.key)
+
+
+class Job:
+    """A recurring callable with its schedule, backoff state and run-duration metrics."""
+
+    def __init__(self, name: str, func: Callable[[], None], interval: float, jitter: float = 0.1,
+                 backoff_max: float = 900, lock_timeout: float = 300):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.backoff_max = backoff_max
+        self.lock_timeout = lock_timeout
+        self.next_run = time.monotonic()
+        self.consecutive_failures = 0
+        self.metrics = {
+            'runs': 0,
+            'failures': 0,
+            'skipped_overlaps': 0,
+            'last_duration': 0.0,
+            'total_duration': 0.0,
+            'max_duration': 0.0,
+            'last_error': '',
+        }
+
+    def schedule_next(self, now: float) -> None:
+        if self.consecutive_failures:
+            delay = max(self.interval, backoff_delay(self.consecutive_failures, self.interval, self.backoff_max, self.jitter))
+        else:
+            delay = jittered(self.interval, self.jitter)
+        self.next_run = now + delay
+
+    def record(self, duration: float, error: str = '') -> None:
+        metrics = self.metrics
+        metrics['runs'] += 1
+        metrics['last_duration'] = duration
+        metrics['total_duration'] += duration
+        metrics['max_duration'] = max(metrics['max_duration'], duration)
+        if error:
+            metrics['failures'] += 1
+            metrics['last_error'] = error
+            self.consecutive_failures += 1
+        else:
+            self.consecutive_failures = 0
+
+    def stats(self) -> dict:
+        runs = self.metrics['runs']
+        return {
+            **self.metrics,
+            'avg_duration': round(self.metrics['total_duration'] / runs, 3) if runs else 0.0,
+            'consecutive_failures': self.consecutive_failures,
+            'next_run_in': round(max(0.0, self.next_run - time.monotonic()), 3),
+        }
+
+
+class JobScheduler:
+    """
+    Runs recurring jobs without busy-polling.
+
+    The loop sleeps until the next job is due (or ``stop()`` is called). Each run
+    holds a RunLock, so a run that overlaps another one still in progress is skipped
+    rather than stacked. Failed runs back off exponentially; successful ones are
+    rescheduled at the job's jittered interval.
+    """
+
+    def __init__(self, lock_alias: str = 'default',
+                 on_run: Optional[Callable[[Job, float, str], None]] = None):
+        self.jobs: List[Job] = []
+        self.lock_alias = lock_alias
+        self.on_run = on_run
+        self._stop = threading.Event()
+
+    def add_job(self, name: str, func: Callable[[], None], interval: float, **kwargs) -> Job:
+        job = Job(name, func, interval, **kwargs)
+        self.jobs.append(job)
+        return job
+
+    def run_job(self, job: Job) -> None:
+        lock = RunLock(job.name, job.lock_timeout, self.lock_alias)
+        if not lock.acquire():
+            job.metrics['skipped_overlaps'] += 1
+            logger.info(f"Skipping {job.name}: previous run still in progress")
+            job.schedule_next(time.monotonic())
+            return
+        started = time.monotonic()
+        error = ''
+        try:
+            job.func()
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+            logger.exception(f"Scheduled job {job.name} failed")
+        finally:
+            lock.release()
+        finished = time.monotonic()
+        job.record(finished - started, error)
+        job.schedule_next(finished)
+        if self.on_run:
+            self.on_run(job, finished - started, error)
+
+    def run_pending(self) -> None:
+        now = time.monotonic()
+        for job in self.jobs:
+            if job.next_run <= now and not self._stop.is_set():
+                self.run_job(job)
+
+    def seconds_until_next(self) -> float:
+        if not self.jobs:
+            return 60.0
+        return max(0.0, min(job.next_run for job in self.jobs) - time.monotonic())
+
+    def run_forever(self) -> None:
+        self._stop.clear()
+        while not self._stop.is_set():
+            self.run_pending()
+            self._stop.wait(self.seconds_until_next())
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> Dict[str, dict]:
+        return {job.name: job.stats() for job in self.jobs}
@@ -0,0 +1,135 @@
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import List, Optional, Tuple
+
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import EconomicEvent, EconomicNews
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    """Full-text index over a model, created by migration 0003_search_index."""
+    model: type
+    columns: Tuple[str, ...]  # Ranking weight decreases left to right
+    weights: Tuple[float, ...]  # bm25 column weights on SQLite (Postgres uses setweight A-D)
+    date_field: str
+
+    @property
+    def table(self) -> str:
+        return self.model._meta.db_table
+
+
+SEARCH_INDEXES = {
+    EconomicNews: SearchIndex(EconomicNews, ('title', 'summary', 'category', 'source'), (10.0, 4.0, 2.0, 1.0), 'timestamp'),
+    EconomicEvent: SearchIndex(EconomicEvent, ('title', 'description', 'category'), (10.0, 4.0, 2.0), 'date'),
+}
+
+
+def fts5_query(text: str) -> str:
+    """
+    Turn free text into a safe FTS5 query: every word must match, the last one as a prefix.
+
+    Quoting each token keeps user input from being read as FTS5 syntax.
+    """
+    tokens = _TOKEN.findall(text)
+    if not tokens:
+        return ''
+    quoted = [f'"{token}"' for token in tokens]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def _date_bound(index: SearchIndex, value: Optional[date], end: bool):
+    if value is None:
+        return None
+    if index.date_field == 'timestamp':
+        moment = datetime.combine(value, time.max if end else time.min)
+        return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+    return value
+
+
+def search(model, text: str, date_from: Optional[date] = None, date_to: Optional[date] = None,
+           limit: int = 20) -> List[Tuple[object, float]]:
+    """
+    Ranked full-text search over ``model``, best match first, as ``(instance, rank)`` pairs.
+
+    Uses FTS5 (bm25) on SQLite and the tsvector/GIN index (ts_rank) on Postgres. Higher
+    rank is better on both. Other databases get an unranked icontains match.
+    """
+    index = SEARCH_INDEXES[model]
+    start, end = _date_bound(index, date_from, False), _date_bound(index, date_to, True)
+    vendor = connection.vendor
+    if vendor == 'sqlite':
+        ranked = _search_sqlite(index, text, start, end, limit)
+    elif vendor == 'postgresql':
+        ranked = _search_postgres(index, text, start, end, limit)
+    else:
+        return [(instance, 0.0) for instance in _search_fallback(index, text, start, end, limit)]
+    instances = model.objects.in_bulk([pk for pk, _ in ranked])
+    return [(instances[pk], rank) for pk, rank in ranked if pk in instances]
+
+
+def _date_filters(index, start, end, column_prefix):
+    clauses, params = [], []
+    if start is not None:
+        clauses.append(f'{column_prefix}{index.date_field} >= %s')
+        params.append(start)
+    if end is not None:
+        clauses.append(f'{column_prefix}{index.date_field} <= %s')
+        params.append(end)
+    return ''.join(f' AND {clause}' for clause in clauses), params
+
+
+def _search_sqlite(index, text, start, end, limit):
+    query = fts5_query(text)
+    if not query:
+        return []
+    fts = f'{index.table}_fts'
+    weights = ', '.join(str(weight) for weight in index.weights)
+    dates, date_params = _date_filters(index, start, end, 't.')
+    sql = (
+        f'SELECT t.id, bm25({fts}, {weights}) AS score FROM {fts} '
+        f'JOIN {index.table} t ON t.id = {fts}.rowid '
+        f'WHERE {fts} MATCH %s{dates} ORDER BY score LIMIT %s'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [query, *date_params, limit])
+        # bm25 is lower-is-better; negate so callers can treat higher as better everywhere
+        return [(pk, -score) for pk, score in cursor.fetchall()]
+
+
+def _search_postgres(index, text, start, end, limit):
+    if not _TOKEN.search(text):
+        return []
+    dates, date_params = _date_filters(index, start, end, '')
+    sql = (
+        f"SELECT id, ts_rank(search_vector, query) AS score FROM {index.table}, "
+        f"websearch_to_tsquery('english', %s) query "
+        f"WHERE search_vector @@ query{dates} ORDER BY score DESC LIMIT %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [text, *date_params, limit])
+        return cursor.fetchall()
+
+
+def _search_fallback(index, text, start, end, limit):
+    tokens = _TOKEN.findall(text)
+    if not tokens:
+        return []
+    queryset = index.model.objects.all()
+    for token in tokens:
+        match = Q()
+        for column in index.columns:
+            match |= Q(**{f'{column}__icontains': token})
+        queryset = queryset.filter(match)
+    if start is not None:
+        queryset = queryset.filter(**{f'{index.date_field}__gte': start})
+    if end is not None:
+        queryset = queryset.filter(**{f'{index.date_field}__lte': end})
+    return list(queryset.order_by(f'-{index.date_field}')[:limit])
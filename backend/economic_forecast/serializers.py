@@ -1,22 +1,35 @@
 from rest_framework import serializers
-from .models import EconomicMetric, EconomicNews, EconomicForecast, EconomicEvent
 
-class EconomicMetricSerializer(serializers.ModelSerializer):
+from backend_project.serializers import SparseModelSerializer
+from .models import EconomicMetric, EconomicNews, EconomicForecast, EconomicEvent, news_fingerprint
+
+class EconomicMetricSerializer(SparseModelSerializer):
     class Meta:
         model = EconomicMetric
         fields = '__all__'
 
-class EconomicNewsSerializer(serializers.ModelSerializer):
+class EconomicNewsSerializer(SparseModelSerializer):
     class Meta:
         model = EconomicNews
         fields = '__all__'
+        read_only_fields = ['fingerprint', 'content_hash', 'sentiment', 'lexicon_version']
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        identity = {field: attrs.get(field, getattr(self.instance, field, '')) for field in ('source', 'url', 'title')}
+        duplicates = EconomicNews.objects.filter(fingerprint=news_fingerprint(**identity))
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError('A story with this source and URL (or title) already exists.')
+        return attrs
 
-class EconomicForecastSerializer(serializers.ModelSerializer):
+class EconomicForecastSerializer(SparseModelSerializer):
     class Meta:
         model = EconomicForecast
         fields = '__all__'
 
-class EconomicEventSerializer(serializers.ModelSerializer):
+class EconomicEventSerializer(SparseModelSerializer):
     class Meta:
         model = EconomicEvent
         fields = '__all__'
@@ -1,19 +1,73 @@
-from django_q.tasks import schedule
-from django_q.models import Schedule
-from django.utils.timezone import now
-from datetime import timedelta
-
-def schedule_news_scraping():
-    # Schedule the scrape_news command to run every 10 seconds
-    # Remove existing schedule if any
-    Schedule.objects.filter(func='django.core.management.call_command', args='scrape_news').delete()
-
-    schedule(
-        'django.core.management.call_command',
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+
+from economic_forecast.news.fetch import source_stats
+from economic_forecast.news.sources import SOURCES
+from economic_forecast.scheduler import JobScheduler, backoff_delay
+
+
+def _config(name, default):
+    return getattr(settings, 'NEWS_SCHEDULER', {}).get(name, default)
+
+
+class NewsScrapeJob:
+    """
+    Runs ``scrape_news`` for the sources that are not backing off.
+
+    A source that keeps failing is retried after exponentially growing delays
+    (from its consecutive failures in ``source_stats``) instead of on every run.
+    """
+
+    def __init__(self, backoff_base: float, backoff_max: float, jitter: float = 0.1):
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_at = {}
+
+    def due_sources(self, now: float):
+        return [source.key for source in SOURCES if self.retry_at.get(source.key, 0) <= now]
+
+    def __call__(self):
+        now = time.monotonic()
+        due = self.due_sources(now)
+        if not due:
+            return
+        call_command('scrape_news', '--sources', *due)
+        stats = source_stats.snapshot()
+        for key in due:
+            failures = stats.get(key, {}).get('consecutive_failures', 0)
+            if failures:
+                self.retry_at[key] = now + backoff_delay(failures, self.backoff_base, self.backoff_max, self.jitter)
+            else:
+                self.retry_at.pop(key, None)
+
+
+def schedule_news_scraping(scheduler: JobScheduler = None) -> JobScheduler:
+    # Register the scrape_news job (every NEWS_SCHEDULER['INTERVAL_SECONDS']) on a scheduler
+    scheduler = scheduler or JobScheduler()
+    jitter = _config('JITTER', 0.1)
+    scheduler.add_job(
         'scrape_news',
-        schedule_type=Schedule.SECONDS,
-        seconds=10,
-        repeats=-1,
-        next_run=now() + timedelta(seconds=10),
-        name='Scrape Economic News Every 10 Seconds'
+        NewsScrapeJob(_config('SOURCE_BACKOFF_SECONDS', 30), _config('SOURCE_BACKOFF_MAX_SECONDS', 900), jitter),
+        interval=_config('INTERVAL_SECONDS', 10),
+        jitter=jitter,
+        backoff_max=_config('JOB_BACKOFF_MAX_SECONDS', 900),
+        lock_timeout=_config('LOCK_TIMEOUT_SECONDS', 300),
+    )
+    return scheduler
+
+
+def schedule_news_retention(scheduler: JobScheduler = None) -> JobScheduler:
+    # Register the prune_news_archive job (every NEWS_ARCHIVE['PRUNE_INTERVAL_SECONDS']) on a scheduler
+    scheduler = scheduler or JobScheduler()
+    archive = getattr(settings, 'NEWS_ARCHIVE', {})
+    scheduler.add_job(
+        'prune_news_archive',
+        lambda: call_command('prune_news_archive'),
+        interval=archive.get('PRUNE_INTERVAL_SECONDS', 86400),
+        jitter=_config('JITTER', 0.1),
+        lock_timeout=_config('LOCK_TIMEOUT_SECONDS', 300),
     )
+    return scheduler
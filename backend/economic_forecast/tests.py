@@ -1,3 +1,276 @@
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+from django.core import checks
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from backend_project.testing import QueryPlanTestMixin, SharedCacheTestMixin
+from .models import EconomicEvent, EconomicForecast, EconomicMetric, EconomicNews, news_fingerprint, news_partition
+
+
+class NewsPartitionTests(TestCase):
+    def test_partition_uses_utc_month(self):
+        new_york_evening = datetime(2026, 3, 31, 23, 30, tzinfo=dt_timezone(timedelta(hours=-5)))
+        self.assertEqual(news_partition(new_york_evening), date(2026, 4, 1))
+        tokyo_morning = datetime(2026, 4, 1, 5, 0, tzinfo=dt_timezone(timedelta(hours=9)))
+        self.assertEqual(news_partition(tokyo_morning), date(2026, 3, 1))
+        self.assertEqual(news_partition(datetime(2026, 4, 1, 0, 0)), date(2026, 4, 1))
+
+
+class EconomicForecastFilterTests(QueryPlanTestMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        now = timezone.now()
+        for i, context in enumerate(['local', 'national', 'local']):
+            EconomicNews.objects.create(
+                context=context, title=f'Story {i}', summary='', source='Reuters',
+                timestamp=now - timedelta(days=i), impact='medium', category='markets',
+            )
+            EconomicEvent.objects.create(
+                context=context, title=f'Event {i}', date=date(2026, 1, 1) + timedelta(days=i),
+                description='', impact='high', category='policy',
+            )
+
+    def test_news_filtered_by_context_uses_index(self):
+        response = self.assertListUsesIndex(reverse('economicnews-list'), {'context': 'local'}, EconomicNews)
+        titles = [item['title'] for item in response.data['results']]
+        self.assertEqual(titles, ['Story 0', 'Story 2'])
+
+    def test_news_filtered_by_time_range_uses_index(self):
+        since = (timezone.now() - timedelta(hours=36)).isoformat()
+        response = self.assertListUsesIndex(reverse('economicnews-list'), {'timestamp__gte': since}, EconomicNews)
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_events_filtered_by_context_and_date_use_index(self):
+        params = {'context__in': 'local,state', 'date__lte': '2026-01-02'}
+        response = self.assertListUsesIndex(reverse('economicevent-list'), params, EconomicEvent)
+        self.assertEqual([item['title'] for item in response.data['results']], ['Event 0'])
+
+    def test_metrics_and_forecasts_filtered_by_context_use_index(self):
+        EconomicMetric.objects.create(context='local', name='CPI', value=3.1, change=0.2, unit='%', trend='up', category='prices')
+        EconomicForecast.objects.create(
+            context='local', indicator='GDP', period='2026', forecast=2.0, confidence=70, range_low=1.5, range_high=2.5,
+        )
+        self.assertListUsesIndex(reverse('economicmetric-list'), {'context': 'local', 'category': 'prices'}, EconomicMetric)
+        self.assertListUsesIndex(reverse('economicmetric-list'), {'category': 'prices'}, EconomicMetric)
+        response = self.assertListUsesIndex(reverse('economicforecast-list'), {'indicator': 'GDP'}, EconomicForecast)
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_invalid_filter_value_is_rejected(self):
+        response = self.client.get(reverse('economicevent-list'), {'date__gte': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('date__gte', response.data)
+
+    def test_undeclared_ordering_is_rejected(self):
+        response = self.client.get(reverse('economicnews-list'), {'ordering': 'title'})
+        self.assertEqual(response.status_code, 400)
+
+
+class EconomicNewsProjectionTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        EconomicNews.objects.create(
+            context='local', title='Rates hold', summary='A long summary ' * 50, source='Reuters',
+            timestamp=timezone.now(), impact='medium', category='markets',
+        )
+
+    def test_fields_limits_payload_and_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('economicnews-list'), {'fields': 'id,title'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data['results'][0]), ['id', 'title'])
+        select = next(q['sql'] for q in queries.captured_queries if 'economicnews' in q['sql'])
+        self.assertNotIn('"summary"', select)
+        self.assertIn('"timestamp"', select)  # Cursor ordering column is still loaded
+
+    def test_exclude_drops_fields(self):
+        response = self.client.get(reverse('economicnews-list'), {'exclude': 'summary,url'})
+        self.assertEqual(response.status_code, 200)
+        item = response.data['results'][0]
+        self.assertNotIn('summary', item)
+        self.assertIn('title', item)
+
+    def test_duplicate_story_is_rejected(self):
+        payload = {
+            'context': 'state', 'title': ' rates  HOLD ', 'summary': 'Held.', 'source': 'Reuters',
+            'timestamp': timezone.now().isoformat(), 'impact': 'medium', 'category': 'markets',
+        }
+        response = self.client.post(reverse('economicnews-list'), payload, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('non_field_errors', response.data)
+        self.assertEqual(EconomicNews.objects.count(), 1)
+
+    def test_edit_recomputes_fingerprint(self):
+        story = EconomicNews.objects.get()
+        detail = reverse('economicnews-detail', args=[story.pk])
+        response = self.client.patch(detail, {'url': 'https://example.com/rates'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        story.refresh_from_db()
+        self.assertEqual(story.fingerprint, news_fingerprint('Reuters', 'https://example.com/rates', 'Rates hold'))
+        # The old identity is free again, and editing into a taken one is a 400
+        other = self.client.post(reverse('economicnews-list'), {
+            'context': 'local', 'title': 'Rates hold', 'summary': 'Held.', 'source': 'Reuters',
+            'timestamp': timezone.now().isoformat(), 'impact': 'low', 'category': 'markets',
+        }, format='json')
+        self.assertEqual(other.status_code, 201)
+        clash = self.client.patch(detail, {'url': ''}, format='json')
+        self.assertEqual(clash.status_code, 400)
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get(reverse('economicnews-list'), {'fields': 'title,body'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('fields', response.data)
+
+
+class ConditionalGetTests(SharedCacheTestMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('economicmetric-list')
+        with self.captureOnCommitCallbacks(execute=True):
+            EconomicMetric.objects.create(context='local', name='CPI', value=3.1, change=0.2, unit='%', trend='up', category='prices')
+
+    def test_unchanged_table_returns_304_without_queries(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('no-cache', first['Cache-Control'])
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(second.content, b'')
+
+    def test_if_modified_since_alone_does_not_304(self):
+        first = self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            EconomicMetric.objects.create(context='state', name='PMI', value=51, change=1, unit='', trend='up', category='activity')
+        # The write may fall in the same second as Last-Modified; only the ETag can tell
+        second = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(len(second.data['results']), 2)
+
+    def test_write_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, {
+                'context': 'national', 'name': 'GDP', 'value': 2.0, 'change': 0.1,
+                'unit': '%', 'trend': 'up', 'category': 'growth',
+            }, format='json')
+        self.assertEqual(response.status_code, 201)
+        refreshed = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(refreshed.status_code, 200)
+        self.assertEqual(len(refreshed.data['results']), 2)
+        self.assertNotEqual(refreshed['ETag'], etag)
+
+    def test_etag_varies_with_query(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, {'context': 'local'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_bulk_ingest_changes_etag(self):
+        from .news.ingest import upsert_news
+        url = reverse('economicnews-list')
+        etag = self.client.get(url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            upsert_news([{
+                'context': 'local', 'title': 'Rates hold', 'summary': '', 'source': 'Reuters',
+                'timestamp': timezone.now(), 'impact': 'medium', 'category': 'markets', 'url': 'https://example.com/a',
+            }])
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class LocalCacheConditionalGetTests(TestCase):
+    def test_local_memory_cache_disables_conditional_get(self):
+        # Another worker's writes would never reach this process's table versions
+        response = APIClient().get(reverse('economicmetric-list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response)
+        self.assertIn('backend_project.W001', [message.id for message in checks.run_checks()])
+
+
+class FallbackSummaryRetryTests(TestCase):
+    page = b'<html><body><article><h3><a href="/rates">Rates hold steady</a></h3></article></body></html>'
+
+    def setUp(self):
+        from django.core.cache import cache
+        from .news.sources import NewsSource
+        cache.clear()
+        self.source = NewsSource(key='wire', name='Wire', url='https://example.com/', category='markets',
+                                 item_tag='article')
+
+    def run_pipeline(self, not_modified=False, fail=False):
+        from unittest import mock
+        from chatbot import llm
+        from .news.fetch import FetchResult
+        from .news.pipeline import NewsPipeline
+        from .news.summarize import HeadlineSummarizer
+
+        def fetch(source, timeout):
+            if not_modified:
+                return FetchResult(source, status_code=304, not_modified=True)
+            return FetchResult(source, self.page, 200)
+
+        def generate(prompt, **kwargs):
+            if fail:
+                raise RuntimeError('LLM unavailable')
+            return '{"1": "Central bank keeps rates unchanged."}'
+
+        with mock.patch.object(llm, 'generate_text', generate):
+            return NewsPipeline(fetch=fetch, summarizer=HeadlineSummarizer()).run([self.source])
+
+    def test_fallback_is_marked_and_replaced_when_page_is_unchanged(self):
+        self.run_pipeline(fail=True)
+        story = EconomicNews.objects.get()
+        self.assertTrue(story.summary_is_fallback)
+        self.assertEqual(story.summary, 'Rates hold steady...')
+
+        report = self.run_pipeline()
+        self.assertEqual(report.pending, 1)
+        story.refresh_from_db()
+        self.assertFalse(story.summary_is_fallback)
+        self.assertEqual(story.summary, 'Central bank keeps rates unchanged.')
+        self.assertEqual(self.run_pipeline().pending, 0)
+
+    def test_fallback_is_retried_after_a_304(self):
+        self.run_pipeline(fail=True)
+        report = self.run_pipeline(not_modified=True)
+        self.assertEqual(report.pending, 1)
+        self.assertEqual(report.counts, {'created': 0, 'updated': 1})
+        self.assertFalse(EconomicNews.objects.get().summary_is_fallback)
+
+
+class NewsRetentionTests(TestCase):
+    def setUp(self):
+        old = datetime(2020, 1, 15, tzinfo=dt_timezone.utc)
+        for i in range(3):
+            EconomicNews.objects.create(
+                context='local', title=f'Old story {i}', summary='', source='Wire', timestamp=old + timedelta(hours=i),
+                impact='low', category='markets', url=f'https://example.com/{i}',
+            )
+
+    def test_interrupted_prune_counts_each_story_once(self):
+        from unittest import mock
+        from django.db.models.query import QuerySet
+        from .models import EconomicNewsRollup
+        from .news.retention import prune_partitions
+
+        real_delete, calls = QuerySet.delete, []
+
+        def crash_on_second_batch(queryset):
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError('Process killed')
+            return real_delete(queryset)
+
+        with mock.patch.object(QuerySet, 'delete', crash_on_second_batch), self.assertRaises(RuntimeError):
+            prune_partitions(retention_months=1, batch_size=1)
+        self.assertEqual(EconomicNews.objects.count(), 2)
+        self.assertEqual(EconomicNewsRollup.objects.get().count, 1)
 
-# Create your tests here.
+        pruned = prune_partitions(retention_months=1, batch_size=1)
+        self.assertEqual(pruned[0]['rows'], 2)
+        self.assertFalse(EconomicNews.objects.exists())
+        self.assertEqual(EconomicNewsRollup.objects.get().count, 3)
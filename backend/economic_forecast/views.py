@@ -1,5 +1,9 @@
-from rest_framework import viewsets
+from django.utils.dateparse import parse_date
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from .models import EconomicMetric, EconomicNews, EconomicForecast, EconomicEvent
+from .search import search
 from .serializers import (
     EconomicMetricSerializer,
     EconomicNewsSerializer,
@@ -7,18 +11,81 @@ from .serializers import (
     EconomicEventSerializer,
 )
 
+SEARCH_MAX_LIMIT = 100
+LATEST_MAX_LIMIT = 200
+
+
+class SearchMixin:
+    """``GET .../search/?q=&from=YYYY-MM-DD&to=YYYY-MM-DD&limit=`` backed by the full-text index."""
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'error': 'Missing search query (q)'}, status=status.HTTP_400_BAD_REQUEST)
+        bounds = {}
+        for param in ('from', 'to'):
+            value = request.query_params.get(param)
+            bounds[param] = parse_date(value) if value else None
+            if value and bounds[param] is None:
+                return Response({'error': f'Invalid {param} date, expected YYYY-MM-DD'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), SEARCH_MAX_LIMIT)
+        except ValueError:
+            return Response({'error': 'Invalid limit'}, status=status.HTTP_400_BAD_REQUEST)
+
+        hits = search(self.queryset.model, query, bounds['from'], bounds['to'], limit)
+        serializer = self.get_serializer([instance for instance, _ in hits], many=True)
+        results = [{**data, 'rank': round(rank, 4)} for data, (_, rank) in zip(serializer.data, hits)]
+        return Response({'query': query, 'count': len(results), 'results': results})
+
+
 class EconomicMetricViewSet(viewsets.ModelViewSet):
     queryset = EconomicMetric.objects.all()
     serializer_class = EconomicMetricSerializer
+    filter_fields = {'context': ['exact', 'in'], 'category': ['exact']}
 
-class EconomicNewsViewSet(viewsets.ModelViewSet):
+class EconomicNewsViewSet(SearchMixin, viewsets.ModelViewSet):
     queryset = EconomicNews.objects.all()
     serializer_class = EconomicNewsSerializer
+    cursor_ordering = ('-timestamp', '-pk')
+    filter_fields = {
+        'context': ['exact', 'in'],
+        'category': ['exact'],
+        'impact': ['exact'],
+        'source': ['exact'],
+        'timestamp': ['gte', 'lte'],
+    }
+    ordering_fields = ['timestamp']
+
+    @action(detail=False, methods=['get'])
+    def latest(self, request):
+        """Newest stories, read from the newest monthly partition only (``?limit=``)."""
+        try:
+            limit = min(max(int(request.query_params.get('limit', 50)), 1), LATEST_MAX_LIMIT)
+        except ValueError:
+            return Response({'error': 'Invalid limit'}, status=status.HTTP_400_BAD_REQUEST)
+        queryset = self.get_queryset()
+        month = queryset.newest_partition()
+        stories = queryset.in_partition(month).order_by('-timestamp')[:limit] if month else []
+        return Response({
+            'partition': f'{month:%Y-%m}' if month else None,
+            'results': self.get_serializer(stories, many=True).data,
+        })
 
 class EconomicForecastViewSet(viewsets.ModelViewSet):
     queryset = EconomicForecast.objects.all()
     serializer_class = EconomicForecastSerializer
+    filter_fields = {'context': ['exact', 'in'], 'indicator': ['exact']}
 
-class EconomicEventViewSet(viewsets.ModelViewSet):
+class EconomicEventViewSet(SearchMixin, viewsets.ModelViewSet):
     queryset = EconomicEvent.objects.all()
     serializer_class = EconomicEventSerializer
+    cursor_ordering = ('-date', '-pk')
+    filter_fields = {
+        'context': ['exact', 'in'],
+        'category': ['exact'],
+        'impact': ['exact'],
+        'date': ['exact', 'gte', 'lte'],
+    }
+    ordering_fields = ['date']
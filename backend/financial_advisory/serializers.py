@@ -1,45 +1,45 @@
-from rest_framework import serializers
+from backend_project.serializers import SparseModelSerializer
 from .models import (
     BudgetForecast, CashFlowProjection, ScenarioTest, RiskAssessment,
     PerformanceDriver, AdvisoryInsight, BudgetAssumption, LiquidityMetric
 )
 
-class BudgetForecastSerializer(serializers.ModelSerializer):
+class BudgetForecastSerializer(SparseModelSerializer):
     class Meta:
         model = BudgetForecast
         fields = '__all__'
 
-class CashFlowProjectionSerializer(serializers.ModelSerializer):
+class CashFlowProjectionSerializer(SparseModelSerializer):
     class Meta:
         model = CashFlowProjection
         fields = '__all__'
 
-class ScenarioTestSerializer(serializers.ModelSerializer):
+class ScenarioTestSerializer(SparseModelSerializer):
     class Meta:
         model = ScenarioTest
         fields = '__all__'
 
-class RiskAssessmentSerializer(serializers.ModelSerializer):
+class RiskAssessmentSerializer(SparseModelSerializer):
     class Meta:
         model = RiskAssessment
         fields = '__all__'
 
-class PerformanceDriverSerializer(serializers.ModelSerializer):
+class PerformanceDriverSerializer(SparseModelSerializer):
     class Meta:
         model = PerformanceDriver
         fields = '__all__'
 
-class AdvisoryInsightSerializer(serializers.ModelSerializer):
+class AdvisoryInsightSerializer(SparseModelSerializer):
     class Meta:
         model = AdvisoryInsight
         fields = '__all__'
 
-class BudgetAssumptionSerializer(serializers.ModelSerializer):
+class BudgetAssumptionSerializer(SparseModelSerializer):
     class Meta:
         model = BudgetAssumption
         fields = '__all__'
 
-class LiquidityMetricSerializer(serializers.ModelSerializer):
+class LiquidityMetricSerializer(SparseModelSerializer):
     class Meta:
         model = LiquidityMetric
         fields = '__all__'
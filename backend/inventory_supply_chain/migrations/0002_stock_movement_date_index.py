@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory_supply_chain', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='stockmovement',
+            index=models.Index(fields=['-date', '-id'], name='stock_movement_date_idx'),
+        ),
+    ]
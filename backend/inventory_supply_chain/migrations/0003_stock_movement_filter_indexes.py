@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory_supply_chain', '0002_stock_movement_date_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='stockmovement',
+            index=models.Index(fields=['item', '-date', '-id'], name='stock_movement_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stockmovement',
+            index=models.Index(fields=['movementType', '-date', '-id'], name='stock_movement_type_idx'),
+        ),
+    ]
@@ -40,6 +40,13 @@ class StockMovement(models.Model):
     date = models.DateField()
     user = models.CharField(max_length=255)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-date', '-id'], name='stock_movement_date_idx'),
+            models.Index(fields=['item', '-date', '-id'], name='stock_movement_item_idx'),
+            models.Index(fields=['movementType', '-date', '-id'], name='stock_movement_type_idx'),
+        ]
+
     def __str__(self):
         return f"{self.movementType} - {self.item}"
 
@@ -1,4 +1,4 @@
-from rest_framework import serializers
+from backend_project.serializers import SparseModelSerializer
 from .models import (
     InventoryItem,
     StockMovement,
@@ -19,87 +19,87 @@ from .models import (
     SustainabilityMetric,
 )
 
-class InventoryItemSerializer(serializers.ModelSerializer):
+class InventoryItemSerializer(SparseModelSerializer):
     class Meta:
         model = InventoryItem
         fields = '__all__'
 
-class StockMovementSerializer(serializers.ModelSerializer):
+class StockMovementSerializer(SparseModelSerializer):
     class Meta:
         model = StockMovement
         fields = '__all__'
 
-class DemandForecastSerializer(serializers.ModelSerializer):
+class DemandForecastSerializer(SparseModelSerializer):
     class Meta:
         model = DemandForecast
         fields = '__all__'
 
-class InventoryValuationSerializer(serializers.ModelSerializer):
+class InventoryValuationSerializer(SparseModelSerializer):
     class Meta:
         model = InventoryValuation
         fields = '__all__'
 
-class DeadStockSerializer(serializers.ModelSerializer):
+class DeadStockSerializer(SparseModelSerializer):
     class Meta:
         model = DeadStock
         fields = '__all__'
 
-class LocationSerializer(serializers.ModelSerializer):
+class LocationSerializer(SparseModelSerializer):
     class Meta:
         model = Location
         fields = '__all__'
 
-class InventoryAuditSerializer(serializers.ModelSerializer):
+class InventoryAuditSerializer(SparseModelSerializer):
     class Meta:
         model = InventoryAudit
         fields = '__all__'
 
-class TurnoverMetricSerializer(serializers.ModelSerializer):
+class TurnoverMetricSerializer(SparseModelSerializer):
     class Meta:
         model = TurnoverMetric
         fields = '__all__'
 
-class SupplierSerializer(serializers.ModelSerializer):
+class SupplierSerializer(SparseModelSerializer):
     class Meta:
         model = Supplier
         fields = '__all__'
 
-class ProcurementOrderSerializer(serializers.ModelSerializer):
+class ProcurementOrderSerializer(SparseModelSerializer):
     class Meta:
         model = ProcurementOrder
         fields = '__all__'
 
-class ProductionPlanSerializer(serializers.ModelSerializer):
+class ProductionPlanSerializer(SparseModelSerializer):
     class Meta:
         model = ProductionPlan
         fields = '__all__'
 
-class WarehouseOperationSerializer(serializers.ModelSerializer):
+class WarehouseOperationSerializer(SparseModelSerializer):
     class Meta:
         model = WarehouseOperation
         fields = '__all__'
 
-class LogisticsMetricSerializer(serializers.ModelSerializer):
+class LogisticsMetricSerializer(SparseModelSerializer):
     class Meta:
         model = LogisticsMetric
         fields = '__all__'
 
-class MarketVolatilitySerializer(serializers.ModelSerializer):
+class MarketVolatilitySerializer(SparseModelSerializer):
     class Meta:
         model = MarketVolatility
         fields = '__all__'
 
-class RegulatoryComplianceSerializer(serializers.ModelSerializer):
+class RegulatoryComplianceSerializer(SparseModelSerializer):
     class Meta:
         model = RegulatoryCompliance
         fields = '__all__'
 
-class DisruptionRiskSerializer(serializers.ModelSerializer):
+class DisruptionRiskSerializer(SparseModelSerializer):
     class Meta:
         model = DisruptionRisk
         fields = '__all__'
 
-class SustainabilityMetricSerializer(serializers.ModelSerializer):
+class SustainabilityMetricSerializer(SparseModelSerializer):
     class Meta:
         model = SustainabilityMetric
         fields = '__all__'
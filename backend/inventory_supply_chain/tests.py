@@ -1,3 +1,38 @@
+from datetime import date, timedelta
+
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from backend_project.testing import QueryPlanTestMixin
+from .models import StockMovement
+
+
+class StockMovementFilterTests(QueryPlanTestMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        for i, (item, movement_type) in enumerate([('Widget', 'in'), ('Gadget', 'out'), ('Widget', 'out')]):
+            StockMovement.objects.create(
+                id=f'mv-{i}', item=item, movementType=movement_type, quantity=10,
+                reason='', date=date(2026, 3, 1) + timedelta(days=i), user='ops',
+            )
+
+    def test_filter_by_item_uses_index(self):
+        response = self.assertListUsesIndex(reverse('stockmovement-list'), {'item': 'Widget'}, StockMovement)
+        self.assertEqual([item['id'] for item in response.data['results']], ['mv-2', 'mv-0'])
+
+    def test_filter_by_type_and_date_range_uses_index(self):
+        params = {'movementType': 'out', 'date__gte': '2026-03-03'}
+        response = self.assertListUsesIndex(reverse('stockmovement-list'), params, StockMovement)
+        self.assertEqual([item['id'] for item in response.data['results']], ['mv-2'])
 
-# Create your tests here.
+    def test_pages_through_movements_on_the_same_date(self):
+        for i in range(3, 6):
+            StockMovement.objects.create(id=f'mv-{i}', item='Bolt', movementType='in', quantity=1,
+                                         reason='', date=date(2026, 3, 10), user='ops')
+        seen, url, params = [], reverse('stockmovement-list'), {'page_size': 1}
+        while url:
+            response = self.client.get(url, params)
+            seen += [item['id'] for item in response.data['results']]
+            url, params = response.data['next'], None
+        self.assertEqual(seen, ['mv-5', 'mv-4', 'mv-3', 'mv-2', 'mv-1', 'mv-0'])
@@ -45,6 +45,9 @@ class InventoryItemViewSet(viewsets.ModelViewSet):
 class StockMovementViewSet(viewsets.ModelViewSet):
     queryset = StockMovement.objects.all()
     serializer_class = StockMovementSerializer
+    cursor_ordering = ('-date', '-pk')
+    filter_fields = {'item': ['exact'], 'movementType': ['exact', 'in'], 'date': ['exact', 'gte', 'lte']}
+    ordering_fields = ['date']
 
 class DemandForecastViewSet(viewsets.ModelViewSet):
     queryset = DemandForecast.objects.all()
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loan_funding', '0002_applicationdocument_businessplan_businessplansection_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loanupdate',
+            index=models.Index(fields=['-publish_date', '-id'], name='loan_update_publish_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loanupdate',
+            index=models.Index(fields=['type', '-publish_date', '-id'], name='loan_update_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loanupdate',
+            index=models.Index(fields=['urgency', '-publish_date', '-id'], name='loan_update_urgency_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loanupdate',
+            index=models.Index(fields=['impact', '-publish_date', '-id'], name='loan_update_impact_idx'),
+        ),
+    ]
@@ -296,6 +296,14 @@ class LoanUpdate(models.Model):
     affected_programs = models.JSONField(default=list)  # Array of strings
     action_required = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-publish_date', '-id'], name='loan_update_publish_idx'),
+            models.Index(fields=['type', '-publish_date', '-id'], name='loan_update_type_idx'),
+            models.Index(fields=['urgency', '-publish_date', '-id'], name='loan_update_urgency_idx'),
+            models.Index(fields=['impact', '-publish_date', '-id'], name='loan_update_impact_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from backend_project.serializers import SparseModelSerializer
 from .models import (
     LoanEligibility,
     FundingOption,
@@ -19,22 +20,22 @@ from .models import (
     Watchlist,
 )
 
-class LoanEligibilitySerializer(serializers.ModelSerializer):
+class LoanEligibilitySerializer(SparseModelSerializer):
     class Meta:
         model = LoanEligibility
         fields = '__all__'
 
-class FundingOptionSerializer(serializers.ModelSerializer):
+class FundingOptionSerializer(SparseModelSerializer):
     class Meta:
         model = FundingOption
         fields = '__all__'
 
-class LoanFeeSerializer(serializers.ModelSerializer):
+class LoanFeeSerializer(SparseModelSerializer):
     class Meta:
         model = LoanFee
         fields = '__all__'
 
-class LoanComparisonSerializer(serializers.ModelSerializer):
+class LoanComparisonSerializer(SparseModelSerializer):
     fees = serializers.SerializerMethodField()
 
     class Meta:
@@ -45,17 +46,17 @@ class LoanComparisonSerializer(serializers.ModelSerializer):
         fees = obj.fees.all()
         return LoanFeeSerializer(fees, many=True).data
 
-class ApplicationDocumentSerializer(serializers.ModelSerializer):
+class ApplicationDocumentSerializer(SparseModelSerializer):
     class Meta:
         model = ApplicationDocument
         fields = '__all__'
 
-class BusinessPlanSectionSerializer(serializers.ModelSerializer):
+class BusinessPlanSectionSerializer(SparseModelSerializer):
     class Meta:
         model = BusinessPlanSection
         fields = '__all__'
 
-class BusinessPlanSerializer(serializers.ModelSerializer):
+class BusinessPlanSerializer(SparseModelSerializer):
     sections = serializers.SerializerMethodField()
 
     class Meta:
@@ -66,22 +67,22 @@ class BusinessPlanSerializer(serializers.ModelSerializer):
         sections = obj.sections.all()
         return BusinessPlanSectionSerializer(sections, many=True).data
 
-class FundingTimelineSerializer(serializers.ModelSerializer):
+class FundingTimelineSerializer(SparseModelSerializer):
     class Meta:
         model = FundingTimeline
         fields = '__all__'
 
-class EquityImpactSerializer(serializers.ModelSerializer):
+class EquityImpactSerializer(SparseModelSerializer):
     class Meta:
         model = EquityImpact
         fields = '__all__'
 
-class DebtImpactSerializer(serializers.ModelSerializer):
+class DebtImpactSerializer(SparseModelSerializer):
     class Meta:
         model = DebtImpact
         fields = '__all__'
 
-class FundingStrategySerializer(serializers.ModelSerializer):
+class FundingStrategySerializer(SparseModelSerializer):
     timeline = serializers.SerializerMethodField()
     impact_analysis = serializers.SerializerMethodField()
 
@@ -100,22 +101,22 @@ class FundingStrategySerializer(serializers.ModelSerializer):
             'debt': DebtImpactSerializer(impact['debt']).data if impact['debt'] else None,
         }
 
-class RecentInvestmentSerializer(serializers.ModelSerializer):
+class RecentInvestmentSerializer(SparseModelSerializer):
     class Meta:
         model = RecentInvestment
         fields = '__all__'
 
-class ContactInfoSerializer(serializers.ModelSerializer):
+class ContactInfoSerializer(SparseModelSerializer):
     class Meta:
         model = ContactInfo
         fields = '__all__'
 
-class InvestorPreferencesSerializer(serializers.ModelSerializer):
+class InvestorPreferencesSerializer(SparseModelSerializer):
     class Meta:
         model = InvestorPreferences
         fields = '__all__'
 
-class InvestorMatchSerializer(serializers.ModelSerializer):
+class InvestorMatchSerializer(SparseModelSerializer):
     investment_range = serializers.SerializerMethodField()
     recent_investments = serializers.SerializerMethodField()
     contact_info = serializers.SerializerMethodField()
@@ -140,12 +141,12 @@ class InvestorMatchSerializer(serializers.ModelSerializer):
         prefs = obj.preferences
         return InvestorPreferencesSerializer(prefs).data if prefs else None
 
-class LoanUpdateSerializer(serializers.ModelSerializer):
+class LoanUpdateSerializer(SparseModelSerializer):
     class Meta:
         model = LoanUpdate
         fields = '__all__'
 
-class WatchlistSerializer(serializers.ModelSerializer):
+class WatchlistSerializer(SparseModelSerializer):
     class Meta:
         model = Watchlist
         fields = '__all__'
@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from backend_project.testing import QueryPlanTestMixin
+from .models import BusinessPlan, BusinessPlanSection, LoanUpdate
+
+
+class LoanUpdateFilterTests(QueryPlanTestMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        now = timezone.now()
+        for i, (update_type, urgency) in enumerate([('rate-change', 'high'), ('deadline', 'low'), ('rate-change', 'low')]):
+            LoanUpdate.objects.create(
+                id=f'upd-{i}', type=update_type, title=f'Update {i}', description='', impact='neutral',
+                urgency=urgency, source='SBA', publish_date=now - timedelta(days=i),
+            )
+
+    def test_filter_by_type_uses_index(self):
+        response = self.assertListUsesIndex(reverse('loanupdate-list'), {'type': 'rate-change'}, LoanUpdate)
+        self.assertEqual([item['id'] for item in response.data['results']], ['upd-0', 'upd-2'])
+
+    def test_filter_by_urgency_uses_index(self):
+        response = self.assertListUsesIndex(reverse('loanupdate-list'), {'urgency': 'low'}, LoanUpdate)
+        self.assertEqual(len(response.data['results']), 2)
+
+
+class BusinessPlanProjectionTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        BusinessPlanSection.objects.create(id='sec-1', title='Market', content='x' * 5000, word_count=800)
+
+    def test_section_titles_skip_content(self):
+        response = self.client.get(reverse('businessplansection-list'), {'fields': 'id,title,completed'})
+        self.assertEqual(response.data['results'], [{'id': 'sec-1', 'title': 'Market', 'completed': False}])
+
+    def test_detail_projection(self):
+        response = self.client.get(reverse('businessplansection-detail', args=['sec-1']), {'exclude': 'content'})
+        self.assertNotIn('content', response.data)
+        self.assertEqual(response.data['word_count'], 800)
+
+    def test_unselected_method_fields_are_not_computed(self):
+        BusinessPlan.objects.create(id='plan-1', completion_percentage=40)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('businessplan-list'), {'fields': 'id,completion_percentage'})
+        self.assertEqual(response.data['results'], [{'id': 'plan-1', 'completion_percentage': 40}])
+
+    def test_writes_ignore_projection(self):
+        response = self.client.patch(
+            reverse('businessplansection-detail', args=['sec-1']) + '?fields=id', {'completed': True}, format='json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('content', response.data)
@@ -1,4 +1,5 @@
 from rest_framework import viewsets
+from backend_project.response_cache import CachedResponseMixin
 from .models import (
     LoanEligibility,
     FundingOption,
@@ -42,7 +43,7 @@ class LoanEligibilityViewSet(viewsets.ModelViewSet):
     queryset = LoanEligibility.objects.all()
     serializer_class = LoanEligibilitySerializer
 
-class FundingOptionViewSet(viewsets.ModelViewSet):
+class FundingOptionViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = FundingOption.objects.all()
     serializer_class = FundingOptionSerializer
 
@@ -53,6 +54,7 @@ class LoanFeeViewSet(viewsets.ModelViewSet):
 class LoanComparisonViewSet(viewsets.ModelViewSet):
     queryset = LoanComparison.objects.all()
     serializer_class = LoanComparisonSerializer
+    etag_models = (LoanComparison, LoanFee)
 
 class ApplicationDocumentViewSet(viewsets.ModelViewSet):
     queryset = ApplicationDocument.objects.all()
@@ -65,6 +67,7 @@ class BusinessPlanSectionViewSet(viewsets.ModelViewSet):
 class BusinessPlanViewSet(viewsets.ModelViewSet):
     queryset = BusinessPlan.objects.all()
     serializer_class = BusinessPlanSerializer
+    etag_models = (BusinessPlan, BusinessPlanSection)
 
 class FundingTimelineViewSet(viewsets.ModelViewSet):
     queryset = FundingTimeline.objects.all()
@@ -81,6 +84,7 @@ class DebtImpactViewSet(viewsets.ModelViewSet):
 class FundingStrategyViewSet(viewsets.ModelViewSet):
     queryset = FundingStrategy.objects.all()
     serializer_class = FundingStrategySerializer
+    etag_models = (FundingStrategy, FundingTimeline, EquityImpact, DebtImpact)
 
 class RecentInvestmentViewSet(viewsets.ModelViewSet):
     queryset = RecentInvestment.objects.all()
@@ -97,10 +101,19 @@ class InvestorPreferencesViewSet(viewsets.ModelViewSet):
 class InvestorMatchViewSet(viewsets.ModelViewSet):
     queryset = InvestorMatch.objects.all()
     serializer_class = InvestorMatchSerializer
+    etag_models = (InvestorMatch, RecentInvestment, ContactInfo, InvestorPreferences)
 
 class LoanUpdateViewSet(viewsets.ModelViewSet):
     queryset = LoanUpdate.objects.all()
     serializer_class = LoanUpdateSerializer
+    cursor_ordering = ('-publish_date', '-pk')
+    filter_fields = {
+        'type': ['exact', 'in'],
+        'urgency': ['exact'],
+        'impact': ['exact'],
+        'publish_date': ['gte', 'lte'],
+    }
+    ordering_fields = ['publish_date']
 
 class WatchlistViewSet(viewsets.ModelViewSet):
     queryset = Watchlist.objects.all()
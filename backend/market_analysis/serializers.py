@@ -1,17 +1,17 @@
-from rest_framework import serializers
+from backend_project.serializers import SparseModelSerializer
 from .models import MarketSegment, Competitor, MarketTrend
 
-class MarketSegmentSerializer(serializers.ModelSerializer):
+class MarketSegmentSerializer(SparseModelSerializer):
     class Meta:
         model = MarketSegment
         fields = '__all__'
 
-class CompetitorSerializer(serializers.ModelSerializer):
+class CompetitorSerializer(SparseModelSerializer):
     class Meta:
         model = Competitor
         fields = '__all__'
 
-class MarketTrendSerializer(serializers.ModelSerializer):
+class MarketTrendSerializer(SparseModelSerializer):
     class Meta:
         model = MarketTrend
         fields = '__all__'
@@ -1,3 +1,104 @@
+import threading
+import time
+
+from django.core.cache import caches
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from backend_project.response_cache import ViewResponseCache, response_cache
+from backend_project.table_versions import _bump
+from backend_project.testing import SharedCacheTestMixin
+from .models import MarketSegment
+
+
+class MarketSegmentResponseCacheTests(SharedCacheTestMixin, TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        caches[response_cache.alias].clear()
+        self.client = APIClient()
+        self.url = reverse('marketsegment-list')
+        self.segment = MarketSegment.objects.create(name='SMB', market_size=1e6, growth_rate=4.5)
+
+    def test_repeat_read_is_served_from_cache(self):
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data, first.data)
+        self.assertGreaterEqual(response_cache.stats()['views']['MarketSegmentViewSet']['hits'], 1)
+
+    def test_query_params_are_part_of_the_key(self):
+        self.client.get(self.url)
+        response = self.client.get(self.url, {'fields': 'id,name'})
+        self.assertEqual(list(response.data['results'][0]), ['id', 'name'])
+
+    def test_save_and_delete_invalidate(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.segment.name = 'Mid-market'
+            self.segment.save()
+        self.assertEqual(self.client.get(self.url).data['results'][0]['name'], 'Mid-market')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.segment.delete()
+        self.assertEqual(self.client.get(self.url).data['results'], [])
+
+    def test_missing_object_is_not_cached(self):
+        detail = reverse('marketsegment-detail', args=[self.segment.pk + 1])
+        self.assertEqual(self.client.get(detail).status_code, 404)
+        with self.captureOnCommitCallbacks(execute=True):
+            MarketSegment.objects.create(id=self.segment.pk + 1, name='Enterprise', market_size=5e6, growth_rate=2.0)
+        self.assertEqual(self.client.get(detail).status_code, 200)
+
+    def test_write_through_another_cache_instance_invalidates(self):
+        self.assertEqual(self.client.get(self.url).data['results'][0]['name'], 'SMB')
+        MarketSegment.objects.filter(pk=self.segment.pk).update(name='Mid-market')
+        # Another worker records the write through its own cache connections
+        worker = threading.Thread(target=_bump, args=(MarketSegment,))
+        worker.start()
+        worker.join()
+        self.assertEqual(self.client.get(self.url).data['results'][0]['name'], 'Mid-market')
+
+
+class LocalResponseCacheTests(TestCase):
+    def test_local_memory_cache_disables_response_cache(self):
+        self.assertFalse(response_cache.active)
+        url = reverse('marketsegment-list')
+        APIClient().get(url)
+        MarketSegment.objects.create(name='SMB', market_size=1e6, growth_rate=4.5)
+        self.assertEqual(len(APIClient().get(url).data['results']), 1)
+
+
+class ViewResponseCacheTests(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        self.cache = ViewResponseCache(alias='default', wait_timeout=2.0, poll_interval=0.005)
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return {'value': 1}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.get_or_compute('view', 'key', compute)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'value': 1}] * 5)
+        stats = self.cache.stats()
+        self.assertEqual(stats['stores'], 1)
+        self.assertEqual(stats['coalesced'], 4)
 
-# Create your tests here.
+    def test_uncacheable_result_is_not_stored(self):
+        self.assertIsNone(self.cache.get_or_compute('view', 'key', lambda: None))
+        self.assertEqual(self.cache.get_or_compute('view', 'key', lambda: [1]), [1])
+        self.assertEqual(self.cache.get_or_compute('view', 'key', lambda: [2]), [1])
+        self.assertEqual(self.cache.stats()['views']['view']['hit_ratio'], round(1 / 3, 4))
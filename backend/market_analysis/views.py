@@ -1,8 +1,9 @@
 from rest_framework import viewsets
+from backend_project.response_cache import CachedResponseMixin
 from .models import MarketSegment, Competitor, MarketTrend
 from .serializers import MarketSegmentSerializer, CompetitorSerializer, MarketTrendSerializer
 
-class MarketSegmentViewSet(viewsets.ModelViewSet):
+class MarketSegmentViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = MarketSegment.objects.all()
     serializer_class = MarketSegmentSerializer
 
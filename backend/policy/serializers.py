@@ -1,4 +1,4 @@
-from rest_framework import serializers
+from backend_project.serializers import SparseModelSerializer
 from .models import (
     ExternalPolicy,
     InternalPolicy,
@@ -8,32 +8,32 @@ from .models import (
     StrategyRecommendation,
 )
 
-class ExternalPolicySerializer(serializers.ModelSerializer):
+class ExternalPolicySerializer(SparseModelSerializer):
     class Meta:
         model = ExternalPolicy
         fields = '__all__'
 
-class InternalPolicySerializer(serializers.ModelSerializer):
+class InternalPolicySerializer(SparseModelSerializer):
     class Meta:
         model = InternalPolicy
         fields = '__all__'
 
-class PolicyReportSerializer(serializers.ModelSerializer):
+class PolicyReportSerializer(SparseModelSerializer):
     class Meta:
         model = PolicyReport
         fields = '__all__'
 
-class EconomicIndicatorSerializer(serializers.ModelSerializer):
+class EconomicIndicatorSerializer(SparseModelSerializer):
     class Meta:
         model = EconomicIndicator
         fields = '__all__'
 
-class InternalImpactSerializer(serializers.ModelSerializer):
+class InternalImpactSerializer(SparseModelSerializer):
     class Meta:
         model = InternalImpact
         fields = '__all__'
 
-class StrategyRecommendationSerializer(serializers.ModelSerializer):
+class StrategyRecommendationSerializer(SparseModelSerializer):
     class Meta:
         model = StrategyRecommendation
         fields = '__all__'
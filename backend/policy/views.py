@@ -1,4 +1,5 @@
 from rest_framework import viewsets
+from backend_project.response_cache import CachedResponseMixin
 from .models import (
     ExternalPolicy,
     InternalPolicy,
@@ -16,7 +17,7 @@ from .serializers import (
     StrategyRecommendationSerializer,
 )
 
-class ExternalPolicyViewSet(viewsets.ModelViewSet):
+class ExternalPolicyViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = ExternalPolicy.objects.all()
     serializer_class = ExternalPolicySerializer
 
@@ -1,17 +1,17 @@
-from rest_framework import serializers
+from backend_project.serializers import SparseModelSerializer
 from .models import PriceSetting, PricingRule, PriceForecast
 
-class PriceSettingSerializer(serializers.ModelSerializer):
+class PriceSettingSerializer(SparseModelSerializer):
     class Meta:
         model = PriceSetting
         fields = '__all__'
 
-class PricingRuleSerializer(serializers.ModelSerializer):
+class PricingRuleSerializer(SparseModelSerializer):
     class Meta:
         model = PricingRule
         fields = '__all__'
 
-class PriceForecastSerializer(serializers.ModelSerializer):
+class PriceForecastSerializer(SparseModelSerializer):
     class Meta:
         model = PriceForecast
         fields = '__all__'
@@ -1,4 +1,4 @@
-from rest_framework import serializers
+from backend_project.serializers import SparseModelSerializer
 from .models import (
     RevenueStream,
     RevenueScenario,
@@ -10,44 +10,44 @@ from .models import (
     ChannelPerformance,
 )
 
-class RevenueStreamSerializer(serializers.ModelSerializer):
+class RevenueStreamSerializer(SparseModelSerializer):
     class Meta:
         model = RevenueStream
         fields = '__all__'
 
-class RevenueScenarioSerializer(serializers.ModelSerializer):
+class RevenueScenarioSerializer(SparseModelSerializer):
     class Meta:
         model = RevenueScenario
         fields = '__all__'
 
-class ChurnReasonSerializer(serializers.ModelSerializer):
+class ChurnReasonSerializer(SparseModelSerializer):
     class Meta:
         model = ChurnReason
         fields = '__all__'
 
-class ChurnAnalysisSerializer(serializers.ModelSerializer):
+class ChurnAnalysisSerializer(SparseModelSerializer):
     churn_reasons = ChurnReasonSerializer(many=True, read_only=True)
 
     class Meta:
         model = ChurnAnalysis
         fields = '__all__'
 
-class UpsellOpportunitySerializer(serializers.ModelSerializer):
+class UpsellOpportunitySerializer(SparseModelSerializer):
     class Meta:
         model = UpsellOpportunity
         fields = '__all__'
 
-class RevenueMetricSerializer(serializers.ModelSerializer):
+class RevenueMetricSerializer(SparseModelSerializer):
     class Meta:
         model = RevenueMetric
         fields = '__all__'
 
-class DiscountAnalysisSerializer(serializers.ModelSerializer):
+class DiscountAnalysisSerializer(SparseModelSerializer):
     class Meta:
         model = DiscountAnalysis
         fields = '__all__'
 
-class ChannelPerformanceSerializer(serializers.ModelSerializer):
+class ChannelPerformanceSerializer(SparseModelSerializer):
     class Meta:
         model = ChannelPerformance
         fields = '__all__'
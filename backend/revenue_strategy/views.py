@@ -35,6 +35,7 @@ class ChurnReasonViewSet(viewsets.ModelViewSet):
 class ChurnAnalysisViewSet(viewsets.ModelViewSet):
     queryset = ChurnAnalysis.objects.all()
     serializer_class = ChurnAnalysisSerializer
+    etag_models = (ChurnAnalysis, ChurnReason)
 
 class UpsellOpportunityViewSet(viewsets.ModelViewSet):
     queryset = UpsellOpportunity.objects.all()
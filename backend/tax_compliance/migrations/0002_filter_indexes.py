@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tax_compliance', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='compliancereport',
+            index=models.Index(fields=['report_date', 'id'], name='compliance_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='compliancereport',
+            index=models.Index(fields=['compliance_status', 'report_date', 'id'], name='compliance_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='compliancereport',
+            index=models.Index(fields=['report_type', 'report_date', 'id'], name='compliance_type_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taxrecord',
+            index=models.Index(fields=['due_date', 'id'], name='tax_record_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taxrecord',
+            index=models.Index(fields=['filing_status', 'due_date', 'id'], name='tax_record_status_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taxrecord',
+            index=models.Index(fields=['tax_type', 'due_date', 'id'], name='tax_record_type_due_idx'),
+        ),
+    ]
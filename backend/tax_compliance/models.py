@@ -25,6 +25,13 @@ class TaxRecord(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['due_date', 'id'], name='tax_record_due_idx'),
+            models.Index(fields=['filing_status', 'due_date', 'id'], name='tax_record_status_due_idx'),
+            models.Index(fields=['tax_type', 'due_date', 'id'], name='tax_record_type_due_idx'),
+        ]
+
     def __str__(self):
         return f"{self.tax_type} - {self.amount} ({self.filing_status})"
 
@@ -54,5 +61,12 @@ class ComplianceReport(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['report_date', 'id'], name='compliance_date_idx'),
+            models.Index(fields=['compliance_status', 'report_date', 'id'], name='compliance_status_date_idx'),
+            models.Index(fields=['report_type', 'report_date', 'id'], name='compliance_type_date_idx'),
+        ]
+
     def __str__(self):
         return f"{self.title} - {self.compliance_status}"
@@ -1,12 +1,12 @@
-from rest_framework import serializers
+from backend_project.serializers import SparseModelSerializer
 from .models import TaxRecord, ComplianceReport
 
-class TaxRecordSerializer(serializers.ModelSerializer):
+class TaxRecordSerializer(SparseModelSerializer):
     class Meta:
         model = TaxRecord
         fields = '__all__'
 
-class ComplianceReportSerializer(serializers.ModelSerializer):
+class ComplianceReportSerializer(SparseModelSerializer):
     class Meta:
         model = ComplianceReport
         fields = '__all__'
@@ -1,3 +1,35 @@
+from datetime import date
+
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from backend_project.testing import QueryPlanTestMixin
+from .models import ComplianceReport, TaxRecord
+
+
+class TaxComplianceFilterTests(QueryPlanTestMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        TaxRecord.objects.create(tax_type='VAT', amount=100, due_date=date(2026, 4, 30), filing_status='PENDING')
+        TaxRecord.objects.create(tax_type='INCOME', amount=900, due_date=date(2026, 1, 31), filing_status='PENDING')
+        TaxRecord.objects.create(tax_type='VAT', amount=120, due_date=date(2026, 2, 28), filing_status='FILED')
+        ComplianceReport.objects.create(
+            report_type='AUDIT', title='Annual audit', description='',
+            compliance_status='UNDER_REVIEW', report_date=date(2026, 2, 1),
+        )
+
+    def test_pending_records_by_due_date_use_index(self):
+        params = {'filing_status': 'PENDING', 'ordering': 'due_date'}
+        response = self.assertListUsesIndex(reverse('taxrecord-list'), params, TaxRecord)
+        self.assertEqual([item['tax_type'] for item in response.data['results']], ['INCOME', 'VAT'])
+
+    def test_due_date_range_uses_index(self):
+        params = {'due_date__gte': '2026-02-01', 'due_date__lte': '2026-03-31'}
+        response = self.assertListUsesIndex(reverse('taxrecord-list'), params, TaxRecord)
+        self.assertEqual(len(response.data['results']), 1)
 
-# Create your tests here.
+    def test_compliance_status_filter_uses_index(self):
+        params = {'compliance_status__in': 'UNDER_REVIEW,NON_COMPLIANT'}
+        response = self.assertListUsesIndex(reverse('compliancereport-list'), params, ComplianceReport)
+        self.assertEqual(len(response.data['results']), 1)
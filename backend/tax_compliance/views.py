@@ -21,7 +21,19 @@ def tax_home(request):
 class TaxRecordViewSet(viewsets.ModelViewSet):
     queryset = TaxRecord.objects.all()
     serializer_class = TaxRecordSerializer
+    filter_fields = {
+        'filing_status': ['exact', 'in'],
+        'tax_type': ['exact'],
+        'due_date': ['exact', 'gte', 'lte'],
+    }
+    ordering_fields = ['due_date']
 
 class ComplianceReportViewSet(viewsets.ModelViewSet):
     queryset = ComplianceReport.objects.all()
     serializer_class = ComplianceReportSerializer
+    filter_fields = {
+        'compliance_status': ['exact', 'in'],
+        'report_type': ['exact'],
+        'report_date': ['gte', 'lte'],
+    }
+    ordering_fields = ['report_date']
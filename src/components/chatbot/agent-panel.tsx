@@ -209,7 +209,7 @@ export function AgentPanel({ className }: AgentPanelProps) {
                 <div className="text-2xl font-bold text-green-600">
                   {status.completed_tasks}
                 </div>
-                <div className="text-xs text-muted-foreground">Completed Tasks</div>
+                <div className="text-xs text-muted-foreground">Completed (last hour)</div>
               </div>
             </div>
 
@@ -60,7 +60,17 @@ export function ModuleConversation({
         const data = await response.json();
         const conversations = Array.isArray(data) ? data : data.results || [];
         if (conversations.length > 0) {
-          setConversation(conversations[0]);
+          // The list endpoint returns metadata only; load the latest page of messages
+          const latest = conversations[0];
+          let messages: ConversationMessage[] = [];
+          const messagesResponse = await fetch(
+            `/chatbot/conversations/${latest.id}/messages/`,
+          );
+          if (messagesResponse.ok) {
+            const page = await messagesResponse.json();
+            messages = [...(page.results || [])].reverse();
+          }
+          setConversation({ ...latest, messages });
           return;
         }
       }
@@ -98,8 +108,9 @@ export function ModuleConversation({
         }),
       });
       if (response.ok) {
+        // Conversation endpoints return metadata only; a new one has no messages yet
         const newConversation = await response.json();
-        setConversation(newConversation);
+        setConversation({ ...newConversation, messages: [] });
         return;
       }
     } catch (error) {
@@ -69,6 +69,30 @@ function groupByContext<T extends { context: string }>(
   );
 }
 
+// Rows requested per page; the API caps page_size at API_MAX_PAGE_SIZE (500)
+const PAGE_SIZE = 500;
+
+// List endpoints are cursor-paginated ({ next, previous, results }); follow
+// `next` to the last page so dashboards get every row, not just the first page.
+async function fetchAllPages<T>(
+  url: string,
+  errorMessage: string,
+): Promise<T[]> {
+  const first = new URL(url);
+  first.searchParams.set("page_size", String(PAGE_SIZE));
+  const items: T[] = [];
+  let next: string | null = first.toString();
+  while (next) {
+    const response = await fetch(next);
+    if (!response.ok) throw new Error(errorMessage);
+    const data = await response.json();
+    if (Array.isArray(data)) return items.concat(data);
+    items.push(...(data.results || []));
+    next = data.next || null;
+  }
+  return items;
+}
+
 export function useEconomicData() {
   const [metrics, setMetrics] = useState<Record<string, EconomicMetric[]>>({});
   const [news, setNews] = useState<Record<string, EconomicNews[]>>({});
@@ -105,10 +129,11 @@ export function useEconomicData() {
         const url = context
           ? `${API_BASE_URL}/metrics/?context=${encodeURIComponent(context)}`
           : `${API_BASE_URL}/metrics/`;
-        const response = await fetch(url);
-        if (!response.ok) throw new Error("Failed to fetch economic metrics");
-        const data = await response.json();
-        return groupByContext<EconomicMetric>(data);
+        const items = await fetchAllPages<EconomicMetric>(
+          url,
+          "Failed to fetch economic metrics",
+        );
+        return groupByContext<EconomicMetric>(items);
       } catch {
         return getMockMetricsData();
       }
@@ -124,10 +149,11 @@ export function useEconomicData() {
         const url = context
           ? `${API_BASE_URL}/news/?context=${encodeURIComponent(context)}`
           : `${API_BASE_URL}/news/`;
-        const response = await fetch(url);
-        if (!response.ok) throw new Error("Failed to fetch economic news");
-        const data = await response.json();
-        return groupByContext<EconomicNews>(data);
+        const items = await fetchAllPages<EconomicNews>(
+          url,
+          "Failed to fetch economic news",
+        );
+        return groupByContext<EconomicNews>(items);
       } catch {
         return getMockNewsData();
       }
@@ -143,10 +169,11 @@ export function useEconomicData() {
         const url = context
           ? `${API_BASE_URL}/forecasts/?context=${encodeURIComponent(context)}`
           : `${API_BASE_URL}/forecasts/`;
-        const response = await fetch(url);
-        if (!response.ok) throw new Error("Failed to fetch economic forecasts");
-        const data = await response.json();
-        return groupByContext<EconomicForecast>(data);
+        const items = await fetchAllPages<EconomicForecast>(
+          url,
+          "Failed to fetch economic forecasts",
+        );
+        return groupByContext<EconomicForecast>(items);
       } catch {
         return getMockForecastsData();
       }
@@ -162,10 +189,11 @@ export function useEconomicData() {
         const url = context
           ? `${API_BASE_URL}/events/?context=${encodeURIComponent(context)}`
           : `${API_BASE_URL}/events/`;
-        const response = await fetch(url);
-        if (!response.ok) throw new Error("Failed to fetch economic events");
-        const data = await response.json();
-        return groupByContext<EconomicEvent>(data);
+        const items = await fetchAllPages<EconomicEvent>(
+          url,
+          "Failed to fetch economic events",
+        );
+        return groupByContext<EconomicEvent>(items);
       } catch {
         return getMockEventsData();
       }